@@ -3,6 +3,8 @@ from credmark.cmf.types import Address, Token, BlockNumber
 from credmark.cmf.types.ledger import TokenTransferTable
 from credmark.dto import DTO
 
+from models.utils.price_cache import PRICE_CACHE
+
 class GCInput(DTO):
     sender_address: Address
     receiver_address: Address
@@ -23,6 +25,7 @@ class GCInput(DTO):
 )
 class GeneralizedCashflow(Model):
     def run(self, input: GCInput) -> dict:
+        cache_start = PRICE_CACHE.counters()
         transfers = self.context.ledger.get_erc20_transfers(columns=[
             TokenTransferTable.Columns.BLOCK_NUMBER,
             TokenTransferTable.Columns.VALUE,
@@ -33,8 +36,9 @@ class GeneralizedCashflow(Model):
         for transfer in transfers:
             token = Token(address=transfer['token_address']).info
             try:
-                transfer['price'] = self.context.run_model(
-                    'token.price', input=token, block_number=transfer['block_number'])['price']
+                transfer['price'] = PRICE_CACHE.get_price(
+                    self.context, 'token.price', token,
+                    block_number=transfer['block_number']).price
             except Exception:
                 transfer['price'] = 0
             if transfer['price'] is None:
@@ -43,4 +47,5 @@ class GeneralizedCashflow(Model):
                 float(transfer['value']) / (10 ** token.decimals)
             transfer['block_time'] = str(BlockNumber(transfer['block_number']).timestamp_datetime)
             transfer['token_symbol'] = token.symbol
-        return transfers.dict()
+        return {**transfers.dict(),
+                'price_cache': PRICE_CACHE.run_stats(cache_start).dict()}
@@ -3,6 +3,8 @@ from credmark.cmf.types import Address, Token, BlockNumber
 from credmark.cmf.types.ledger import TokenTransferTable
 from credmark.dto import EmptyInput
 
+from models.utils.price_cache import PRICE_CACHE
+
 
 @Model.describe(
     slug='contrib.neilz-redacted-votium-cashflow',
@@ -14,6 +16,7 @@ from credmark.dto import EmptyInput
 )
 class RedactedVotiumCashflow(Model):
     def run(self, input: None) -> dict:
+        cache_start = PRICE_CACHE.counters()
         votium_claim_address = Address("0x378Ba9B73309bE80BF4C2c027aAD799766a7ED5A")
         redacted_multisig_address = Address("0xA52Fd396891E7A74b641a2Cb1A6999Fcf56B077e")
         transfers = self.context.ledger.get_erc20_transfers(columns=[
@@ -26,8 +29,9 @@ class RedactedVotiumCashflow(Model):
         for transfer in transfers:
             token = Token(address=transfer['token_address']).info
             try:
-                transfer['price'] = self.context.run_model(
-                    'token.price', input=token, block_number=transfer['block_number'])['price']
+                transfer['price'] = PRICE_CACHE.get_price(
+                    self.context, 'token.price', token,
+                    block_number=transfer['block_number']).price
             except Exception:
                 transfer['price'] = 0
             if transfer['price'] is None:
@@ -36,7 +40,8 @@ class RedactedVotiumCashflow(Model):
                 float(transfer['value']) / (10 ** token.decimals)
             transfer['block_time'] = str(BlockNumber(transfer['block_number']).timestamp_datetime)
             transfer['token_symbol'] = token.symbol
-        return transfers.dict()
+        return {**transfers.dict(),
+                'price_cache': PRICE_CACHE.run_stats(cache_start).dict()}
 
 
 @Model.describe(
@@ -49,6 +54,7 @@ class RedactedVotiumCashflow(Model):
 )
 class RedactedConvexCashflow(Model):
     def run(self, input: None) -> dict:
+        cache_start = PRICE_CACHE.counters()
         convex_addresses = [
             Address("0x72a19342e8F1838460eBFCCEf09F6585e32db86E"),
             Address("0xD18140b4B819b895A3dba5442F959fA44994AF50"),
@@ -64,8 +70,9 @@ class RedactedConvexCashflow(Model):
         for transfer in transfers:
             token = Token(address=transfer['token_address'])
             try:
-                transfer['price'] = self.context.run_model(
-                    'token.price', input=token, block_number=transfer['block_number'])['price']
+                transfer['price'] = PRICE_CACHE.get_price(
+                    self.context, 'token.price', token,
+                    block_number=transfer['block_number']).price
             except Exception:
                 transfer['price'] = 0
             if transfer['price'] is None:
@@ -74,4 +81,5 @@ class RedactedConvexCashflow(Model):
                 float(transfer['value']) / (10 ** token.decimals)
             transfer['block_time'] = str(BlockNumber(transfer['block_number']).timestamp_datetime)
             transfer['token_symbol'] = token.symbol
-        return transfers.dict()
+        return {**transfers.dict(),
+                'price_cache': PRICE_CACHE.run_stats(cache_start).dict()}
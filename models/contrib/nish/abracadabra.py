@@ -1,9 +1,13 @@
 from typing import (
     Tuple,
     List,
+    Optional,
 )
 from datetime import datetime, timedelta, timezone, date
-from models.tmp_abi_lookup import ABRACADABRA_CAULDRON_ABI
+from models.utils.abi import get_abi_json, get_contract_factory
+from models.dtos.price import PriceCacheStats
+from models.utils.price_cache import PRICE_CACHE
+from models.utils.token_metadata import get_token_metadata, scale_amount
 from credmark.cmf.model import Model
 from credmark.cmf.types import (
     Address,
@@ -25,13 +29,13 @@ def try_or(func, default=0, expected_exc=(Exception,)):
 
 
 # Get token balance of an address on ethereum chain
-def ethereum_token_balance_of_address(contract_address, account_address):
+def ethereum_token_balance_of_address(context, contract_address, account_address):
     '''
             Get token balance of an address method
             Args::
+                context: Model context
                 contract_address: Ethereum Address of the token contract
                 account_address: Ethereum Address of account whose token balance is to be fetched
-                _apiKey: Etherscan API Key
             Returns::
                 _name: Name of token
                 _balance: Token Balance of Account
@@ -39,12 +43,14 @@ def ethereum_token_balance_of_address(contract_address, account_address):
 
     contract_address = Address(contract_address).checksum
 
-    _contract = Token(address=contract_address)
+    _contract = get_contract_factory(context.web3, 'ERC_20_ABI')(address=contract_address)
 
-    _name = _contract.functions.name().call()
+    # name, symbol and decimals from the token metadata cache
+    _metadata = get_token_metadata(context, [contract_address])[0]
+    _name = _metadata['name']
     _balance = _contract.functions.balanceOf(account_address).call()
-    _decimals = _contract.functions.decimals().call()
-    _symbol = _contract.functions.symbol().call()
+    _decimals = _metadata['decimals']
+    _symbol = _metadata['symbol']
 
     _balance = float(_balance)/pow(10, _decimals)
 
@@ -99,6 +105,7 @@ ethereum_active_markets = {
 class AbracadabraOutput(DTO):
     total_value : float
     balances : dict
+    price_cache : Optional[PriceCacheStats] = None
 
 
 # Fetching Collateral of each market of abracadabra on ethereum chain
@@ -124,25 +131,29 @@ class AbracadabraGetTVL(Model):
             market_address = Address(ethereum_active_markets[key]).checksum
 
             # Contract Instance
-            market_contract = Contract(address=market_address, abi=ABRACADABRA_CAULDRON_ABI)
+            market_contract = Contract(address=market_address,
+                                       abi=get_abi_json('ABRACADABRA_CAULDRON_ABI'))
 
             # Contract address of collateral
             collateral = Address(market_contract.functions.collateral().call()).checksum
-            # decimals
-            decimals = Token(address=collateral).decimals
+            # symbol and decimals from the token metadata cache
+            collateral_meta = get_token_metadata(self.context, [collateral])[0]
+            decimals = collateral_meta['decimals']
+            _symbol = collateral_meta['symbol']
             # Token Price
             _exchange_rate = float(market_contract.functions.exchangeRate().call())
             _price = 1 / _exchange_rate * pow(10,decimals)
 
             collateral_instance = Token(address=collateral)
-            _name, _symbol = collateral_instance.name, collateral_instance.symbol
             # Balance of BENTOBOX
 
-            bento_balance = collateral_instance.scaled(
+            bento_balance = scale_amount(
+                collateral_meta,
                 collateral_instance.functions.balanceOf(BENTOBOX_ADDRESS_ETH).call()
             )
             # Balance OF DEGENBOX
-            degen_balance = collateral_instance.scaled(
+            degen_balance = scale_amount(
+                collateral_meta,
                 collateral_instance.functions.balanceOf(DEGENBOX_ADDRESS_ETH).call()
             )
             # Total Balance
@@ -240,7 +251,8 @@ class AbracadabraGetVaultPortfolio(Model):
         market_address = Address(input.address).checksum
 
         # Contract Instance
-        market_contract = Contract(address=market_address, abi=ABRACADABRA_CAULDRON_ABI)
+        market_contract = Contract(address=market_address,
+                                   abi=get_abi_json('ABRACADABRA_CAULDRON_ABI'))
 
         # Borrow Fee
         borrow_fee = try_or(
@@ -265,8 +277,9 @@ class AbracadabraGetVaultPortfolio(Model):
         # Contract address of collateral
         collateral = Token(
             address = Address(market_contract.functions.collateral().call()).checksum)
-        # Decimals in collateral
-        decimals = collateral.decimals
+        # Symbol and decimals in collateral
+        collateral_meta = get_token_metadata(self.context, [collateral.address])[0]
+        decimals = collateral_meta['decimals']
         # Token Price
         _exchange_rate = float(market_contract.functions.exchangeRate().call())
         exchange_rate = 1 / _exchange_rate * pow(10,decimals)
@@ -281,7 +294,7 @@ class AbracadabraGetVaultPortfolio(Model):
             vault_name = vault_name,
             address = market_address,
             collateral_token = collateral,
-            collateral_symbol = collateral.symbol,
+            collateral_symbol = collateral_meta['symbol'],
             collateral_deposited = collateral_deposited,
             collateral_value = collateral_value,
             exchange_rate = exchange_rate,
@@ -337,10 +350,8 @@ class AbracadabraOverallLiabilities(Model):
         # MIM Token
         mim_token = Token(address= Address("0x99d8a9c45b2eca8864373a26d1459e3dff1e17f3").checksum)
         # MIM Price
-        mim_price  = self.context.run_model(
-                                slug = 'token.price',
-                                input = mim_token
-                            )['price']
+        cache_start = PRICE_CACHE.counters()
+        mim_price = PRICE_CACHE.get_price(self.context, 'token.price', mim_token).price
         # Keys of ethereum_active_markets
         ethereum_active_markets_keys = list(ethereum_active_markets.keys())
 
@@ -350,12 +361,14 @@ class AbracadabraOverallLiabilities(Model):
             market_address = Address(ethereum_active_markets[key]).checksum
 
             # Contract Instance
-            market_contract = Contract(address=market_address, abi=ABRACADABRA_CAULDRON_ABI)
+            market_contract = Contract(address=market_address,
+                                       abi=get_abi_json('ABRACADABRA_CAULDRON_ABI'))
             # Contract address of collateral
             collateral = Token(
                 address = Address(market_contract.functions.collateral().call()).checksum)
-            # Decimals in collateral
-            decimals = collateral.decimals
+            # Symbol and decimals in collateral
+            collateral_meta = get_token_metadata(self.context, [collateral.address])[0]
+            decimals = collateral_meta['decimals']
             # Total Collateral deposited
             collateral_deposited = float(
                 market_contract.functions.totalCollateralShare().call()) / pow(10,decimals)
@@ -367,13 +380,14 @@ class AbracadabraOverallLiabilities(Model):
 
 
             # Updating balances of debts
-            balances.update({ collateral.symbol : [collateral_deposited, price]})
+            balances.update({ collateral_meta['symbol'] : [collateral_deposited, price]})
             # Updating debts
             debt += collateral_value
 
         return AbracadabraOutput(
             balances = balances,
-            total_value = debt * mim_price
+            total_value = debt * mim_price,
+            price_cache = PRICE_CACHE.run_stats(cache_start)
         )
 
 
@@ -398,18 +412,17 @@ class AbracadabraOverallAssets(Model):
         # MIM Token
         mim_token = Token(address= Address("0x99d8a9c45b2eca8864373a26d1459e3dff1e17f3").checksum)
         # MIM Price
-        mim_price  = self.context.run_model(
-                                slug = 'token.price',
-                                input = mim_token
-                            )['price']
-        mim_decimals = float(mim_token.decimals)
+        cache_start = PRICE_CACHE.counters()
+        mim_price = PRICE_CACHE.get_price(self.context, 'token.price', mim_token).price
+        mim_decimals = float(get_token_metadata(self.context, [mim_token.address])[0]['decimals'])
         # Looping through all the ethereum active markets to fetch token balance
         for key in ethereum_active_markets_keys:
             # Contract address of market
             market_address = Address(ethereum_active_markets[key]).checksum
 
             # Contract Instance
-            market_contract = Contract(address=market_address, abi=ABRACADABRA_CAULDRON_ABI)
+            market_contract = Contract(address=market_address,
+                                       abi=get_abi_json('ABRACADABRA_CAULDRON_ABI'))
             # Total MIM Borrowed
             mim_borrowed = float(
                 market_contract.functions.totalBorrow().call()[1]) / pow(10,mim_decimals)
@@ -422,5 +435,6 @@ class AbracadabraOverallAssets(Model):
 
         return AbracadabraOutput(
             balances = balances,
-            total_value = assets
+            total_value = assets,
+            price_cache = PRICE_CACHE.run_stats(cache_start)
         )
@@ -12,6 +12,12 @@ from credmark.dto import (
     DTO
 )
 
+from models.utils.token_metadata import (
+    get_token_metadata,
+    prefetch_token_metadata,
+    scale_amount,
+)
+
 
 # Function to catch naming error while fetching mandatory data
 def try_or(func, default=None, expected_exc=(Exception,)):
@@ -63,15 +69,20 @@ class CurveGetPeggingRatio(Model):
         token2 = try_or(lambda: pool_contract_instance.functions.coins(2).call())
         # If fourth token present
         token3 = try_or(lambda: pool_contract_instance.functions.coins(3).call())
+        prefetch_token_metadata(self.context,
+                                [token for token in (token0, token1, token2, token3)
+                                 if token is not None])
         # Fetching token0 and token1 details
         token0_instance = Token(address=token0)
-        token0_name, token0_symbol = token0_instance.name, token0_instance.symbol
-        token0_balance = token0_instance.scaled(token0_instance.functions.balanceOf(pool).call())
+        token0_meta = get_token_metadata(self.context, [token0_instance.address])[0]
+        token0_name, token0_symbol = token0_meta['name'], token0_meta['symbol']
+        token0_balance = scale_amount(token0_meta, token0_instance.functions.balanceOf(pool).call())
         coin_balances.update({token0_symbol: token0_balance})
 
         token1_instance = Token(address=token1)
-        token1_name, token1_symbol = token1_instance.name, token1_instance.symbol
-        token1_balance = token1_instance.scaled(token1_instance.functions.balanceOf(pool).call())
+        token1_meta = get_token_metadata(self.context, [token1_instance.address])[0]
+        token1_name, token1_symbol = token1_meta['name'], token1_meta['symbol']
+        token1_balance = scale_amount(token1_meta, token1_instance.functions.balanceOf(pool).call())
         coin_balances.update({token1_symbol: token1_balance})
 
         # Pool Name
@@ -89,9 +100,10 @@ class CurveGetPeggingRatio(Model):
             pass
         else:
             token2_instance = Token(address=token2)
-            token2_name, token2_symbol = token2_instance.name, token2_instance.symbol
-            token2_balance = token2_instance.scaled(
-                token2_instance.functions.balanceOf(pool).call()
+            token2_meta = get_token_metadata(self.context, [token2_instance.address])[0]
+            token2_name, token2_symbol = token2_meta['name'], token2_meta['symbol']
+            token2_balance = scale_amount(
+                token2_meta, token2_instance.functions.balanceOf(pool).call()
             )
             # Updating coins
             coin_balances.update({token2_symbol: token2_balance})
@@ -109,9 +121,10 @@ class CurveGetPeggingRatio(Model):
             pass
         else:
             token3_instance = Token(address=token3)
-            token3_name, token3_symbol = token3_instance.name, token3_instance.symbol
-            token3_balance = token3_instance.scaled(
-                token3_instance.functions.balanceOf(pool).call()
+            token3_meta = get_token_metadata(self.context, [token3_instance.address])[0]
+            token3_name, token3_symbol = token3_meta['name'], token3_meta['symbol']
+            token3_balance = scale_amount(
+                token3_meta, token3_instance.functions.balanceOf(pool).call()
             )
             coin_balances.update({token3_symbol: token3_balance})
             # Updating number of tokens present
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta, timezone, date
-from typing import Tuple
+from typing import Optional, Tuple
 from credmark.cmf.model import Model
 from credmark.cmf.types import (
     Address,
@@ -12,8 +12,13 @@ from credmark.dto import (
 )
 
 
-from models.tmp_abi_lookup import (
-    UNISWAP_V3_POOL_ABI,
+from models.utils.abi import get_abi_json
+from models.dtos.price import PriceCacheStats
+from models.utils.price_cache import PRICE_CACHE
+from models.utils.token_metadata import (
+    get_token_metadata,
+    prefetch_token_metadata,
+    scale_amount,
 )
 # Function to catch naming error while fetching mandatory data
 def try_or(func, default=None, expected_exc=(Exception,)):
@@ -30,6 +35,7 @@ class PoolVolumeInfo(Contract):
     prices: dict
     tvl: float
     volume24h: float
+    price_cache: Optional[PriceCacheStats] = None
 
 
 class PoolVolumeInfoHistoricalInput(DTO):
@@ -45,6 +51,7 @@ class PoolVolumeInfoHistoricalInput(DTO):
                 output=PoolVolumeInfo)
 class CurveGetTVLAndVolume(Model):
     def run(self, input: Contract) -> PoolVolumeInfo:
+        cache_start = PRICE_CACHE.counters()
         # Converting to CheckSum Address
         pool = Address(input.address).checksum
         # Pool name
@@ -68,28 +75,27 @@ class CurveGetTVLAndVolume(Model):
         token2 = try_or(lambda: pool_contract_instance.functions.coins(2).call())
         # If fourth token present
         token3 = try_or(lambda: pool_contract_instance.functions.coins(3).call())
+        prefetch_token_metadata(self.context,
+                                [token for token in (token0, token1, token2, token3)
+                                 if token is not None])
 
         # Fetching token0 and token1 details and balance
         token0_instance = Token(address=token0)
-        token0_name, token0_symbol = token0_instance.name, token0_instance.symbol
-        token0_balance = token0_instance.scaled(token0_instance.functions.balanceOf(pool).call())
+        token0_meta = get_token_metadata(self.context, [token0_instance.address])[0]
+        token0_name, token0_symbol = token0_meta['name'], token0_meta['symbol']
+        token0_balance = scale_amount(token0_meta, token0_instance.functions.balanceOf(pool).call())
         coin_balances.update({token0_symbol : token0_balance})
-        token0_price = self.context.run_model(
-                                slug = 'token.price',
-                                input = token0_instance
-                            )
-        tvl += token0_balance * token0_price['price']
-        prices.update({token0_symbol: token0_price['price']})
+        token0_price = PRICE_CACHE.get_price(self.context, 'token.price', token0_instance)
+        tvl += token0_balance * token0_price.price
+        prices.update({token0_symbol: token0_price.price})
         token1_instance = Token(address=token1)
-        token1_name, token1_symbol = token1_instance.name, token1_instance.symbol
-        token1_balance = token1_instance.scaled(token1_instance.functions.balanceOf(pool).call())
+        token1_meta = get_token_metadata(self.context, [token1_instance.address])[0]
+        token1_name, token1_symbol = token1_meta['name'], token1_meta['symbol']
+        token1_balance = scale_amount(token1_meta, token1_instance.functions.balanceOf(pool).call())
         coin_balances.update({token1_symbol : token1_balance})
-        token1_price = self.context.run_model(
-                                slug = 'token.price',
-                                input = token1_instance
-                            )
-        tvl += token1_balance * token1_price['price']
-        prices.update({token1_symbol: token1_price['price']})
+        token1_price = PRICE_CACHE.get_price(self.context, 'token.price', token1_instance)
+        tvl += token1_balance * token1_price.price
+        prices.update({token1_symbol: token1_price.price})
 
         # Pool Name
         pool_name = 'Curve.fi : {}-{}/{}-{}'.format(
@@ -102,8 +108,9 @@ class CurveGetTVLAndVolume(Model):
             pass
         else:
             token2_instance = Token(address=token2)
-            token2_name, token2_symbol = token2_instance.name, token2_instance.symbol
-            token2_balance = token2_instance.scaled(
+            token2_meta = get_token_metadata(self.context, [token2_instance.address])[0]
+            token2_name, token2_symbol = token2_meta['name'], token2_meta['symbol']
+            token2_balance = scale_amount(token2_meta,
                 token2_instance.functions.balanceOf(pool).call()
             )
             # Updating coins
@@ -112,32 +119,27 @@ class CurveGetTVLAndVolume(Model):
             n += 1
             # Updating pool name
             pool_name = pool_name + '/{}-{}'.format(str(token2_name),str(token2_symbol))
-            token2_price = self.context.run_model(
-                                    slug = 'token.price',
-                                    input = token2_instance
-                                    )
-            tvl += token2_balance * token2_price['price']
-            prices.update({token2_symbol : token2_price['price']})
+            token2_price = PRICE_CACHE.get_price(self.context, 'token.price', token2_instance)
+            tvl += token2_balance * token2_price.price
+            prices.update({token2_symbol : token2_price.price})
 
         # Fetching token3 details if present in thee pool
         if token3 is None:
             pass
         else:
             token3_instance = Token(address=token3)
-            token3_name, token3_symbol = token3_instance.name, token3_instance.symbol
-            token3_balance = token3_instance.scaled(
+            token3_meta = get_token_metadata(self.context, [token3_instance.address])[0]
+            token3_name, token3_symbol = token3_meta['name'], token3_meta['symbol']
+            token3_balance = scale_amount(token3_meta,
                 token3_instance.functions.balanceOf(pool).call()
             )
             # Updating number of tokens present
             n += 1
             # Updating pool name
             pool_name = pool_name + '/{}-{}'.format(str(token3_name),str(token3_symbol))
-            token3_price = self.context.run_model(
-                                    slug = 'token.price',
-                                    input = token3_instance
-                                    )
-            tvl += token3_balance * token3_price['price']
-            prices.update({token3_symbol : token3_price['price']})
+            token3_price = PRICE_CACHE.get_price(self.context, 'token.price', token3_instance)
+            tvl += token3_balance * token3_price.price
+            prices.update({token3_symbol : token3_price.price})
 
         # Calculating Volume in 24 Hours
 
@@ -147,7 +149,8 @@ class CurveGetTVLAndVolume(Model):
             coin_balances=coin_balances,
             prices=prices,
             tvl=tvl,
-            volume24h=volume24h
+            volume24h=volume24h,
+            price_cache=PRICE_CACHE.run_stats(cache_start)
         )
 
 
@@ -193,6 +196,7 @@ class CurveGetTVLAndVolumeHistorical(Model):
                 output=PoolVolumeInfo)
 class UniSushiGetTVLAndVolume(Model):
     def run(self, input: Contract) -> PoolVolumeInfo:
+        cache_start = PRICE_CACHE.counters()
         # Converting to CheckSum Address
         pool = Address(input.address).checksum
         # Pool name
@@ -211,34 +215,33 @@ class UniSushiGetTVLAndVolume(Model):
         try:
             pool_contract_instance.abi
         except ModelDataError:
-            pool_contract_instance = Contract(address=pool, abi=UNISWAP_V3_POOL_ABI)
+            pool_contract_instance = Contract(address=pool,
+                                              abi=get_abi_json('UNISWAP_V3_POOL_ABI'))
 
         # fetching token adresses of each asset in pool
         token0 = Token(address=pool_contract_instance.functions.token0().call())
         token1 = Token(address=pool_contract_instance.functions.token1().call())
         # Fetching token0 and token1 details and balance
         token0_instance = Token(address=token0)
-        token0_name, token0_symbol = token0_instance.name, token0_instance.symbol
-        token0_balance = token0_instance.scaled(token0_instance.functions.balanceOf(pool).call())
+        token0_meta = get_token_metadata(self.context, [token0_instance.address])[0]
+        token0_name, token0_symbol = token0_meta['name'], token0_meta['symbol']
+        token0_balance = scale_amount(token0_meta, token0_instance.functions.balanceOf(pool).call())
         coin_balances.update({token0_symbol : token0_balance})
-        token0_price = self.context.run_model(
-                                slug = 'token.price',
-                                input = Token(address=token0.address)
-                            )
-        tvl += token0_balance * token0_price['price']
-        prices.update({token0_symbol : token0_price['price']})
+        token0_price = PRICE_CACHE.get_price(self.context, 'token.price',
+                                              Token(address=token0.address))
+        tvl += token0_balance * token0_price.price
+        prices.update({token0_symbol : token0_price.price})
 
 
         token1_instance = Token(address=token1)
-        token1_name, token1_symbol = token1_instance.name, token1_instance.symbol
-        token1_balance = token1_instance.scaled(token1_instance.functions.balanceOf(pool).call())
+        token1_meta = get_token_metadata(self.context, [token1_instance.address])[0]
+        token1_name, token1_symbol = token1_meta['name'], token1_meta['symbol']
+        token1_balance = scale_amount(token1_meta, token1_instance.functions.balanceOf(pool).call())
         coin_balances.update({token1_symbol : token1_balance})
-        token1_price = self.context.run_model(
-                                slug = 'token.price',
-                                input = Token(address=token1.address)
-                            )
-        tvl += token1_balance * token1_price['price']
-        prices.update({token1_symbol : token1_price['price']})
+        token1_price = PRICE_CACHE.get_price(self.context, 'token.price',
+                                              Token(address=token1.address))
+        tvl += token1_balance * token1_price.price
+        prices.update({token1_symbol : token1_price.price})
 
         # Pool Name
         pool_name = '{}-{}/{}-{}'.format(
@@ -254,7 +257,8 @@ class UniSushiGetTVLAndVolume(Model):
             coin_balances=coin_balances,
             prices=prices,
             tvl=tvl,
-            volume24h=volume24h
+            volume24h=volume24h,
+            price_cache=PRICE_CACHE.run_stats(cache_start)
         )
 
 
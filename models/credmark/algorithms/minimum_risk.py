@@ -7,7 +7,7 @@ from models.credmark.protocols.lending.compound.compound_v2 import CompoundV2Poo
 
 
 @Model.describe(slug="finance.min-risk-rate",
-                version="1.0",
+                version="1.1",
                 display_name="Calculate minimal risk rate",
                 description='Rates from stablecoins\' loans to Aave and Compound, '
                             'then weighted by their debt size and total supply',
@@ -20,7 +20,7 @@ class Minrisk(Model):
     """
 
     def run(self, _) -> dict:
-        aave_debts = self.context.run_model('aave-v2.lending-pool-assets',
+        aave_debts = self.context.run_model('aave-v2.reserves-snapshot',
                                             input=EmptyInput(),
                                             return_type=AaveDebtInfos)
 
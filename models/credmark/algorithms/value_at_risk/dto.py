@@ -1,4 +1,5 @@
-from typing import List
+from datetime import date
+from typing import List, Literal, Optional, Tuple
 
 from credmark.dto import (
     DTO,
@@ -28,6 +29,21 @@ class VaRHistoricalInput(IterableListGenericDTO[PriceList]):
     _iterator: str = PrivateAttr('priceLists')
 
 
+class VaRMonteCarloInput(VaRHistoricalInput):
+    num_scenarios: int = DTOField(100000, gt=1, description='Number of simulated scenarios')
+    seed: int = DTOField(0, description='Seed of the random number generator')
+    chunk_size: int = DTOField(10000, gt=0, description='Number of scenarios generated at once')
+    ewma_lambda: Optional[float] = DTOField(
+        None, gt=0.0, lt=1.0,
+        description='Decay of the EWMA weights of the returns, e.g. 0.94. '
+        'Equal weights if not set.')
+    method: Literal['normal', 'filtered-historical'] = DTOField(
+        'normal',
+        description="'normal' for correlated normal returns, "
+        "'filtered-historical' for resampled returns scaled to "
+        "the current EWMA volatility")
+
+
 class ContractVaRInput(DTO):
     window: str
     interval: int
@@ -54,3 +70,15 @@ class PortfolioVaRInput(ContractVaRInput):
                                            for v in Portfolio.Config.schema_extra['examples']],
                                        limit=10)
         }
+
+
+class RollingVaRInput(PortfolioVaRInput):
+    date_range: Tuple[date, date] = DTOField(
+        description='First and last day (UTC) of the daily VaR series, '
+        'at most the day of the block of the model')
+
+    class Config:
+        schema_extra = {
+            'examples': [{'date_range': ['2022-02-01', '2022-02-10'], **example}
+                         for example in PortfolioVaRInput.Config.schema_extra['examples']]
+        }
@@ -5,53 +5,194 @@ from credmark.cmf.model.errors import (
 import numpy as np
 
 
-def calc_var(ppl, lvl):
-    if lvl < 0 or lvl > 1:
-        raise ModelRunError(f'Invalid confidence level {lvl=}')
+def _order_statistic_positions(lvls, len_ppl_d):
+    """
+    Per level: lower and upper order statistic of the VaR and the weight of the upper one.
+    """
+    last = len_ppl_d - 1
+    lowers, uppers, fracs = [], [], []
+    for lvl in lvls:
+        pos_f = lvl * last
+        if lvl == 0 or np.isclose(pos_f, 0):
+            lower, frac = 0, 0.0
+        elif lvl == 1 or np.isclose(pos_f, last):
+            lower, frac = last, 0.0
+        else:
+            lower = int(np.floor(pos_f))
+            frac = pos_f - lower
+        lowers.append(lower)
+        uppers.append(min(lower + 1, last))
+        fracs.append(frac)
+    return lowers, uppers, fracs
+
+
+def calc_var_es(ppl, lvls):
+    """
+    VaR and Expected Shortfall of the P&L ppl for each confidence level in lvls,
+    from one np.partition of ppl at the order statistics the levels need.
+
+    ppl is either a vector of P&L or a 2-D array with one P&L vector per row,
+    e.g. of many portfolios. Returns (var, es), each with the shape of ppl with
+    its last axis replaced by the levels.
+    """
+    for lvl in lvls:
+        if lvl < 0 or lvl > 1:
+            raise ModelRunError(f'Invalid confidence level {lvl=}')
 
-    len_ppl_d = ppl.shape[0]
+    ppl = np.asarray(ppl, dtype=float)
+    if ppl.ndim not in (1, 2):
+        raise ModelRunError(f'PPL shall be 1-D or 2-D, but it has {ppl.ndim} dimensions')
+
+    len_ppl_d = ppl.shape[-1]
     if len_ppl_d <= 1:
         raise ModelRunError(f'PPL is too short to calculate VaR {ppl=}')
 
-    ppl_d = ppl.copy()
-    ppl_d.sort()
-    if lvl == 0:
-        return ppl_d[0]
-    if lvl == 1:
-        return ppl_d[-1]
+    if len(lvls) == 0:
+        empty = np.zeros(ppl.shape[:-1] + (0,))
+        return empty, empty.copy()
+
+    lowers, uppers, fracs = _order_statistic_positions(lvls, len_ppl_d)
+    last = len_ppl_d - 1
+
+    kth = sorted(set(lowers) | set(uppers))
+    ppl_d = np.partition(ppl, kth, axis=-1)
+    # The first k+1 entries of ppl_d are the k+1 smallest P&L for k in kth
+    ppl_cumsum = np.cumsum(ppl_d, axis=-1)
+
+    lowers = np.array(lowers, dtype=int)
+    uppers = np.array(uppers, dtype=int)
+    fracs = np.array(fracs)
 
-    pos_f = lvl * (len_ppl_d - 1)
-    if np.isclose(pos_f, 0):
-        return ppl_d[0]
-    if np.isclose(pos_f, len_ppl_d - 1):
-        return ppl_d[-1]
-    lower = int(np.floor(pos_f))
-    upper = lower+1
-    res = ppl_d[lower] * (upper - pos_f) + ppl_d[upper] * (pos_f - lower)
-    return res
+    lower_values = ppl_d[..., lowers]
+    upper_values = ppl_d[..., uppers]
+    var = lower_values * (1 - fracs) + upper_values * fracs
+
+    pos_f = lowers + fracs
+    es = (ppl_cumsum[..., lowers] + upper_values * fracs) / (pos_f + 1)
+    for n, lvl in enumerate(lvls):
+        if lvl == 1:
+            es[..., n] = ppl.mean(axis=-1)
+        elif lowers[n] == last:
+            es[..., n] = lower_values[..., n]
+    return var, es
+
+
+def calc_var(ppl, lvl):
+    var, _es = calc_var_es(ppl, [lvl])
+    return var[..., 0][()]
 
 
 def calc_es(ppl, lvl):
-    if lvl < 0 or lvl > 1:
-        raise ModelRunError(f'Invalid confidence level {lvl=}')
+    _var, es = calc_var_es(ppl, [lvl])
+    return es[..., 0][()]
 
-    len_ppl_d = ppl.shape[0]
-    if len_ppl_d <= 1:
-        raise ModelRunError(f'PPL is too short to calculate VaR {ppl=}')
 
-    ppl_d = ppl.copy()
-    ppl_d.sort()
-    if lvl == 0:
-        return ppl_d[0]
-    if lvl == 1:
-        return ppl_d.mean()
-
-    pos_f = lvl * (len_ppl_d - 1)
-    if np.isclose(pos_f, 0):
-        return ppl_d[0]
-    if np.isclose(pos_f, len_ppl_d - 1):
-        return ppl_d[-1]
-    lower = int(np.floor(pos_f))
-    upper = lower + 1
-    es = (ppl_d[:(lower+1)].sum() + ppl_d[upper] * (pos_f - lower)) / (pos_f + 1)
-    return es
+class RollingOrderStatistics:
+    """
+    Order statistics of a moving subset of a fixed array of values, kept in two
+    Fenwick trees over the ranks of the values: the count and the sum of the values
+    in the subset. Adding or removing a value and finding the k-th smallest value
+    or the sum of the k smallest values each take O(log n).
+    """
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=float)
+        order = np.argsort(values, kind='stable')
+        self._sorted_values = values[order]
+        self._ranks = np.empty(len(values), dtype=int)
+        self._ranks[order] = np.arange(len(values))
+        self._size = len(values)
+        self._counts = [0] * (self._size + 1)
+        self._sums = [0.0] * (self._size + 1)
+        self._top_bit = 1 << (self._size.bit_length() - 1) if self._size > 0 else 0
+        self.count = 0
+
+    def _update(self, index, sign):
+        rank = int(self._ranks[index]) + 1
+        value = sign * self._sorted_values[rank - 1]
+        self.count += sign
+        while rank <= self._size:
+            self._counts[rank] += sign
+            self._sums[rank] += value
+            rank += rank & -rank
+
+    def add(self, index):
+        """Add values[index] to the subset"""
+        self._update(index, 1)
+
+    def remove(self, index):
+        """Remove values[index] from the subset"""
+        self._update(index, -1)
+
+    def kth_with_sum(self, k):
+        """k-th smallest (0-based) value in the subset and the sum of the k+1 smallest values"""
+        rank = 0
+        total = 0.0
+        step = self._top_bit
+        while step > 0:
+            nxt = rank + step
+            if nxt <= self._size and self._counts[nxt] <= k:
+                rank = nxt
+                k -= self._counts[nxt]
+                total += self._sums[nxt]
+            step >>= 1
+        value = self._sorted_values[rank]
+        return value, total + value
+
+    def kth(self, k):
+        """k-th smallest (0-based) value in the subset"""
+        return self.kth_with_sum(k)[0]
+
+    def sum_smallest(self, k):
+        """Sum of the k smallest values in the subset"""
+        if k <= 0:
+            return 0.0
+        return self.kth_with_sum(k - 1)[1]
+
+
+def rolling_var_es(ppl, window, lvls):
+    """
+    VaR and Expected Shortfall of each window of `window` consecutive values of ppl,
+    same as calc_var_es(ppl[s:s+window], lvls) for each start s, with the window moved
+    by one value at a time: the newest value is added and the oldest removed.
+    Returns (var, es), each of shape (len(ppl) - window + 1, len(lvls)).
+    """
+    for lvl in lvls:
+        if lvl < 0 or lvl > 1:
+            raise ModelRunError(f'Invalid confidence level {lvl=}')
+
+    ppl = np.asarray(ppl, dtype=float)
+    if window <= 1:
+        raise ModelRunError(f'PPL is too short to calculate VaR {window=}')
+    if window > ppl.shape[0]:
+        raise ModelRunError(f'Window {window} is longer than the PPL ({ppl.shape[0]})')
+
+    lowers, uppers, fracs = _order_statistic_positions(lvls, window)
+    last = window - 1
+
+    n_steps = ppl.shape[0] - window + 1
+    var = np.zeros((n_steps, len(lvls)))
+    es = np.zeros((n_steps, len(lvls)))
+
+    stats = RollingOrderStatistics(ppl)
+    for index in range(window):
+        stats.add(index)
+    window_sum = ppl[:window].sum()
+
+    for step in range(n_steps):
+        if step > 0:
+            stats.remove(step - 1)
+            stats.add(step + window - 1)
+            window_sum += ppl[step + window - 1] - ppl[step - 1]
+
+        for n, (lvl, lower, upper, frac) in enumerate(zip(lvls, lowers, uppers, fracs)):
+            lower_value, lower_sum = stats.kth_with_sum(lower)
+            upper_value = stats.kth(upper) if frac > 0 else lower_value
+            var[step, n] = lower_value * (1 - frac) + upper_value * frac
+            if lvl == 1:
+                es[step, n] = window_sum / window
+            elif lower == last:
+                es[step, n] = lower_value
+            else:
+                es[step, n] = (lower_sum + upper_value * frac) / (lower + frac + 1)
+    return var, es
@@ -1,21 +1,78 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
 from credmark.cmf.model import Model
 from credmark.cmf.model.errors import ModelRunError
 
-from credmark.cmf.types import PriceList, Price
+from credmark.cmf.types import Portfolio, PriceList, Token
 
 
 from models.credmark.algorithms.value_at_risk.dto import (
     VaRHistoricalInput,
+    VaRMonteCarloInput,
     PortfolioVaRInput,
+    RollingVaRInput,
 )
 
-from models.credmark.algorithms.value_at_risk.risk_method import calc_var
+from models.credmark.algorithms.value_at_risk.risk_method import calc_var_es, rolling_var_es
+from models.credmark.tokens.price import price_model_version
+from models.dtos.price import Prices, StoredPricesInput
+from models.utils.historical import (
+    HISTORICAL_CACHE,
+    historical_sample_timestamps,
+    run_model_historical,
+)
+from models.utils.price_store import PRICE_STORE, PriceStore, get_historical_prices
 
 import numpy as np
 
 
+def get_historical_price_lists(context,
+                               price_model: str,
+                               tokens: List[Token],
+                               window: str,
+                               store: PriceStore = PRICE_STORE) -> Tuple[List[PriceList], dict]:
+    """
+    Prices of the tokens at the framework's historical sample blocks of the window, the
+    most recent first, and the error of each token that could not be priced at a block.
+
+    The tokens are priced together at each block by token.price-batch-stored, which reads
+    the local price store and computes the prices missing from it. The new prices are
+    then added to the store, one write per token.
+    """
+    series = run_model_historical(context,
+                                  'token.price-batch-stored',
+                                  cache=HISTORICAL_CACHE,
+                                  window=window,
+                                  model_input=StoredPricesInput(tokens=tokens,
+                                                                price_model=price_model),
+                                  model_return_type=Prices)
+    rows = sorted(series.series, key=lambda row: row.blockNumber)
+    version = price_model_version(price_model)
+
+    price_lists = []
+    failed_assets = {}
+    for n, token in enumerate(tokens):
+        prices = [row.output.prices[n] for row in rows]
+        missing = [row.blockNumber for row, price in zip(rows, prices) if price is None]
+        if len(missing) > 0:
+            failed_assets[token.address] = f'No price of {token.address} at blocks {missing}'
+            continue
+
+        if version is not None:
+            store.put_prices(context.chain_id, price_model, version, token.address,
+                             {row.blockNumber: (row.output.prices[n], row.output.srcs[n])
+                              for row in rows})
+
+        # Reverse the order of data so the recent in the front.
+        price_lists.append(PriceList(prices=prices[::-1],
+                                     tokenAddress=token.address,
+                                     src=rows[-1].output.srcs[n]))
+    return price_lists, failed_assets
+
+
 @Model.describe(slug='finance.var-portfolio-historical',
-                version='1.1',
+                version='1.6',
                 display_name='Value at Risk - for a portfolio',
                 description='Calculate VaR based on input portfolio',
                 input=PortfolioVaRInput,
@@ -24,30 +81,23 @@ class VaRPortfolio(Model):
     def run(self, input: PortfolioVaRInput) -> dict:
         portfolio = input.portfolio
 
-        pl_assets = set()
-        price_lists = []
+        assets = {}
         for position in portfolio:
-            if position.asset.address not in pl_assets:
-                historial_price = self.context.historical.run_model_historical(
-                    model_slug=input.price_model,
-                    model_input=position.asset,
-                    window=input.window,
-                    model_return_type=Price)
-                if len(historial_price.series) > 1:
-                    assert (historial_price.series[0].blockNumber -
-                            historial_price.series[1].blockNumber < 0)
-                # Reverse the order of data so the recent in the front.
-                ps = [p.output.price for p in historial_price if p.output.price is not None][::-1]
-                if len(ps) < len(historial_price.series):
-                    raise ModelRunError(
-                        'Received None output for token price.'
-                        'Check the series '
-                        f'{[(p.output.price,p.blockNumber) for p in historial_price]}')
-                price_list = PriceList(prices=ps,
-                                       tokenAddress=position.asset.address,
-                                       src=list({p.output.src for p in historial_price})[0])
-                price_lists.append(price_list)
-                pl_assets.add(position.asset.address)
+            assets.setdefault(position.asset.address, position.asset)
+
+        price_lists, failed_assets = get_historical_price_lists(self.context,
+                                                                price_model=input.price_model,
+                                                                tokens=list(assets.values()),
+                                                                window=input.window)
+        for address, err in failed_assets.items():
+            self.logger.error(f'Failed to fetch the prices of {address}: {err}')
+
+        if len(price_lists) == 0:
+            raise ModelRunError(f'Failed to fetch the prices of all assets: {failed_assets}')
+
+        if len(failed_assets) > 0:
+            portfolio = Portfolio(positions=[position for position in portfolio
+                                             if position.asset.address not in failed_assets])
 
         var_input = VaRHistoricalInput(
             portfolio=portfolio,
@@ -56,13 +106,72 @@ class VaRPortfolio(Model):
             confidences=input.confidences,
         )
 
-        return self.context.run_model(slug='finance.var-engine-historical',
-                                      input=var_input,
-                                      return_type=dict)
+        output = self.context.run_model(slug='finance.var-engine-historical',
+                                        input=var_input,
+                                        return_type=dict)
+        output['failed_assets'] = failed_assets
+        return output
+
+
+def portfolio_price_matrix(input: VaRHistoricalInput):
+    """
+    Prices of the assets of the portfolio as an (assets x time) matrix, the most recent first,
+    with the value held of each asset, the total value, and the value list of the positions.
+    """
+    price_lists_by_address = {}
+    for pl in input.priceLists:
+        price_lists_by_address.setdefault(pl.tokenAddress, []).append(pl)
+
+    # One row of prices per asset, and the value held of each asset
+    asset_rows = {}
+    asset_prices = []
+    asset_values = []
+    total_value = 0
+    value_list = []
+    n_prices = None
+    for pos in input.portfolio.positions:
+        token = pos.asset
+        amount = pos.amount
+
+        priceLists = price_lists_by_address.get(token.address, [])
+        if len(priceLists) != 1:
+            raise ModelRunError(f'There is no or more than 1 pricelist for {token.address=}')
+
+        row = asset_rows.get(token.address)
+        if row is None:
+            np_priceList = np.array(priceLists[0].prices, dtype=float)
+
+            if input.interval > np_priceList.shape[0]-2:
+                raise ModelRunError(
+                    f'Interval {input.interval} is shall be of at most input list '
+                    f'({np_priceList.shape[0]}-2) long.')
+
+            if n_prices is not None and n_prices != np_priceList.shape[0]:
+                raise ModelRunError(
+                    f'Input priceList for {token.address} has '
+                    f'difference lengths has {np_priceList.shape[0] - input.interval} != '
+                    f'{n_prices - input.interval}')
+            n_prices = np_priceList.shape[0]
+
+            row = len(asset_prices)
+            asset_rows[token.address] = row
+            asset_prices.append(np_priceList)
+            asset_values.append(0.0)
+
+        price = asset_prices[row][0]
+        value = amount * price
+        asset_values[row] += value
+        total_value += value
+        value_list.append((token.address, amount, price, total_value))
+
+    if len(asset_prices) == 0:
+        raise ModelRunError('There is no position in the portfolio to calculate VaR.')
+
+    return np.vstack(asset_prices), np.array(asset_values), total_value, value_list
 
 
 @Model.describe(slug='finance.var-engine-historical',
-                version='1.1',
+                version='1.2',
                 display_name='Value at Risk',
                 description='Value at Risk',
                 input=VaRHistoricalInput,
@@ -75,47 +184,217 @@ class VaREngineHistorical(Model):
     """
 
     def run(self, input: VaRHistoricalInput) -> dict:
-        all_ppl_vec = None
-        total_value = 0
-        value_list = []
-        for pos in input.portfolio.positions:
-            token = pos.asset
-            amount = pos.amount
+        prices, asset_values, total_value, value_list = portfolio_price_matrix(input)
 
-            priceLists = [pl for pl in input.priceLists if pl.tokenAddress == token.address]
+        returns = prices[:, :-input.interval] / prices[:, input.interval:] - 1
+        # ppl: potential profit&loss
+        all_ppl_vec = asset_values @ returns
 
-            if len(priceLists) != 1:
-                raise ModelRunError(f'There is no or more than 1 pricelist for {token.address=}')
+        var, _es = calc_var_es(all_ppl_vec, input.confidences)
+        output = dict(zip(input.confidences, var))
 
-            np_priceList = np.array(priceLists[0].prices)
+        output['total_value'] = total_value
+        output['value_list'] = value_list
+        return output
 
-            if input.interval > np_priceList.shape[0]-2:
-                raise ModelRunError(
-                    f'Interval {input.interval} is shall be of at most input list '
-                    f'({np_priceList.shape[0]}-2) long.')
 
-            value = amount * np_priceList[0]
-            total_value += value
-            value_list.append((token.address, amount, np_priceList[0], total_value))
-            ret_series = np_priceList[:-input.interval] / np_priceList[input.interval:] - 1
+def ewma_weights(n_obs: int, ewma_lambda: Optional[float]) -> np.ndarray:
+    """
+    Weights of n_obs observations, the most recent first, summing to 1:
+    proportional to ewma_lambda ** t, or equal weights when ewma_lambda is None.
+    """
+    if ewma_lambda is None:
+        return np.full(n_obs, 1 / n_obs)
+    weights = ewma_lambda ** np.arange(n_obs)
+    return weights / weights.sum()
+
+
+def covariance_factor(cov: np.ndarray) -> np.ndarray:
+    """
+    Matrix L with L @ L.T == cov. Cholesky factor, or from the eigen decomposition
+    with the negative eigenvalues set to zero when cov is not positive definite,
+    e.g. of assets with identical returns.
+    """
+    try:
+        return np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(cov)
+        return eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+
+
+@Model.describe(slug='finance.var-engine-montecarlo',
+                version='1.0',
+                display_name='Value at Risk - Monte Carlo',
+                description='Value at Risk and Expected Shortfall from simulated returns '
+                'of the assets, by correlated normal returns or filtered historical simulation',
+                input=VaRMonteCarloInput,
+                output=dict)
+class VaREngineMonteCarlo(Model):
+    """
+    Same input as finance.var-engine-historical. The returns over the interval are estimated
+    from the prices in priceLists, sorted in descending order in time, and the P&L of the
+    portfolio is simulated in chunks of chunk_size scenarios, so only one chunk of asset
+    returns is held in memory at a time.
+
+    - normal: returns drawn from the normal distribution with the (EWMA) mean and covariance
+      of the returns.
+    - filtered-historical: past returns standardized by their EWMA volatility at the time,
+      resampled by date to keep the correlation, and scaled to the current volatility.
+    """
+
+    DEFAULT_FHS_LAMBDA = 0.94
+
+    def run(self, input: VaRMonteCarloInput) -> dict:
+        prices, asset_values, total_value, value_list = portfolio_price_matrix(input)
+
+        # returns: (assets x time), the most recent first
+        returns = prices[:, :-input.interval] / prices[:, input.interval:] - 1
+
+        if input.method == 'normal':
+            generate = self.normal_scenarios(returns, input.ewma_lambda)
+        else:
+            generate = self.filtered_historical_scenarios(
+                returns,
+                input.ewma_lambda if input.ewma_lambda is not None else self.DEFAULT_FHS_LAMBDA)
+
+        rng = np.random.default_rng(input.seed)
+        all_ppl_vec = np.empty(input.num_scenarios)
+        for start in range(0, input.num_scenarios, input.chunk_size):
+            n_scenarios = min(input.chunk_size, input.num_scenarios - start)
             # ppl: potential profit&loss
-            ppl_vector = value * ret_series
-            if all_ppl_vec is None:
-                all_ppl_vec = ppl_vector
-            else:
-                ppl_vec_len = ppl_vector.shape[0]
-                all_ppl_vec_len = all_ppl_vec.shape[0]
-                if all_ppl_vec_len != ppl_vec_len:
-                    raise ModelRunError(
-                        f'Input priceList for {token.address} has '
-                        f'difference lengths has {ppl_vec_len} != {all_ppl_vec_len}')
-
-                all_ppl_vec += ppl_vector
-
-        output = {}
-        for conf in input.confidences:
-            output[conf] = calc_var(all_ppl_vec, conf)
+            all_ppl_vec[start:start+n_scenarios] = generate(rng, n_scenarios) @ asset_values
+
+        var, es = calc_var_es(all_ppl_vec, input.confidences)
+        output = dict(zip(input.confidences, var))
 
+        output['expected_shortfall'] = dict(zip(input.confidences, es))
         output['total_value'] = total_value
         output['value_list'] = value_list
         return output
+
+    @staticmethod
+    def normal_scenarios(returns, ewma_lambda):
+        weights = ewma_weights(returns.shape[1], ewma_lambda)
+        mean = returns @ weights
+        demeaned = returns - mean[:, None]
+        cov = (demeaned * weights) @ demeaned.T
+        factor = covariance_factor(cov)
+
+        def _generate(rng, n_scenarios):
+            # (scenarios x assets)
+            return mean + rng.standard_normal((n_scenarios, returns.shape[0])) @ factor.T
+        return _generate
+
+    @staticmethod
+    def filtered_historical_scenarios(returns, ewma_lambda):
+        n_assets, n_returns = returns.shape
+        # EWMA variance in time order, seeded with the sample variance
+        variances = np.empty((n_assets, n_returns))
+        variance = returns.var(axis=1)
+        variance[variance == 0] = 1.0
+        for t in range(n_returns - 1, -1, -1):
+            variances[:, t] = variance
+            variance = ewma_lambda * variance + (1 - ewma_lambda) * returns[:, t] ** 2
+        standardized = returns / np.sqrt(variances)
+        current_vol = np.sqrt(variance)
+
+        def _generate(rng, n_scenarios):
+            dates = rng.integers(0, n_returns, size=n_scenarios)
+            # (scenarios x assets)
+            return standardized[:, dates].T * current_vol
+        return _generate
+
+
+@Model.describe(slug='finance.var-rolling',
+                version='1.1',
+                display_name='Value at Risk - rolling series',
+                description='Daily series of VaR and Expected Shortfall of a portfolio '
+                'over a date range, with a rolling window of historical returns',
+                input=RollingVaRInput,
+                output=dict)
+class VaRRolling(Model):
+    """
+    VaR and ES of the portfolio over the interval, for each day of the date range,
+    from the returns of the window before that day. Each day is sampled at its end
+    (UTC), or at the model's block for the day of the block.
+
+    The prices of the date range and of the window are fetched once. The VaR and ES
+    of a day are the quantiles of the returns of the portfolio holding the input
+    amounts, times the portfolio value on that day. These returns do not depend on
+    the day, so the window moves by one return a day: the newest return is added,
+    the oldest is removed, and the quantiles are kept in an order-statistic tree.
+
+    This is an approximation of finance.var-engine-historical run on each day. The
+    engine weights the returns of the assets by their values on that day, while a
+    return of the portfolio here weights them by their values at the start of the
+    return. The two are equal for a single asset, and close while the weights of
+    the assets move little over the window.
+    """
+
+    def run(self, input: RollingVaRInput) -> dict:
+        d_start, d_end = input.date_range
+        if d_start > d_end:
+            d_start, d_end = d_end, d_start
+
+        model_timestamp = int(self.context.block_number.timestamp)
+        block_date = datetime.fromtimestamp(model_timestamp, tz=timezone.utc).date()
+        if d_end > block_date:
+            raise ModelRunError(f'The date range ends after {block_date}, '
+                                f'the day of the block {self.context.block_number}')
+
+        period_timestamps = [
+            min(int(datetime.combine(d_start + timedelta(days=n),
+                                     datetime.max.time(),
+                                     tzinfo=timezone.utc).timestamp()),
+                model_timestamp)
+            for n in range((d_end - d_start).days + 1)]
+        window_timestamps = historical_sample_timestamps(self.context,
+                                                         input.window,
+                                                         end_timestamp=period_timestamps[0])
+        n_window_returns = len(window_timestamps) - input.interval
+        if n_window_returns <= 1:
+            raise ModelRunError(
+                f'Interval {input.interval} is shall be of at most input list '
+                f'({len(window_timestamps)}-2) long.')
+
+        # ascending, the window of the first day then the other days of the date range
+        sample_timestamps = window_timestamps[:-1] + period_timestamps
+        blocks = HISTORICAL_CACHE.get_blocks(self.context, sample_timestamps)
+        block_numbers = [block_number for block_number, _block_timestamp in blocks]
+
+        amounts = {}
+        tokens = {}
+        for position in input.portfolio:
+            amounts[position.asset.address] = (amounts.get(position.asset.address, 0.0) +
+                                               float(position.amount))
+            tokens.setdefault(position.asset.address, position.asset)
+
+        if len(tokens) == 0:
+            raise ModelRunError('There is no position in the portfolio to calculate VaR.')
+
+        # value of the portfolio at each sample block, ascending
+        values = np.zeros(len(block_numbers))
+        for address, token in tokens.items():
+            prices, _src = get_historical_prices(self.context,
+                                                 input.price_model,
+                                                 token,
+                                                 block_numbers)
+            values += amounts[address] * np.array(prices, dtype=float)
+
+        returns = values[input.interval:] / values[:-input.interval] - 1
+        var, es = rolling_var_es(returns, n_window_returns, input.confidences)
+
+        first = len(window_timestamps) - 1
+        series = []
+        for step, ((block_number, block_timestamp), value) in enumerate(
+                zip(blocks[first:], values[first:])):
+            series.append({
+                'blockNumber': block_number,
+                'blockTimestamp': block_timestamp,
+                'sampleTimestamp': sample_timestamps[first + step],
+                'total_value': value,
+                'var': dict(zip(input.confidences, var[step] * value)),
+                'es': dict(zip(input.confidences, es[step] * value)),
+            })
+
+        return {'series': series}
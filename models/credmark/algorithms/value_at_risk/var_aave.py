@@ -18,7 +18,7 @@ from models.credmark.protocols.lending.aave.aave_v2 import (
 
 
 @Model.describe(slug="finance.var-aave",
-                version="1.1",
+                version="1.2",
                 display_name="Aave V2 VaR",
                 description="Calcualte the VaR of Aave contract of its net asset",
                 input=ContractVaRInput,
@@ -37,7 +37,7 @@ class AaveV2GetVAR(Model):
     """
 
     def run(self, input: ContractVaRInput) -> dict:
-        debts = self.context.run_model('aave-v2.lending-pool-assets',
+        debts = self.context.run_model('aave-v2.reserves-snapshot',
                                        input=EmptyInput(),
                                        return_type=AaveDebtInfos)
 
@@ -9,11 +9,30 @@ from credmark.cmf.model.errors import (
     ModelRunError,
 )
 
-from web3._utils.filters import construct_event_filter_params
-from web3._utils.events import get_event_data
 from urllib3.exceptions import ReadTimeoutError
 from requests.exceptions import ReadTimeout
 
+from models.utils.historical import HISTORICAL_CACHE
+from models.utils.logs import EVENT_INDEX
+from models.utils.multicall import multicall
+from models.utils.price_store import get_historical_prices
+
+
+def get_vesting_events(context, contract: Contract, event_name: str, account=None) -> List[dict]:
+    """
+    Args of the events of a vesting contract up to the context's block, of all accounts
+    or of one account, read from the local event index.
+    """
+    # pylint:disable=locally-disabled,protected-access
+    event_abi = getattr(contract.instance.events, event_name)._get_event_abi()
+    try:
+        events = EVENT_INDEX.get_events(context, event_abi, contract.address.checksum,
+                                        account=account)
+    except (ReadTimeoutError, ReadTimeout):
+        raise ModelRunError(
+            f'There was timeout error when reading logs for {contract.address}')
+    return [dict(event['args']) for event in events]
+
 
 class VestingInfo(DTO):
     account: Account
@@ -57,7 +76,7 @@ class CMKGetVestingContracts(Model):
 
 @describe(
     slug="cmk.get-vesting-accounts",
-    version="1.0",
+    version="1.1",
     input=EmptyInput,
     output=Accounts
 )
@@ -66,93 +85,84 @@ class CMKGetVestingAccounts(Model):
         accounts = set()
         accounts_info = []
         for c in Contracts(**self.context.models.cmk.vesting_contracts()):
-            try:
-                vesting_added_events = c.events.VestingScheduleAdded.createFilter(
-                    fromBlock=0,
-                    toBlock=self.context.block_number
-                ).get_all_entries()
-            except ValueError:
-                # Some Eth node does not support the newer eth_newFilter method
-                try:
-                    # pylint:disable=locally-disabled,protected-access
-                    event_abi = c.instance.events.VestingScheduleAdded._get_event_abi()
-
-                    __data_filter_set, event_filter_params = construct_event_filter_params(
-                        abi_codec=self.context.web3.codec,
-                        event_abi=event_abi,
-                        address=c.address.checksum,
-                        fromBlock=0,
-                        toBlock=self.context.block_number
-                    )
-                    vesting_added_events = self.context.web3.eth.get_logs(event_filter_params)
-                    vesting_added_events = [get_event_data(self.context.web3.codec, event_abi, s)
-                                            for s in vesting_added_events]
-                except (ReadTimeoutError, ReadTimeout):
-                    raise ModelRunError(
-                        f'There was timeout error when reading logs for {c.address}')
+            vesting_added_events = get_vesting_events(self.context, c, 'VestingScheduleAdded')
             for vae in vesting_added_events:
-                if vae['args']['account'] not in accounts:
-                    accounts.add(vae['args']['account'])
-                    accounts_info.append(Account(address=vae['args']['account']))
+                if vae['account'] not in accounts:
+                    accounts.add(vae['account'])
+                    accounts_info.append(Account(address=vae['account']))
 
         return Accounts(accounts=accounts_info)
 
 
 @describe(
     slug="cmk.get-vesting-info-by-account",
-    version="1.0",
+    version="1.2",
     input=Account,
     output=AccountVestingInfo)
 class CMKGetVestingByAccount(Model):
     def run(self, input: Account) -> AccountVestingInfo:
-        vesting_contracts = Contracts(**self.context.models.cmk.vesting_contracts())
+        vesting_contracts = list(Contracts(**self.context.models.cmk.vesting_contracts()))
         result = AccountVestingInfo(account=input, vesting_infos=[], claims=[])
         token = Token(symbol="CMK")
         claims = []
         current_price = Price(**self.context.models.uniswap_v3.get_average_price(
             input={"symbol": "CMK"})).price
-        for vesting_contract in vesting_contracts:
-            if vesting_contract.functions.getElapsedVestingTime(input.address).call() == 0:
+        getters = ['getElapsedVestingTime',
+                   'getVestingMaturationTimestamp',
+                   'getVestedAmount',
+                   'getUnvestedAmount',
+                   'getClaimableAmount']
+        values = multicall(self.context,
+                           [getattr(vesting_contract.functions, getter)(input.address)
+                            for vesting_contract in vesting_contracts
+                            for getter in getters])
+
+        for n, vesting_contract in enumerate(vesting_contracts):
+            (elapsed_vesting_time,
+             vesting_maturation_timestamp,
+             vested_amount,
+             unvested_amount,
+             claimable_amount) = values[n * len(getters):(n + 1) * len(getters)]
+            if elapsed_vesting_time == 0:
                 continue
+            if None in (elapsed_vesting_time, vesting_maturation_timestamp,
+                        vested_amount, unvested_amount, claimable_amount):
+                raise ModelRunError(
+                    f'Failed to read the vesting of {input.address} '
+                    f'from {vesting_contract.address}')
+
             vesting_info = VestingInfo(
                 account=input,
                 vesting_contract=vesting_contract,
                 vesting_start_datetime=str(
                     datetime.fromtimestamp(
-                        self.context.block_number.timestamp -
-                        vesting_contract.functions.getElapsedVestingTime(
-                            input.address).call())),
+                        self.context.block_number.timestamp - elapsed_vesting_time)),
                 vesting_end_datetime=str(
-                    datetime.fromtimestamp(
-                        vesting_contract.functions.getVestingMaturationTimestamp(
-                            input.address).call())),
-                vested_amount=token.scaled(
-                    vesting_contract.functions.getVestedAmount(input.address).call()),
-                unvested_amount=token.scaled(
-                    vesting_contract.functions.getUnvestedAmount(input.address).call()),
-                claimable_amount=token.scaled(
-                    vesting_contract.functions.getClaimableAmount(input.address).call()
-                ),
-                claimed_amount=token.scaled(
-                    vesting_contract.functions.getVestedAmount(input.address).call() -
-                    vesting_contract.functions.getClaimableAmount(input.address).call()
-                ))
+                    datetime.fromtimestamp(vesting_maturation_timestamp)),
+                vested_amount=token.scaled(vested_amount),
+                unvested_amount=token.scaled(unvested_amount),
+                claimable_amount=token.scaled(claimable_amount),
+                claimed_amount=token.scaled(vested_amount - claimable_amount))
             result.vesting_infos.append(vesting_info)
-            claims_all = [
-                dict(d['args']) for d in
-                vesting_contract.events.AllocationClaimed.createFilter(
-                    fromBlock=0, toBlock=self.context.block_number
-                ).get_all_entries()]
-            for c in claims_all:
-                if c['account'] == input.address:
-                    c['amount'] = Token(symbol="CMK").scaled(c['amount'])
-                    c['value_at_claim_time'] = c['amount'] * self.context.run_model(
-                        slug="uniswap-v3.get-average-price",
-                        input={"symbol": "CMK"},
-                        block_number=self.context.block_number.from_timestamp(c['timestamp']),
-                        return_type=Price).price
-                    c['value_now'] = c['amount'] * current_price
-                    claims.append(c)
+            claims.extend(get_vesting_events(self.context,
+                                             vesting_contract,
+                                             'AllocationClaimed',
+                                             account=input.address))
+
+        # Price the claims at their blocks in one lookup of the distinct blocks
+        claim_blocks = [block_number for block_number, _block_timestamp
+                        in HISTORICAL_CACHE.get_blocks(self.context,
+                                                       [c['timestamp'] for c in claims])]
+        price_blocks = sorted(set(claim_blocks))
+        claim_prices, _src = get_historical_prices(self.context,
+                                                   'uniswap-v3.get-average-price',
+                                                   token,
+                                                   price_blocks)
+        price_by_block = dict(zip(price_blocks, claim_prices))
+        for c, claim_block in zip(claims, claim_blocks):
+            c['amount'] = token.scaled(c['amount'])
+            c['value_at_claim_time'] = c['amount'] * price_by_block[claim_block]
+            c['value_now'] = c['amount'] * current_price
         result.claims = claims
 
         return result
@@ -175,36 +185,13 @@ class CMKGetAllVestingBalances(Model):
 
 @describe(
     slug="cmk.vesting-events",
-    version="1.0",
+    version="1.1",
     input=Contract,
     output=dict
 )
 class CMKVestingEvents(Model):
     def run(self, input: Contract) -> dict:
-        try:
-            allocation_claimed_events = input.events.AllocationClaimed.createFilter(
-                fromBlock=0, toBlock=self.context.block_number).get_all_entries()
-        except ValueError:
-            # Some Eth node does not support the newer eth_newFilter method
-            try:
-                # pylint:disable=locally-disabled,protected-access
-                event_abi = input.instance.events.AllocationClaimed._get_event_abi()
-
-                __data_filter_set, event_filter_params = construct_event_filter_params(
-                    abi_codec=self.context.web3.codec,
-                    event_abi=event_abi,
-                    address=input.address.checksum,
-                    fromBlock=0,
-                    toBlock=self.context.block_number
-                )
-                allocation_claimed_events = self.context.web3.eth.get_logs(event_filter_params)
-                allocation_claimed_events = [get_event_data(self.context.web3.codec, event_abi, s)
-                                             for s in allocation_claimed_events]
-            except (ReadTimeoutError, ReadTimeout):
-                raise ModelRunError(
-                    f'There was timeout error when reading logs for {input.address}')
-
-        claims = [dict(d['args']) for d in allocation_claimed_events]
+        claims = get_vesting_events(self.context, input, 'AllocationClaimed')
 
         # cancels = [
         #     dict(d['args']) for d in
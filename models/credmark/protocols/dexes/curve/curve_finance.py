@@ -1,5 +1,9 @@
 # pylint: disable=locally-disabled, unused-import
 
+import os
+import time
+from threading import Lock
+
 import pandas as pd
 from typing import List
 from credmark.cmf.model import Model
@@ -19,6 +23,12 @@ from credmark.cmf.types import (
 
 from web3.exceptions import ABIFunctionNotFound, ContractLogicError
 
+from models.utils.abi import get_contract_factory
+from models.utils.local_store import local_store_root, read_json, write_json
+from models.utils.logs import confirmed_block_number
+from models.utils.multicall import multicall
+from models.utils.token_metadata import get_token_metadata
+
 
 @Model.describe(slug='curve-fi.get-provider',
                 version='1.2',
@@ -99,7 +109,7 @@ class CurveFiPoolInfos(DTO):
 
 
 @Model.describe(slug="curve-fi.pool-info",
-                version="1.4",
+                version="1.5",
                 display_name="Curve Finance Pool Liqudity",
                 description="The amount of Liquidity for Each Token in a Curve Pool",
                 input=Contract,
@@ -109,18 +119,13 @@ class CurveFinancePoolInfo(Model):
         token_list = Tokens()
         symbols_list = []
 
-        for addr in addrs:
-            tok_addr = Address(addr)
-            if tok_addr != Address.null():
-                tok = Token(address=tok_addr.checksum)
-                token_list.append(tok)
-                try:
-                    symbols_list.append(tok.symbol)
-                except ModelDataError:
-                    if tok.address == '0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee':
-                        symbols_list.append('eeeETH')
-                    else:
-                        raise
+        tok_addrs = [Address(addr) for addr in addrs if Address(addr) != Address.null()]
+        tok_metadata = get_token_metadata(self.context, tok_addrs, require_decimals=False)
+        for tok_addr, metadata in zip(tok_addrs, tok_metadata):
+            token_list.append(Token(address=tok_addr.checksum))
+            if metadata['symbol'] is None:
+                raise ModelDataError(f'No symbol for token {tok_addr}')
+            symbols_list.append(metadata['symbol'])
         return token_list, symbols_list
 
     def run(self, input: Contract) -> CurveFiPoolInfo:
@@ -166,7 +171,8 @@ class CurveFinancePoolInfo(Model):
                     tok_addr = Address(input.functions.coins(i).call())
                     token = Token(address=tok_addr)
                     tokens.append(token)
-                    tokens_symbol.append(token.symbol)
+                    tokens_symbol.append(get_token_metadata(
+                        self.context, [tok_addr], require_decimals=False)[0]['symbol'])
                     balances.append(input.functions.balances(i).call())
                     try:
                         und = input.functions.underlying_coins(i).call()
@@ -195,8 +201,8 @@ class CurveFinancePoolInfo(Model):
         lp_token_name = ''
         try:
             lp_token_addr = Address(input.functions.lp_token().call())
-            lp_token = Token(address=lp_token_addr.checksum)
-            lp_token_name = lp_token.name
+            lp_token_name = get_token_metadata(
+                self.context, [lp_token_addr], require_decimals=False)[0]['name']
         except ABIFunctionNotFound:
             try:
                 provider = self.context.run_model('curve-fi.get-provider',
@@ -207,8 +213,8 @@ class CurveFinancePoolInfo(Model):
                 pool_info = (pool_info_contract.functions.get_pool_info(input.address.checksum)
                              .call())
                 lp_token_addr = Address(pool_info[5])
-                lp_token = Token(address=lp_token_addr.checksum)
-                lp_token_name = lp_token.name
+                lp_token_name = get_token_metadata(
+                    self.context, [lp_token_addr], require_decimals=False)[0]['name']
             except ContractLogicError:
                 pass
 
@@ -216,8 +222,8 @@ class CurveFinancePoolInfo(Model):
         pool_token_name = ''
         try:
             pool_token_addr = Address(input.functions.token().call())
-            pool_token = Token(address=pool_token_addr.checksum)
-            pool_token_name = pool_token.name
+            pool_token_name = get_token_metadata(
+                self.context, [pool_token_addr], require_decimals=False)[0]['name']
         except ABIFunctionNotFound:
             pass
 
@@ -258,6 +264,172 @@ class CurveFinanceTotalTokenLiqudity(Model):
         return all_pools_info
 
 
+class CurveFiPoolInfosColumns(DTO):
+    """
+    Columnar form of CurveFiPoolInfos, one list per field with one entry per pool.
+    """
+    addresses: List[Address]
+    virtualPrice: List[int]
+    tokens: List[List[Address]]
+    tokens_symbol: List[List[str]]
+    balances: List[List[int]]
+    underlying_tokens: List[List[Address]]
+    underlying_tokens_symbol: List[List[str]]
+    A: List[int]
+    is_meta: List[bool]
+    name: List[str]
+    lp_token_name: List[str]
+    lp_token_addr: List[Address]
+    pool_token_name: List[str]
+    pool_token_addr: List[Address]
+
+    def to_pool_infos(self) -> CurveFiPoolInfos:
+        return CurveFiPoolInfos(pool_infos=[
+            CurveFiPoolInfo(
+                address=self.addresses[n],
+                virtualPrice=self.virtualPrice[n],
+                tokens=Tokens(tokens=[Token(address=addr) for addr in self.tokens[n]]),
+                tokens_symbol=self.tokens_symbol[n],
+                balances=self.balances[n],
+                underlying_tokens=Tokens(tokens=[Token(address=addr)
+                                                 for addr in self.underlying_tokens[n]]),
+                underlying_tokens_symbol=self.underlying_tokens_symbol[n],
+                A=self.A[n],
+                is_meta=self.is_meta[n],
+                name=self.name[n],
+                lp_token_name=self.lp_token_name[n],
+                lp_token_addr=self.lp_token_addr[n],
+                pool_token_name=self.pool_token_name[n],
+                pool_token_addr=self.pool_token_addr[n])
+            for n in range(len(self.addresses))])
+
+
+@ Model.describe(slug="curve-fi.all-pools-info-fast",
+                 version="1.0",
+                 display_name="Curve Finance Pool Liqudity - All (multicall)",
+                 description="The amount of Liquidity for Each Token in a Curve Pool - All, "
+                 "read in multicall batches",
+                 output=CurveFiPoolInfosColumns)
+class CurveFinanceAllPoolsInfoFast(Model):
+    """
+    Same information as curve-fi.all-pools-info for the pools of the registry, with the pool
+    list, coins, balances, A, virtual price and LP/pool tokens of all pools read in a few
+    multicalls, and the token symbols and names from the shared token metadata cache.
+
+    A pool whose balances cannot be read from the registry falls back to curve-fi.pool-info.
+    """
+
+    REGISTRY_VIEWS = ['get_balances', 'get_coins', 'get_underlying_coins', 'is_meta',
+                      'get_lp_token']
+    POOL_VIEWS = ['A', 'get_virtual_price', 'name', 'lp_token', 'token']
+
+    def run(self, input) -> CurveFiPoolInfosColumns:
+        registry_contract = self.context.run_model('curve-fi.get-registry',
+                                                   input=EmptyInput(),
+                                                   return_type=Contract)
+        registry = get_contract_factory(self.context.web3, 'CURVE_REGISTRY_ABI')(
+            address=registry_contract.address.checksum)
+
+        total_pools = registry.functions.pool_count().call()
+        pool_addrs = [Address(addr) for addr in
+                      multicall(self.context,
+                                [registry.functions.pool_list(i) for i in range(total_pools)])]
+
+        pool_factory = get_contract_factory(self.context.web3, 'CURVE_POOL_VIEWS_ABI')
+        funcs = []
+        for pool_addr in pool_addrs:
+            funcs.extend(getattr(registry.functions, view)(pool_addr.checksum)
+                         for view in self.REGISTRY_VIEWS)
+            pool = pool_factory(address=pool_addr.checksum)
+            funcs.extend(getattr(pool.functions, view)() for view in self.POOL_VIEWS)
+        n_views = len(self.REGISTRY_VIEWS) + len(self.POOL_VIEWS)
+        values = multicall(self.context, funcs)
+
+        reads = []
+        fallbacks = {}
+        for n, pool_addr in enumerate(pool_addrs):
+            read = dict(zip(self.REGISTRY_VIEWS + self.POOL_VIEWS,
+                            values[n * n_views:(n + 1) * n_views]))
+            if read['get_balances'] is None or read['get_coins'] is None:
+                fallbacks[n] = CurveFiPoolInfo(
+                    **self.context.models.curve_fi.pool_info(Contract(address=pool_addr)))
+            reads.append(read)
+
+        def _non_null(addrs):
+            return [Address(addr) for addr in (addrs or []) if Address(addr) != Address.null()]
+
+        metadata_addrs = []
+        for n, read in enumerate(reads):
+            if n in fallbacks:
+                continue
+            read['tokens'] = _non_null(read['get_coins'])
+            read['underlying_tokens'] = _non_null(read['get_underlying_coins'])
+            lp_token = read['lp_token'] if read['lp_token'] is not None else read['get_lp_token']
+            read['lp_token_addr'] = Address(lp_token) if lp_token is not None else Address.null()
+            read['pool_token_addr'] = (Address(read['token']) if read['token'] is not None
+                                       else Address.null())
+            metadata_addrs.extend(read['tokens'] + read['underlying_tokens'] +
+                                  _non_null([read['lp_token_addr'], read['pool_token_addr']]))
+
+        metadata = dict(zip(metadata_addrs,
+                            get_token_metadata(self.context, metadata_addrs,
+                                               require_decimals=False)))
+
+        def _symbols(addrs):
+            symbols = [metadata[addr]['symbol'] for addr in addrs]
+            for addr, symbol in zip(addrs, symbols):
+                if symbol is None:
+                    raise ModelDataError(f'No symbol for token {addr}')
+            return symbols
+
+        def _name(addr):
+            if addr == Address.null():
+                return ''
+            return metadata[addr]['name'] or ''
+
+        columns = {field: [] for field in CurveFiPoolInfosColumns.__fields__}
+        for n, (pool_addr, read) in enumerate(zip(pool_addrs, reads)):
+            if n in fallbacks:
+                info = fallbacks[n]
+                row = {'addresses': info.address,
+                       'virtualPrice': info.virtualPrice,
+                       'tokens': [tok.address for tok in info.tokens],
+                       'tokens_symbol': info.tokens_symbol,
+                       'balances': info.balances,
+                       'underlying_tokens': [tok.address for tok in info.underlying_tokens],
+                       'underlying_tokens_symbol': info.underlying_tokens_symbol,
+                       'A': info.A,
+                       'is_meta': info.is_meta,
+                       'name': info.name,
+                       'lp_token_name': info.lp_token_name,
+                       'lp_token_addr': info.lp_token_addr,
+                       'pool_token_name': info.pool_token_name,
+                       'pool_token_addr': info.pool_token_addr}
+            else:
+                if read['A'] is None or read['get_virtual_price'] is None:
+                    a, virtual_price = 0, 10**18
+                else:
+                    a, virtual_price = read['A'], read['get_virtual_price']
+                row = {'addresses': pool_addr,
+                       'virtualPrice': virtual_price,
+                       'tokens': read['tokens'],
+                       'tokens_symbol': _symbols(read['tokens']),
+                       'balances': read['get_balances'][:len(read['tokens'])],
+                       'underlying_tokens': read['underlying_tokens'],
+                       'underlying_tokens_symbol': _symbols(read['underlying_tokens']),
+                       'A': a,
+                       'is_meta': bool(read['is_meta']),
+                       'name': read['name'] if read['name'] is not None else '',
+                       'lp_token_name': _name(read['lp_token_addr']),
+                       'lp_token_addr': read['lp_token_addr'],
+                       'pool_token_name': _name(read['pool_token_addr']),
+                       'pool_token_addr': read['pool_token_addr']}
+            for field, value in row.items():
+                columns[field].append(value)
+
+        return CurveFiPoolInfosColumns(**columns)
+
+
 @ Model.describe(slug="curve-fi.all-gauges",
                  version='1.2',
                  display_name="Curve Finance Gauge List",
@@ -279,27 +451,99 @@ class CurveFinanceAllGauges(Model):
         return Contracts(contracts=gauges)
 
 
+# Addresses of a gauge by the block of their first transaction, by file in the local store
+GAUGE_ADDRESSES = {}
+GAUGE_ADDRESSES_LOCK = Lock()
+
+
 @ Model.describe(slug='curve-fi.all-gauge-claim-addresses',
-                 version='1.2',
+                 version='1.4',
                  input=Contract,
                  output=Accounts)
 class CurveFinanceAllGaugeAddresses(Model):
+    """
+    Distinct addresses which sent a transaction to the gauge up to the block,
+    in the order of their first transaction.
+
+    The addresses with the block of their first transaction are kept in the local
+    store per gauge, and only the addresses first seen after the last stored block
+    are queried, grouped by address in the ledger. Only the blocks both confirmed and
+    indexed by the ledger are stored, later blocks are queried again on each request.
+    """
+
+    def ledger_block_number(self, from_block: int, block_number: int) -> int:
+        """
+        Last block in (from_block, block_number] with a transaction in the ledger,
+        from_block if there is none
+        """
+        ledger = self.context.ledger
+        max_block_column = 'max_block'
+        rows = ledger.get_transactions(
+            columns=[],
+            aggregates=[ledger.Aggregate(
+                f'MAX({TransactionTable.Columns.BLOCK_NUMBER})', max_block_column)],
+            where=(f'{TransactionTable.Columns.BLOCK_NUMBER} > {from_block} '
+                   f'and {TransactionTable.Columns.BLOCK_NUMBER} <= {block_number}'))
+        for row in rows:
+            if row[max_block_column] is not None:
+                return int(row[max_block_column])
+        return from_block
 
     def run(self, input: Contract) -> Accounts:
-        addrs = self.context.ledger.get_transactions(
-            columns=[TransactionTable.Columns.FROM_ADDRESS],
-            where=f'{TransactionTable.Columns.TO_ADDRESS}=\'{input.address.lower()}\'')
-        return Accounts(accounts=[
-            Account(address=address)
-            for address in
-            list(dict.fromkeys([
-                a[TransactionTable.Columns.FROM_ADDRESS]
-                for a
-                in addrs]))])
+        block_number = int(self.context.block_number)
+        path = os.path.join(local_store_root(), 'curve_gauge_addresses',
+                            str(self.context.chain_id), f'{input.address.lower()}.json')
+
+        with GAUGE_ADDRESSES_LOCK:
+            index = GAUGE_ADDRESSES.get(path)
+            if index is None or index['to_block'] < block_number:
+                # Another process may have extended the file
+                stored = read_json(path)
+                if stored is not None and (index is None or stored['to_block'] > index['to_block']):
+                    index = stored
+            if index is None:
+                index = {'to_block': -1, 'first_blocks': {}}
+
+            first_blocks = index['first_blocks']
+            if index['to_block'] < block_number:
+                ledger = self.context.ledger
+                first_block_column = 'first_block'
+                rows = ledger.get_transactions(
+                    columns=[TransactionTable.Columns.FROM_ADDRESS],
+                    aggregates=[ledger.Aggregate(
+                        f'MIN({TransactionTable.Columns.BLOCK_NUMBER})', first_block_column)],
+                    where=(f'{TransactionTable.Columns.TO_ADDRESS}=\'{input.address.lower()}\' '
+                           f'and {TransactionTable.Columns.BLOCK_NUMBER} > {index["to_block"]} '
+                           f'and {TransactionTable.Columns.BLOCK_NUMBER} <= {block_number}'),
+                    group_by=TransactionTable.Columns.FROM_ADDRESS)
+
+                first_blocks = dict(index['first_blocks'])
+                for row in rows:
+                    address = row[TransactionTable.Columns.FROM_ADDRESS]
+                    if address not in first_blocks:
+                        first_blocks[address] = int(row[first_block_column])
+
+                # Blocks near the head may be reorganized or not in the ledger yet
+                stored_to = min(block_number,
+                                confirmed_block_number(self.context),
+                                self.ledger_block_number(index['to_block'], block_number))
+                if stored_to > index['to_block']:
+                    index = {'to_block': stored_to,
+                             'first_blocks': {address: first_block
+                                              for address, first_block in first_blocks.items()
+                                              if first_block <= stored_to}}
+                    write_json(index, path)
+
+            GAUGE_ADDRESSES[path] = index
+
+        addresses = sorted((first_block, address)
+                           for address, first_block in first_blocks.items()
+                           if first_block <= block_number)
+        return Accounts(accounts=[Account(address=address) for _, address in addresses])
 
 
 @ Model.describe(slug='curve-fi.get-gauge-stake-and-claimable-rewards',
-                 version='1.2',
+                 version='1.3',
                  input=Contract,
                  output=dict)
 class CurveFinanceGaugeRewardsCRV(Model):
@@ -311,10 +555,17 @@ class CurveFinanceGaugeRewardsCRV(Model):
             if not addr.address:
                 raise ModelRunError(f'Input is invalid, {input}')
 
-            claimable_tokens = input.functions.claimable_tokens(addr.address.checksum).call()
-            balanceOf = input.functions.balanceOf(addr.address.checksum).call()
-            working_balances = input.functions.working_balances(addr.address.checksum).call()
-
+        values = multicall(self.context,
+                           [func(addr.address.checksum)
+                            for addr in all_addrs.accounts
+                            for func in (input.functions.claimable_tokens,
+                                         input.functions.balanceOf,
+                                         input.functions.working_balances)])
+        if None in values:
+            raise ModelRunError(f'Failed to read the stakes of the gauge {input.address}')
+
+        for n, addr in enumerate(all_addrs.accounts):
+            claimable_tokens, balanceOf, working_balances = values[3 * n:3 * (n + 1)]
             yields.append({
                 "claimable_tokens": claimable_tokens,
                 "balanceOf": balanceOf,
@@ -325,7 +576,7 @@ class CurveFinanceGaugeRewardsCRV(Model):
 
 
 @ Model.describe(slug='curve-fi.gauge-yield',
-                 version='1.2',
+                 version='1.5',
                  input=Contract,
                  output=dict)
 class CurveFinanceAverageGaugeYield(Model):
@@ -355,36 +606,35 @@ class CurveFinanceAverageGaugeYield(Model):
             interval='7 days',
             model_input=input)
 
-        yields = []
-        for idx in range(0, len(res.series) - 1):
-            for y1 in res.series[idx].output['yields']:
-                if y1['working_balances'] == 0:
-                    continue
-                if y1['balanceOf'] == 0:
-                    continue
-                if y1['claimable_tokens'] == 0:
-                    continue
-                for y2 in res.series[idx + 1].output['yields']:
-                    if y1['address'] == y2['address']:
-                        if y2['working_balances'] == 0:
-                            continue
-                        if y2['balanceOf'] == 0:
-                            continue
-                        if y2['claimable_tokens'] == 0:
-                            continue
-                        if y1['balanceOf'] == y2['balanceOf']:
-                            y2_rewards_value = y2["claimable_tokens"] * self.CRV_PRICE / (10**18)
-                            y1_rewards_value = y1["claimable_tokens"] * self.CRV_PRICE / (10**18)
-                            virtual_price = pool_virtual_price / (10**18) / (10**18)
-                            y2_liquidity_value = y2["balanceOf"] * virtual_price
-                            y1_liquidity_value = y1["balanceOf"] * virtual_price
-                            new_portfolio_value = y2_rewards_value + y2_liquidity_value
-                            old_portfolio_value = y1_rewards_value + y1_liquidity_value
-                            if old_portfolio_value > new_portfolio_value:
-                                break
-                            yields.append(
-                                (new_portfolio_value - old_portfolio_value) / old_portfolio_value)
-                            break
+        columns = ['claimable_tokens', 'balanceOf', 'working_balances', 'address']
+        snapshots = pd.DataFrame(
+            [(idx, row, *[y[c] for c in columns])
+             for idx, snapshot in enumerate(res.series)
+             for row, y in enumerate(snapshot.output['yields'])],
+            columns=['idx', 'row', *columns])
+        # Stakes with working balance, balance and claimable rewards
+        snapshots = snapshots[(snapshots.working_balances != 0) &
+                              (snapshots.balanceOf != 0) &
+                              (snapshots.claimable_tokens != 0)]
+
+        # Match each stake y1 with the first stake y2 of the same address and the same balance
+        # in the next snapshot
+        y1s = snapshots[snapshots.idx < len(res.series) - 1]
+        y2s = snapshots.assign(idx=snapshots.idx - 1)
+        matched = (y1s.merge(y2s, on=['idx', 'address', 'balanceOf'], suffixes=('_1', '_2'))
+                   .sort_values(['idx', 'row_1', 'row_2'], kind='stable')
+                   .drop_duplicates(subset=['idx', 'row_1'], keep='first'))
+
+        virtual_price = pool_virtual_price / (10**18) / (10**18)
+        liquidity_value = matched.balanceOf.astype(float) * virtual_price
+        y2_rewards_value = matched.claimable_tokens_2.astype(float) * self.CRV_PRICE / (10**18)
+        y1_rewards_value = matched.claimable_tokens_1.astype(float) * self.CRV_PRICE / (10**18)
+        new_portfolio_value = y2_rewards_value + liquidity_value
+        old_portfolio_value = y1_rewards_value + liquidity_value
+        gains = old_portfolio_value <= new_portfolio_value
+        yields = ((new_portfolio_value[gains] - old_portfolio_value[gains]) /
+                  old_portfolio_value[gains]).tolist()
+
         if len(yields) == 0:
             return {}
         avg_yield = sum(yields) / len(yields) * (365 * 86400) / (10 * 86400)
@@ -392,7 +642,7 @@ class CurveFinanceAverageGaugeYield(Model):
 
 
 @ Model.describe(slug='curve-fi.all-yield',
-                 version='1.2',
+                 version='1.5',
                  description="Yield from all Gauges",
                  input=EmptyInput,
                  output=dict)
@@ -402,12 +652,23 @@ class CurveFinanceAllYield(Model):
                                                  input=EmptyInput(),
                                                  return_type=Contracts)
 
-        self.logger.info(f'There are {len(gauge_contracts.contracts)} gauges.')
+        n_gauges = len(gauge_contracts.contracts)
+        self.logger.info(f'There are {n_gauges} gauges.')
 
-        res = []
-        for gauge in gauge_contracts.contracts:
+        results = []
+        timings = []
+        all_start_time = time.perf_counter()
+        for n_done, gauge in enumerate(gauge_contracts.contracts, start=1):
+            start_time = time.perf_counter()
             yields = self.context.run_model('curve-fi.gauge-yield', gauge)
-            self.logger.info(yields)
-            res.append(yields)
+            seconds = time.perf_counter() - start_time
+            self.logger.info(f'{n_done}/{n_gauges} {gauge.address} in {seconds:.1f}s: {yields}')
+            results.append(yields)
+            timings.append({"address": gauge.address, "seconds": seconds})
+
+        total_seconds = time.perf_counter() - all_start_time
+        self.logger.info(f'{n_gauges} gauges in {total_seconds:.1f}s')
 
-        return {"results": res}
+        return {"results": results,
+                "timings": timings,
+                "total_seconds": total_seconds}
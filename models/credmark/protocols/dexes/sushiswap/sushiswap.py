@@ -18,7 +18,8 @@ from models.credmark.protocols.dexes.uniswap.uniswap_v2 import (
 )
 from models.dtos.price import PoolPriceInfos
 
-from models.tmp_abi_lookup import UNISWAP_V2_POOL_ABI
+from models.utils.abi import get_abi_json
+from models.utils.token_metadata import get_token_metadata, scale_amount
 
 
 @Model.describe(slug="sushiswap.get-v2-factory",
@@ -112,24 +113,29 @@ class SushiswapGetPair(Model):
 class SushiswapGetPairDetails(Model):
     def run(self, input: Contract) -> dict:
         contract = input
-        contract._meta.abi = UNISWAP_V2_POOL_ABI  # pylint:disable=protected-access
+        contract._meta.abi = get_abi_json('UNISWAP_V2_POOL_ABI')  # pylint:disable=protected-access
         token0 = Token(address=contract.functions.token0().call())
         token1 = Token(address=contract.functions.token1().call())
         getReserves = contract.functions.getReserves().call()
 
-        token0_balance = token0.scaled(token0.functions.balanceOf(input.address).call())
-        token1_balance = token1.scaled(token1.functions.balanceOf(input.address).call())
+        token0_meta, token1_meta = get_token_metadata(self.context,
+                                                      [token0.address, token1.address])
 
-        _token0_name = token0.name
-        _token0_symbol = token0.symbol
-        _token0_decimals = token0.decimals
+        token0_balance = scale_amount(token0_meta,
+                                      token0.functions.balanceOf(input.address).call())
+        token1_balance = scale_amount(token1_meta,
+                                      token1.functions.balanceOf(input.address).call())
 
-        _token1_name = token1.name
-        _token1_symbol = token1.symbol
-        _token1_decimals = token1.decimals
+        _token0_name = token0_meta['name']
+        _token0_symbol = token0_meta['symbol']
+        _token0_decimals = token0_meta['decimals']
 
-        token0_reserve = token0.scaled(getReserves[0])
-        token1_reserve = token1.scaled(getReserves[1])
+        _token1_name = token1_meta['name']
+        _token1_symbol = token1_meta['symbol']
+        _token1_decimals = token1_meta['decimals']
+
+        token0_reserve = scale_amount(token0_meta, getReserves[0])
+        token1_reserve = scale_amount(token1_meta, getReserves[1])
 
         output = {'pairAddress': input.address,
                   'token0': token0,
@@ -147,7 +153,7 @@ class SushiswapGetPairDetails(Model):
 
 
 @Model.describe(slug='sushiswap.get-pool-price-info',
-                version='1.0',
+                version='1.1',
                 display_name='Sushiswap Token Pools Price ',
                 description='Gather price and liquidity information from pools',
                 input=Token,
@@ -2,16 +2,12 @@ from web3.exceptions import (
     BadFunctionCallOutput
 )
 
-from web3._utils.filters import construct_event_filter_params
-from web3._utils.events import get_event_data
-
 from credmark.cmf.model.errors import (
     ModelRunError,
 )
 
 from credmark.cmf.model import Model
 from credmark.cmf.types import (
-    Price,
     Token,
     Address,
     Contract,
@@ -30,6 +26,9 @@ from models.tmp_abi_lookup import (
     USDC_ADDRESS,
     USDT_ADDRESS,
 )
+from models.utils.logs import get_block_range_sums
+from models.utils.price_cache import PRICE_CACHE
+from models.utils.token_metadata import get_token_metadata
 
 
 class UniswapV2PoolMeta:
@@ -84,6 +83,7 @@ class UniswapPoolPriceInfoMeta:
         """
         Method to be shared between Uniswap V2 and SushiSwap
         """
+        cache_start = PRICE_CACHE.counters()
         pools = [Contract(address=p.address) for p in pools_address]
 
         prices_with_info = []
@@ -95,8 +95,10 @@ class UniswapPoolPriceInfoMeta:
 
             token0 = Token(address=Address(pool.functions.token0().call()).checksum)
             token1 = Token(address=Address(pool.functions.token1().call()).checksum)
-            scaled_reserve0 = token0.scaled(reserves[0])
-            scaled_reserve1 = token1.scaled(reserves[1])
+            token0_meta, token1_meta = get_token_metadata(model.context,
+                                                          [token0.address, token1.address])
+            scaled_reserve0 = reserves[0] / (10 ** token0_meta['decimals'])
+            scaled_reserve1 = reserves[1] / (10 ** token1_meta['decimals'])
 
             if input.address == token0.address:
                 inverse = False
@@ -111,9 +113,9 @@ class UniswapPoolPriceInfoMeta:
             if input.address != WETH9_ADDRESS:
                 if WETH9_ADDRESS in (token1.address, token0.address):
                     if weth_price is None:
-                        weth_price = model.context.run_model(pricer_slug,
-                                                             {"address": WETH9_ADDRESS},
-                                                             return_type=Price)
+                        weth_price = PRICE_CACHE.get_price(model.context,
+                                                           pricer_slug,
+                                                           {"address": WETH9_ADDRESS})
                         if weth_price.price is None:
                             raise ModelRunError('Can not retriev price for WETH')
                     weth_multiplier = weth_price.price
@@ -127,18 +129,19 @@ class UniswapPoolPriceInfoMeta:
                                             inverse=inverse,
                                             token0_address=token0.address,
                                             token1_address=token1.address,
-                                            token0_symbol=token0.symbol,
-                                            token1_symbol=token1.symbol,
-                                            token0_decimals=token0.decimals,
-                                            token1_decimals=token1.decimals,
+                                            token0_symbol=token0_meta['symbol'],
+                                            token1_symbol=token1_meta['symbol'],
+                                            token0_decimals=token0_meta['decimals'],
+                                            token1_decimals=token1_meta['decimals'],
                                             pool_address=pool.address)
             prices_with_info.append(pool_price_info)
 
-        return PoolPriceInfos(pool_price_infos=prices_with_info)
+        return PoolPriceInfos(pool_price_infos=prices_with_info,
+                              price_cache=PRICE_CACHE.run_stats(cache_start))
 
 
 @Model.describe(slug='uniswap-v2.get-pool-price-info',
-                version='1.0',
+                version='1.1',
                 display_name='Uniswap v2 Token Pools Price ',
                 description='Gather price and liquidity information from pools',
                 input=Token,
@@ -156,7 +159,7 @@ class UniswapV2GetAveragePrice(Model, UniswapPoolPriceInfoMeta):
 
 
 @Model.describe(slug='uniswap-v2.pool-volume',
-                version='1.1',
+                version='1.2',
                 display_name='Uniswap v2 Pool Swap Volumes',
                 description='The volume of each token swapped in a pool in a window',
                 input=Contract,
@@ -168,33 +171,25 @@ class UniswapV2PoolSwapVolume(Model):
         token0 = Token(address=input.functions.token0().call())
         token1 = Token(address=input.functions.token1().call())
 
-        try:
-            swaps = input.events.Swap.createFilter(
-                fromBlock=self.context.block_number - int(86400 / 14),
-                toBlock=self.context.block_number).get_all_entries()
-        except ValueError:
-            # Some node server does not support newer eth_newFilter method
-            # pylint:disable=locally-disabled,protected-access
-            swap_event_abi = input.events.Swap._get_event_abi()
-
-            __data_filter_set, event_filter_params = construct_event_filter_params(
-                abi_codec=self.context.web3.codec,
-                event_abi=swap_event_abi,
-                address=input.address.checksum,
-                fromBlock=self.context.block_number - int(86400 * 10 / 14),
-                toBlock=self.context.block_number
-            )
-            swaps = self.context.web3.eth.get_logs(event_filter_params)
-            swaps = [get_event_data(self.context.web3.codec, swap_event_abi, s) for s in swaps]
+        # Swap(sender, amount0In, amount1In, amount0Out, amount1Out, to) has the amounts as data
+        # pylint:disable=locally-disabled,protected-access
+        amount0In, amount1In, amount0Out, amount1Out = get_block_range_sums(
+            self.context,
+            name='uniswap-v2.swap',
+            event_abi=input.events.Swap._get_event_abi(),
+            address=input.address.checksum,
+            n_words=4,
+            block_range=(int(self.context.block_number) - int(86400 / 14),
+                         int(self.context.block_number)))
 
         return TradingVolume(
             tokenVolumes=[
                 TokenTradingVolume(
                     token=token0,
-                    sellAmount=sum([s['args']['amount0In'] for s in swaps]),
-                    buyAmount=sum([s['args']['amount0Out'] for s in swaps])),
+                    sellAmount=amount0In,
+                    buyAmount=amount0Out),
                 TokenTradingVolume(
                     token=token1,
-                    sellAmount=sum([s['args']['amount1In'] for s in swaps]),
-                    buyAmount=sum([s['args']['amount1Out'] for s in swaps]))
+                    sellAmount=amount1In,
+                    buyAmount=amount1Out)
             ])
@@ -1,27 +1,25 @@
-import numpy as np
-from web3.exceptions import (
-    BadFunctionCallOutput,
-)
+from typing import List
 
+import numpy as np
 from credmark.cmf.model import Model
 from credmark.cmf.model.errors import (
     ModelDataError,
     ModelRunError,
 )
 from credmark.cmf.types import (
-    Price,
     Token,
     Address,
     Contract,
     Contracts,
 )
 
-from credmark.dto import DTO
+from credmark.dto import DTO, IterableListGenericDTO, PrivateAttr
 
-from models.tmp_abi_lookup import (
-    UNISWAP_V3_POOL_ABI,
-    WETH9_ADDRESS,
-)
+from models.tmp_abi_lookup import WETH9_ADDRESS
+from models.utils.abi import get_abi_json, get_contract_factory
+from models.utils.multicall import multicall
+from models.utils.price_cache import PRICE_CACHE
+from models.utils.token_metadata import get_token_metadata
 
 from models.dtos.price import PoolPriceInfo, PoolPriceInfos
 
@@ -49,8 +47,13 @@ class UniswapV3PoolInfo(DTO):
     token1_symbol: str
 
 
+class UniswapV3PoolInfos(IterableListGenericDTO[UniswapV3PoolInfo]):
+    pool_infos: List[UniswapV3PoolInfo] = []
+    _iterator: str = PrivateAttr('pool_infos')
+
+
 @Model.describe(slug='uniswap-v3.get-pools',
-                version='1.1',
+                version='1.2',
                 display_name='Uniswap v3 Token Pools',
                 description='The Uniswap v3 pools that support a token contract',
                 input=Token,
@@ -60,8 +63,10 @@ class UniswapV3GetPoolsForToken(Model):
         1: "0x1F98431c8aD98523631AE4a59f267346ea31F984"
     }
 
+    # Fee tiers in hundredths of a bip: 0.01%, 0.05%, 0.3% and 1%
+    FEES = [100, 500, 3000, 10000]
+
     def run(self, input: Token) -> Contracts:
-        fees = [3000, 10000]
         primary_tokens = [Token(symbol='DAI'),
                           Token(symbol='USDT'),
                           Token(symbol='WETH'),
@@ -70,195 +75,240 @@ class UniswapV3GetPoolsForToken(Model):
         if self.context.chain_id != 1:
             return Contracts(contracts=[])
 
-        try:
-            addr = self.UNISWAP_V3_FACTORY_ADDRESS[self.context.chain_id]
-            uniswap_factory = Contract(address=addr)
-            pools = []
-            for fee in fees:
-                for primary_token in primary_tokens:
-                    if input.address and primary_token.address:
-                        pool = uniswap_factory.functions.getPool(
-                            input.address.checksum,
-                            primary_token.address.checksum,
-                            fee).call()
-                        if pool != Address.null():
-                            # TODO: ABI for 0x2a84e2bd2e961b1557d6e516ca647268b432cba4
-                            # is not loaded in DB
-                            pools.append(Contract(address=pool,
-                                                  abi=UNISWAP_V3_POOL_ABI).info)
-
-            return Contracts(contracts=pools)
-        except BadFunctionCallOutput:
-            # Or use this condition: if self.context.block_number < 12369621:
+        if not input.address:
             return Contracts(contracts=[])
 
+        addr = self.UNISWAP_V3_FACTORY_ADDRESS[self.context.chain_id]
+        uniswap_factory = Contract(address=Address(addr).checksum,
+                                   abi=get_abi_json('UNISWAP_V3_FACTORY_ABI'))
 
-@Model.describe(slug='uniswap-v3.get-pool-info',
-                version='1.2',
-                display_name='Uniswap v3 Token Pools Info',
-                description='The Uniswap v3 pools that support a token contract',
-                input=Contract,
-                output=UniswapV3PoolInfo)
-class UniswapV3GetPoolInfo(Model):
-    UNISWAP_BASE = 1.0001
-
-    def tick_to_price(self, tick):
-        return pow(self.UNISWAP_BASE, tick)
+        # All fee/primary token combinations are looked up in one aggregated call
+        get_pool_calls = [
+            uniswap_factory.functions.getPool(input.address.checksum,
+                                              primary_token.address.checksum,
+                                              fee)
+            for fee in self.FEES
+            for primary_token in primary_tokens
+            if primary_token.address and primary_token.address != input.address]
 
-    def run(self, input: Contract) -> UniswapV3PoolInfo:
-        try:
-            input.abi
-        except ModelDataError:
-            input = Contract(address=input.address, abi=UNISWAP_V3_POOL_ABI).info
+        pools = []
+        for pool in multicall(self.context, get_pool_calls):
+            # None if the factory is not deployed yet, i.e. block_number < 12369621
+            if pool is not None and Address(pool) != Address.null():
+                # TODO: ABI for 0x2a84e2bd2e961b1557d6e516ca647268b432cba4
+                # is not loaded in DB
+                pools.append(Contract(address=pool, abi=get_abi_json('UNISWAP_V3_POOL_ABI')))
 
-        pool = input
+        return Contracts(contracts=pools)
 
-        slot0 = pool.functions.slot0().call()
-        fee = pool.functions.fee().call()
-        ticks = pool.functions.ticks(slot0[1]).call()
-        _liquidityGross = ticks[0]
-        _liquidityNet = ticks[1]
 
-        token0_addr = pool.functions.token0().call()
-        token1_addr = pool.functions.token1().call()
-        token0 = Token(address=token0_addr)
-        token1 = Token(address=token1_addr)
-        token0_symbol = token0.symbol
-        token1_symbol = token1.symbol
+@Model.describe(slug='uniswap-v3.get-pool-info-batch',
+                version='1.1',
+                display_name='Uniswap v3 Pools Info',
+                description='The state and the liquidity near the current tick of '
+                'a list of Uniswap v3 pools',
+                input=Contracts,
+                output=UniswapV3PoolInfos)
+class UniswapV3GetPoolInfoBatch(Model):
+    """
+    The pool state of all pools is read in one aggregated call, the pool token balances
+    in a second one, and the liquidity figures are computed on arrays with one entry per pool.
+    """
+    UNISWAP_BASE = 1.0001
 
-        token0_balance = token0.scaled(token0.functions.balanceOf(input.address).call())
-        token1_balance = token1.scaled(token1.functions.balanceOf(input.address).call())
+    # Pool getters read for each pool, in this order
+    POOL_FIELDS = ('slot0', 'fee', 'liquidity', 'tickSpacing', 'token0', 'token1')
+
+    def run(self, input: Contracts) -> UniswapV3PoolInfos:
+        pools = [Address(pool.address) for pool in input]
+        if len(pools) == 0:
+            return UniswapV3PoolInfos(pool_infos=[])
+
+        pool_factory = get_contract_factory(self.context.web3, 'UNISWAP_V3_POOL_ABI')
+        n_fields = len(self.POOL_FIELDS)
+        values = multicall(self.context,
+                           [getattr(pool_factory(address=pool.checksum).functions, field)()
+                            for pool in pools
+                            for field in self.POOL_FIELDS])
+        states = [dict(zip(self.POOL_FIELDS, values[n * n_fields:(n + 1) * n_fields]))
+                  for n in range(len(pools))]
+
+        failed = [pool for pool, state in zip(pools, states)
+                  if any(value is None for value in state.values())]
+        if len(failed) > 0:
+            raise ModelDataError(f'Can not read the state of Uniswap v3 pools {failed}')
+
+        token0_addrs = [Address(state['token0']) for state in states]
+        token1_addrs = [Address(state['token1']) for state in states]
+        # Raises ModelDataError for a token without decimals
+        metadata = get_token_metadata(self.context, token0_addrs + token1_addrs)
+        token0_meta, token1_meta = metadata[:len(pools)], metadata[len(pools):]
+
+        erc20 = get_contract_factory(self.context.web3, 'ERC_20_ABI')
+        balances = multicall(self.context,
+                             [erc20(address=token_addr.checksum).functions.balanceOf(
+                                 pool.checksum)
+                              for pool, token0_addr, token1_addr
+                              in zip(pools, token0_addrs, token1_addrs)
+                              for token_addr in (token0_addr, token1_addr)])
+
+        failed = [pool for n, pool in enumerate(pools)
+                  if balances[2 * n] is None or balances[2 * n + 1] is None]
+        if len(failed) > 0:
+            raise ModelDataError(f'Can not read the token balances of Uniswap v3 pools {failed}')
+
+        token0_scale = 10.0 ** np.array([meta['decimals'] for meta in token0_meta], dtype=float)
+        token1_scale = 10.0 ** np.array([meta['decimals'] for meta in token1_meta], dtype=float)
+        token0_balance = np.array(balances[0::2], dtype=float) / token0_scale
+        token1_balance = np.array(balances[1::2], dtype=float) / token1_scale
 
         # Liquidity for virutal amount of x and y
-        liquidity = pool.functions.liquidity().call()
+        liquidity = np.array([state['liquidity'] for state in states], dtype=float)
 
         # To calculate liquidity within the range of tick
 
         # Get the current tick and tick_spacing for the pool (set based on the fee)
-        tick = slot0[1]
-        tick_spacing = pool.functions.tickSpacing().call()
+        tick = np.array([state['slot0'][1] for state in states], dtype=float)
+        tick_spacing = np.array([state['tickSpacing'] for state in states], dtype=float)
         # Compute the current price
-        p_current = self.tick_to_price(tick)
+        p_current = np.power(self.UNISWAP_BASE, tick)
 
         # Compute the tick range near the current tick
-        tick_bottom = (np.floor(tick / tick_spacing)) * tick_spacing
+        tick_bottom = np.floor(tick / tick_spacing) * tick_spacing
         tick_top = tick_bottom + tick_spacing
-        assert tick_bottom <= tick <= tick_top
 
         # Compute square roots of prices corresponding to the bottom and top ticks
-        sa = self.tick_to_price(tick_bottom // 2)
-        sb = self.tick_to_price(tick_top // 2)
-        sp = p_current ** 0.5
+        sa = np.power(self.UNISWAP_BASE, np.floor_divide(tick_bottom, 2))
+        sb = np.power(self.UNISWAP_BASE, np.floor_divide(tick_top, 2))
+        sp = np.sqrt(p_current)
 
         amount0 = liquidity * (sb - sp) / (sp * sb)
         amount1 = liquidity * (sp - sa)
 
         # Below shall be equal for the tick liquidity
         # Reference: UniswapV3 whitepaper Eq. 2.2
-        assert np.isclose(
-            (amount0 + liquidity / sb) * (amount1 + liquidity * sa),
-            float(liquidity * liquidity))
+        assert np.all(np.isclose((amount0 + liquidity / sb) * (amount1 + liquidity * sa),
+                                 liquidity * liquidity))
 
         # Scale the amounts to the token's unit
-        adjusted_amount0 = token0.scaled(amount0)
-        adjusted_amount1 = token1.scaled(amount1)
+        adjusted_amount0 = amount0 / token0_scale
+        adjusted_amount1 = amount1 / token1_scale
 
         # Calculate the virtual liquidity
         # Reference: UniswapV3 whitepaper Eq. 2.1
-        virtual_x = token0.scaled(liquidity / sp)
-        virtual_y = token1.scaled(liquidity * sp)
-
-        res = {
-            "address": input.address,
-            "sqrtPriceX96": slot0[0],
-            "tick": tick,
-            "observationIndex": slot0[2],
-            "observationCardinality": slot0[3],
-            "observationCardinalityNext": slot0[4],
-            "feeProtocol": slot0[5],
-            "unlocked": slot0[6],
-            "token0": token0,
-            "token1": token1,
-            'token0_balance': token0_balance,
-            'token1_balance': token1_balance,
-            'token0_symbol': token0_symbol,
-            'token1_symbol': token1_symbol,
-            "liquidity": liquidity,
-            'tick_liquidity_token0': adjusted_amount0,
-            'tick_liquidity_token1': adjusted_amount1,
-            "fee": fee,
-            'virtual_liquidity_token0': virtual_x,
-            'virtual_liquidity_token1': virtual_y,
-        }
-        return UniswapV3PoolInfo(**res)
+        virtual_x = (liquidity / sp) / token0_scale
+        virtual_y = (liquidity * sp) / token1_scale
+
+        pool_infos = []
+        for n, (pool, state) in enumerate(zip(pools, states)):
+            slot0 = state['slot0']
+            pool_infos.append(UniswapV3PoolInfo(
+                address=pool,
+                sqrtPriceX96=slot0[0],
+                tick=slot0[1],
+                observationIndex=slot0[2],
+                observationCardinality=slot0[3],
+                observationCardinalityNext=slot0[4],
+                feeProtocol=slot0[5],
+                unlocked=slot0[6],
+                token0=Token(address=token0_addrs[n]),
+                token1=Token(address=token1_addrs[n]),
+                token0_balance=token0_balance[n],
+                token1_balance=token1_balance[n],
+                token0_symbol=token0_meta[n]['symbol'],
+                token1_symbol=token1_meta[n]['symbol'],
+                liquidity=state['liquidity'],
+                tick_liquidity_token0=adjusted_amount0[n],
+                tick_liquidity_token1=adjusted_amount1[n],
+                fee=state['fee'],
+                virtual_liquidity_token0=virtual_x[n],
+                virtual_liquidity_token1=virtual_y[n]))
+
+        return UniswapV3PoolInfos(pool_infos=pool_infos)
+
+
+@Model.describe(slug='uniswap-v3.get-pool-info',
+                version='1.4',
+                display_name='Uniswap v3 Token Pools Info',
+                description='The Uniswap v3 pools that support a token contract',
+                input=Contract,
+                output=UniswapV3PoolInfo)
+class UniswapV3GetPoolInfo(Model):
+    def run(self, input: Contract) -> UniswapV3PoolInfo:
+        pool_infos = self.context.run_model('uniswap-v3.get-pool-info-batch',
+                                            Contracts(contracts=[input]),
+                                            return_type=UniswapV3PoolInfos)
+        return pool_infos.pool_infos[0]
 
 
 @Model.describe(slug='uniswap-v3.get-pool-price-info',
-                version='1.1',
+                version='1.2',
                 display_name='Uniswap v3 Token Pools Price ',
                 description='Gather price and liquidity information from pools',
                 input=Token,
                 output=PoolPriceInfos)
 class UniswapV3GetPoolPriceInfo(Model):
     def run(self, input: Token) -> PoolPriceInfos:
+        cache_start = PRICE_CACHE.counters()
         pools = self.context.run_model('uniswap-v3.get-pools',
                                        input,
                                        return_type=Contracts)
 
-        infos = [
-            self.context.run_model('uniswap-v3.get-pool-info',
-                                   p,
-                                   return_type=UniswapV3PoolInfo)
-            for p in pools
-        ]
+        infos = self.context.run_model('uniswap-v3.get-pool-info-batch',
+                                       pools,
+                                       return_type=UniswapV3PoolInfos).pool_infos
+        if len(infos) == 0:
+            return PoolPriceInfos(pool_price_infos=[])
+
+        token0_meta = get_token_metadata(self.context, [info.token0.address for info in infos])
+        token1_meta = get_token_metadata(self.context, [info.token1.address for info in infos])
+
+        # Pools with a token of 0 decimals are skipped
+        decimals0 = np.array([meta['decimals'] for meta in token0_meta])
+        decimals1 = np.array([meta['decimals'] for meta in token1_meta])
+        has_decimals = (decimals0 > 0) & (decimals1 > 0)
+
+        scale_multiplier = np.power(10.0, decimals0 - decimals1)
+        tick = np.array([info.tick for info in infos], dtype=float)
+        tick_price = np.power(1.0001, tick) * scale_multiplier
+
+        inverse = np.array([input.address == info.token1.address for info in infos])
+        tick_price = np.where(inverse, 1 / tick_price, tick_price)
+        virtual_liquidity = np.where(
+            inverse,
+            np.array([info.virtual_liquidity_token0 for info in infos]),
+            np.array([info.virtual_liquidity_token1 for info in infos]))
+
+        weth_multiplier = np.ones(len(infos))
+        if input.address != WETH9_ADDRESS:
+            with_weth = np.array([WETH9_ADDRESS in (info.token1.address, info.token0.address)
+                                  for info in infos])
+            if np.any(with_weth & has_decimals):
+                weth_price = PRICE_CACHE.get_price(self.context,
+                                                   'uniswap-v3.get-weighted-price',
+                                                   {"address": WETH9_ADDRESS})
+                if weth_price.price is None:
+                    raise ModelRunError('Can not retriev price for WETH')
+                weth_multiplier[with_weth] = weth_price.price
+
+        tick_price *= weth_multiplier
 
         prices_with_info = []
-        weth_price = None
-        for info in infos:
-            # decimal only available for ERC20s
-            if info.token0.decimals and info.token1.decimals:
-                scale_multiplier = (10 ** (info.token0.decimals - info.token1.decimals))
-                tick_price = 1.0001 ** info.tick * scale_multiplier
-                _tick_liquidity = info.tick_liquidity_token1
-                virtual_liquidity = info.virtual_liquidity_token1
-                ratio_price = info.sqrtPriceX96 * info.sqrtPriceX96 / (2 ** 192) * scale_multiplier
-
-                inverse = False
-                if input.address == info.token1.address:
-                    tick_price = 1/tick_price
-                    ratio_price = 1/ratio_price
-                    inverse = True
-                    _tick_liquidity = info.tick_liquidity_token0
-                    virtual_liquidity = info.virtual_liquidity_token0
-
-                weth_multiplier = 1.0
-                if input.address != WETH9_ADDRESS:
-                    if WETH9_ADDRESS in (info.token1.address, info.token0.address):
-                        if weth_price is None:
-                            weth_price = self.context.run_model('uniswap-v3.get-weighted-price',
-                                                                {"address": WETH9_ADDRESS},
-                                                                return_type=Price)
-                            if weth_price.price is None:
-                                raise ModelRunError('Can not retriev price for WETH')
-
-                            weth_price = weth_price.price
-                        weth_multiplier = weth_price
-
-                tick_price *= weth_multiplier
-                ratio_price *= weth_multiplier
-
-                pool_price_info = PoolPriceInfo(src=self.slug,
-                                                price=tick_price,
-                                                liquidity=virtual_liquidity,
-                                                weth_multiplier=weth_multiplier,
-                                                inverse=inverse,
-                                                token0_address=info.token0.address,
-                                                token1_address=info.token1.address,
-                                                token0_symbol=info.token0.symbol,
-                                                token1_symbol=info.token1.symbol,
-                                                token0_decimals=info.token0.decimals,
-                                                token1_decimals=info.token1.decimals,
-                                                pool_address=info.address)
-                prices_with_info.append(pool_price_info)
-
-        return PoolPriceInfos(pool_price_infos=prices_with_info)
+        for n in np.flatnonzero(has_decimals):
+            info = infos[n]
+            pool_price_info = PoolPriceInfo(src=self.slug,
+                                            price=tick_price[n],
+                                            liquidity=virtual_liquidity[n],
+                                            weth_multiplier=weth_multiplier[n],
+                                            inverse=bool(inverse[n]),
+                                            token0_address=info.token0.address,
+                                            token1_address=info.token1.address,
+                                            token0_symbol=info.token0_symbol,
+                                            token1_symbol=info.token1_symbol,
+                                            token0_decimals=int(decimals0[n]),
+                                            token1_decimals=int(decimals1[n]),
+                                            pool_address=info.address)
+            prices_with_info.append(pool_price_info)
+
+        return PoolPriceInfos(pool_price_infos=prices_with_info,
+                              price_cache=PRICE_CACHE.run_stats(cache_start))
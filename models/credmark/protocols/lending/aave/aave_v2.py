@@ -1,9 +1,12 @@
+from collections import OrderedDict
 from typing import List, Optional
 from credmark.cmf.model import Model
 from credmark.cmf.model.errors import ModelDataError, ModelRunError
 from credmark.cmf.types import Address, Contract, Contracts, Portfolio, Position, Token, Price
 from credmark.dto import DTO, EmptyInput, IterableListGenericDTO
-from models.tmp_abi_lookup import AAVE_STABLEDEBT_ABI
+from models.utils.abi import get_abi_json, get_contract_factory
+from models.utils.multicall import multicall
+from models.utils.rpc import batch_get_storage_at
 from web3.exceptions import ABIFunctionNotFound
 
 
@@ -132,43 +135,80 @@ class AaveV2GetOraclePrice(Model):
         return Price(price=price / 1e18, src=f'{self.slug}|{source}')
 
 
-def get_eip1967_implementation(context, logger, token_address):
+EIP1967_IMPLEMENTATION_SLOT = '0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc'
+
+# Tokens with their resolved implementation per (chain_id, block_number, address).
+# A Token is bound to the block it is created for, so it is only shared within the same block.
+EIP1967_TOKENS: 'OrderedDict[tuple, Token]' = OrderedDict()
+EIP1967_TOKENS_MAXSIZE = 1024
+
+
+def get_eip1967_implementations(context, logger, token_addresses) -> List[Token]:
     # pylint:disable=locally-disabled,protected-access
     """
     eip-1967 compliant, https://eips.ethereum.org/EIPS/eip-1967
+
+    Tokens of the addresses with their proxy implementation set from the
+    implementation slot. The slots of the addresses not resolved yet at the block
+    are fetched in batched requests.
     """
     default_proxy_address = ''.join(['0'] * 40)
 
-    token = Token(address=token_address)
-    # Got 0xca823F78C2Dd38993284bb42Ba9b14152082F7BD unrecognized by etherscan
-    # assert token.proxy_for is not None
-
-    # Many aTokens are not recognized as proxy in Etherscan
-    # Token(address='0xfe8f19b17ffef0fdbfe2671f248903055afaa8ca').is_transparent_proxy
-    # https://etherscan.io/address/0xfe8f19b17ffef0fdbfe2671f248903055afaa8ca#code
-    # token.contract_name == 'InitializableImmutableAdminUpgradeabilityProxy'
-    proxy_address = context.web3.eth.get_storage_at(
-        token.address,
-        '0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc').hex()
-    if proxy_address[-40:] != default_proxy_address:
-        proxy_address = '0x' + proxy_address[-40:]
-        token_implemenation = Token(address=proxy_address)
-        # TODO: Work around before we can load proxy in the past based on block number.
-        if token._meta.is_transparent_proxy:
-            if token.proxy_for is not None and proxy_address != token.proxy_for.address:
+    keys = [(context.chain_id, int(context.block_number), Address(addr))
+            for addr in token_addresses]
+    missing = list(dict.fromkeys(key for key in keys if key not in EIP1967_TOKENS))
+
+    storage_values = batch_get_storage_at(context,
+                                          [key[2].checksum for key in missing],
+                                          EIP1967_IMPLEMENTATION_SLOT)
+
+    for key, storage_value in zip(missing, storage_values):
+        token_address = key[2]
+        token = Token(address=token_address)
+        # Got 0xca823F78C2Dd38993284bb42Ba9b14152082F7BD unrecognized by etherscan
+        # assert token.proxy_for is not None
+
+        # Many aTokens are not recognized as proxy in Etherscan
+        # Token(address='0xfe8f19b17ffef0fdbfe2671f248903055afaa8ca').is_transparent_proxy
+        # https://etherscan.io/address/0xfe8f19b17ffef0fdbfe2671f248903055afaa8ca#code
+        # token.contract_name == 'InitializableImmutableAdminUpgradeabilityProxy'
+        proxy_address = storage_value.hex()
+        if proxy_address[-40:] != default_proxy_address:
+            proxy_address = '0x' + proxy_address[-40:]
+            token_implemenation = Token(address=proxy_address)
+            # TODO: Work around before we can load proxy in the past based on block number.
+            if token._meta.is_transparent_proxy:
+                if token.proxy_for is not None and proxy_address != token.proxy_for.address:
+                    logger.debug(
+                        f'token\'s implmentation is corrected to '
+                        f'{proxy_address} from {token.proxy_for.address} for {token.address}')
+            else:
                 logger.debug(
                     f'token\'s implmentation is corrected to '
-                    f'{proxy_address} from {token.proxy_for.address} for {token.address}')
+                    f'{proxy_address} from no-proxy for {token.address}')
+
+            token._meta.is_transparent_proxy = True
+            token._meta.proxy_implementation = token_implemenation
         else:
-            logger.debug(
-                f'token\'s implmentation is corrected to '
-                f'{proxy_address} from no-proxy for {token.address}')
+            raise ModelDataError(f'Unable to retrieve proxy implementation for {token_address}')
+
+        EIP1967_TOKENS[key] = token
+
+    tokens = []
+    for key in keys:
+        EIP1967_TOKENS.move_to_end(key)
+        tokens.append(EIP1967_TOKENS[key])
 
-        token._meta.is_transparent_proxy = True
-        token._meta.proxy_implementation = token_implemenation
-    else:
-        raise ModelDataError(f'Unable to retrieve proxy implementation for {token_address}')
-    return token
+    while len(EIP1967_TOKENS) > EIP1967_TOKENS_MAXSIZE:
+        EIP1967_TOKENS.popitem(last=False)
+    return tokens
+
+
+def get_eip1967_implementation(context, logger, token_address):
+    """
+    eip-1967 compliant, https://eips.ethereum.org/EIPS/eip-1967
+    """
+    return get_eip1967_implementations(context, logger, [token_address])[0]
 
 
 @Model.describe(slug="aave-v2.overall-liabilities-portfolio",
@@ -243,6 +283,17 @@ class AaveV2GetAssets(Model):
 
         aave_assets_address = aave_lending_pool.functions.getReservesList().call()
 
+        # Resolve the aToken/stable debt/variable debt tokens of all reserves in one batch,
+        # aave-v2.token-asset then finds them resolved for this block.
+        reserves_data = multicall(self.context,
+                                  [aave_lending_pool.functions.getReserveData(asset_address)
+                                   for asset_address in aave_assets_address])
+        get_eip1967_implementations(self.context,
+                                    self.logger,
+                                    [token_address
+                                     for reserve_data in reserves_data if reserve_data is not None
+                                     for token_address in reserve_data[7:10]])
+
         aave_debts_infos = []
         for asset_address in aave_assets_address:
             info = self.context.run_model('aave-v2.token-asset',
@@ -291,9 +342,12 @@ class AaveV2GetTokenAsset(Model):
         # 10. interestRateStrategyAddress | address | address of interest rate strategy
         # 11. id | uint8 | the position in the list of active reserves |
 
-        aToken = get_eip1967_implementation(self.context, self.logger, reservesData[7])
-        stableDebtToken = get_eip1967_implementation(self.context, self.logger, reservesData[8])
-        variableDebtToken = get_eip1967_implementation(self.context, self.logger, reservesData[9])
+        reserve_tokens = get_eip1967_implementations(self.context,
+                                                     self.logger,
+                                                     reservesData[7:10])
+        aToken = reserve_tokens[0]
+        stableDebtToken = reserve_tokens[1]
+        variableDebtToken = reserve_tokens[2]
         interestRateStrategyContract = Contract(address=reservesData[10])
 
         currentLiquidityRate = reservesData[3] / 1e27
@@ -311,7 +365,7 @@ class AaveV2GetTokenAsset(Model):
             # pylint:disable=locally-disabled,protected-access
             if stableDebtToken.proxy_for is not None:
                 if stableDebtToken.proxy_for._meta is not None:
-                    stableDebtToken.proxy_for._meta.abi = AAVE_STABLEDEBT_ABI
+                    stableDebtToken.proxy_for._meta.abi = get_abi_json('AAVE_STABLEDEBT_ABI')
             else:
                 raise
 
@@ -350,3 +404,99 @@ class AaveV2GetTokenAsset(Model):
         else:
             raise ModelRunError(f'Unable to obtain {totalStableDebt=} and {totalVariableDebt=} '
                                 f'for {aToken.address=}')
+
+
+@Model.describe(slug="aave-v2.reserves-snapshot",
+                version="1.0",
+                display_name="Aave V2 Lending Pool Assets - snapshot",
+                description="Aave V2 assets for the main lending pool, "
+                            "with all reserves read in aggregated calls",
+                input=EmptyInput,
+                output=AaveDebtInfos)
+class AaveV2GetReservesSnapshot(Model):
+    """
+    Same output as aave-v2.lending-pool-assets, with the reserve data of all reserves
+    read in one multicall and the supplies of their aToken, stable debt and
+    variable debt tokens in another, instead of running aave-v2.token-asset per reserve.
+    The tokens' contracts are called with the ABIs of the Aave tokens, so the
+    proxies do not need to be resolved.
+    """
+
+    def run(self, input: EmptyInput) -> AaveDebtInfos:
+        lending_pool = self.context.run_model('aave-v2.get-lending-pool',
+                                              input=EmptyInput(),
+                                              return_type=Contract)
+        web3 = self.context.web3
+        lending_pool = get_contract_factory(web3, 'AAVE_V2_TOKEN_CONTRACT_ABI')(
+            address=lending_pool.address.checksum)
+        erc20 = get_contract_factory(web3, 'ERC_20_ABI')
+        stable_debt = get_contract_factory(web3, 'AAVE_STABLEDEBT_ABI')
+
+        assets_address = [Address(addr)
+                          for addr in lending_pool.functions.getReservesList().call()]
+        reserves_data = multicall(self.context,
+                                  [lending_pool.functions.getReserveData(addr.checksum)
+                                   for addr in assets_address])
+
+        # Per reserve: name, then totalSupply and decimals of aToken, stable and variable debt
+        # tokens, and getSupplyData() of the stable debt token, see aave-v2.token-asset
+        n_reads = 8
+        calls = []
+        for asset_address, reserve_data in zip(assets_address, reserves_data):
+            if reserve_data is None:
+                raise ModelRunError(f'Unable to get reserve data for {asset_address}')
+            calls.append(erc20(address=asset_address.checksum).functions.name())
+            for token_address in reserve_data[7:10]:
+                token_contract = erc20(address=Address(token_address).checksum)
+                calls.extend([token_contract.functions.totalSupply(),
+                              token_contract.functions.decimals()])
+            calls.append(stable_debt(address=Address(reserve_data[8]).checksum)
+                         .functions.getSupplyData())
+        results = multicall(self.context, calls)
+
+        aave_debts_infos = []
+        for n_reserve, (asset_address, reserve_data) in enumerate(zip(assets_address,
+                                                                      reserves_data)):
+            (token_name,
+             aToken_supply, aToken_decimals,
+             stableDebt_supply, stableDebt_decimals,
+             variableDebt_supply, variableDebt_decimals,
+             supplyData) = results[n_reserve*n_reads:(n_reserve+1)*n_reads]
+
+            token = Token(address=asset_address)
+            if token_name is None:
+                # e.g. MKR's name() returns bytes32
+                token_name = token.name
+
+            if (aToken_supply is None or stableDebt_supply is None or
+                    variableDebt_supply is None or supplyData is None):
+                raise ModelRunError(f'Unable to obtain the supplies of the debt tokens '
+                                    f'for {asset_address=}')
+
+            totalSupply = aToken_supply / 10 ** aToken_decimals
+            totalStableDebt = stableDebt_supply / 10 ** stableDebt_decimals
+            totalVariableDebt = variableDebt_supply / 10 ** variableDebt_decimals
+            totalStablePrincipleDebt = supplyData[0] / 10 ** stableDebt_decimals
+            totalInterest = totalStableDebt - totalStablePrincipleDebt
+            totalDebt = totalStableDebt + totalVariableDebt
+            totalLiquidity = totalSupply - totalDebt
+
+            aave_debts_infos.append(AaveDebtInfo(
+                token=token,
+                tokenName=token_name,
+                aToken=Token(address=reserve_data[7]),
+                stableDebtToken=Token(address=reserve_data[8]),
+                variableDebtToken=Token(address=reserve_data[9]),
+                interestRateStrategyContract=Contract(address=reserve_data[10]),
+                supplyRate=reserve_data[3] / 1e27,
+                variableBorrowRate=reserve_data[4] / 1e27,
+                stableBorrowRate=reserve_data[5] / 1e27,
+                totalSupply_qty=totalSupply,
+                totalStableDebt_qty=totalStableDebt,
+                totalStableDebtPrinciple_qty=totalStablePrincipleDebt,
+                totalVariableDebt_qty=totalVariableDebt,
+                totalDebt_qty=totalDebt,
+                totalInterest_qty=totalInterest,
+                totalLiquidity_qty=totalLiquidity))
+
+        return AaveDebtInfos(aaveDebtInfos=aave_debts_infos)
@@ -1,4 +1,6 @@
+from collections import OrderedDict
 from typing import (
+    Dict,
     List,
     Tuple,
 )
@@ -16,8 +18,8 @@ from credmark.cmf.model.errors import ModelRunError
 from credmark.cmf.types import (
     Address,
     Token,
+    Tokens,
     Contract,
-    Price,
     BlockNumber,
 )
 
@@ -29,6 +31,9 @@ from credmark.dto import (
 
 import numpy as np
 
+from models.dtos.price import Prices
+from models.utils.multicall import multicall
+
 # Pool(Contract)
 # LendingPool(Pool)
 # CompoundLendingPool(LendingPool)
@@ -91,27 +96,56 @@ class CompoundV2PoolValues(IterableListGenericDTO[CompoundV2PoolValue]):
     _iterator: str = 'values'
 
 
+# Comptroller contracts resolved per (chain_id, block_number). A Contract is bound to
+# the block it is created for, so it is only shared within the same block.
+COMPTROLLERS_BY_BLOCK: 'OrderedDict[Tuple[int, int], Contract]' = OrderedDict()
+COMPTROLLERS_BY_BLOCK_MAXSIZE = 256
+
+# chain_id => (Unitroller's ABI, implementation address, implementation's ABI).
+# The implementation's ABI is kept until comptrollerImplementation() returns another address.
+COMPTROLLER_ABIS: Dict[int, tuple] = {}
+
+
 def get_comptroller(model):
     compound_comptroller = {
         1: '0x3d9819210a31b4961b30ef54be2aed79b9c9cd3b',
         42: '0x5eae89dc1c671724a672ff0630122ee834098657'
     }
-    addr = compound_comptroller[model.context.chain_id]
+    chain_id = model.context.chain_id
+    block_key = (chain_id, int(model.context.block_number))
+    comptroller = COMPTROLLERS_BY_BLOCK.get(block_key)
+    if comptroller is not None:
+        return comptroller
+
+    addr = compound_comptroller[chain_id]
 
     # pylint:disable=locally-disabled,protected-access
-    comptroller = Contract(address=addr)
-    assert comptroller.contract_name == 'Unitroller'
-    assert comptroller.proxy_for is not None
+    cached_abis = COMPTROLLER_ABIS.get(chain_id)
+    if cached_abis is None:
+        comptroller = Contract(address=addr)
+        assert comptroller.contract_name == 'Unitroller'
+        assert comptroller.proxy_for is not None
+    else:
+        comptroller = Contract(address=addr, abi=cached_abis[0])
 
     proxy_address = comptroller.instance.functions.comptrollerImplementation().call()
 
-    contract_implementation = Contract(address=proxy_address)
-    if proxy_address != comptroller.proxy_for.address:
-        model.context.logger.debug(
-            f'Comptroller\'s implmentation is corrected to {proxy_address} '
-            f'from {comptroller.proxy_for.address}')
+    if cached_abis is not None and Address(proxy_address) == Address(cached_abis[1]):
+        contract_implementation = Contract(address=proxy_address, abi=cached_abis[2])
+    else:
+        contract_implementation = Contract(address=proxy_address)
+        if cached_abis is None and proxy_address != comptroller.proxy_for.address:
+            model.context.logger.debug(
+                f'Comptroller\'s implmentation is corrected to {proxy_address} '
+                f'from {comptroller.proxy_for.address}')
+        COMPTROLLER_ABIS[chain_id] = (comptroller.abi, proxy_address, contract_implementation.abi)
+
     comptroller._meta.is_transparent_proxy = True
     comptroller._meta.proxy_implementation = contract_implementation
+
+    COMPTROLLERS_BY_BLOCK[block_key] = comptroller
+    while len(COMPTROLLERS_BY_BLOCK) > COMPTROLLERS_BY_BLOCK_MAXSIZE:
+        COMPTROLLERS_BY_BLOCK.popitem(last=False)
     return comptroller
 
 
@@ -147,21 +181,24 @@ class CompoundV2GetAllPools(Model):
 
 
 @ Model.describe(slug="compound-v2.all-pools-info",
-                 version="1.2",
+                 version="1.4",
                  display_name="Compound V2 - get all pool info",
                  description="Get all pools and query for their info (deposit, borrow, rates)",
                  input=EmptyInput,
                  output=CompoundV2PoolInfos)
 class CompoundV2AllPoolsInfo(Model):
+    """
+    Same as compound-v2.get-pool-info for all the markets, with the reads of all
+    markets in one multicall and the token prices from one token.price-batch.
+    The infos are in the order of compound-v2.get-pools.
+    """
+
     def run(self, input: EmptyInput) -> CompoundV2PoolInfos:
-        pool_infos = []
         pools = self.context.run_model(slug='compound-v2.get-pools')
 
-        for cTokenAddress in pools['cTokens']:
-            pool_info = self.context.run_model(
-                slug='compound-v2.get-pool-info',
-                input=Token(address=cTokenAddress))
-            pool_infos.append(pool_info)
+        pool_infos = get_pool_infos(self,
+                                    [Token(address=cTokenAddress)
+                                     for cTokenAddress in pools['cTokens']])
         ret = CompoundV2PoolInfos(infos=pool_infos)
         return ret
 
@@ -190,7 +227,7 @@ class CompoundV2AllPoolsValue(Model):
 
 
 @ Model.describe(slug="compound-v2.get-pool-info",
-                 version="1.2",
+                 version="1.4",
                  display_name="Compound V2 - pool/market information",
                  description="Compound V2 - pool/market information",
                  input=Token,
@@ -312,32 +349,82 @@ class CompoundV2GetPoolInfo(Model):
         assert compoud_assets == compoud_ctokens
 
     def run(self, input: Token) -> CompoundV2PoolInfo:
-        comptroller = get_comptroller(self)
+        return get_pool_infos(self, [input])[0]
 
-        cToken = Token(address=input.address)
 
-        # self.logger.info(f'{cToken._meta.is_transparent_proxy}')
-        # self.logger.info(f'{cToken.is_transparent_proxy}')
+# The cToken's checks of get_pool_infos, only done the first time a market is seen.
+CTOKEN_CHECKS = ['isCToken', 'admin', 'comptroller', 'symbol']
 
-        market_info = comptroller.functions.markets(cToken.address).call()
-        (isListed, collateralFactorMantissa, isComped) = market_info
-        collateralFactorMantissa /= pow(10, 18)
+# The cToken's reads of get_pool_infos. exchangeRateCurrent() accrues interest, so
+# it goes last to leave the other reads of the same multicall at the stored state.
+CTOKEN_READS = ['getCash', 'totalBorrows', 'totalReserves', 'totalSupply',
+                'reserveFactorMantissa', 'borrowRatePerBlock', 'supplyRatePerBlock',
+                'exchangeRateCurrent']
+
+# (chain_id, cToken address) => underlying token address, for the checked markets
+CTOKEN_UNDERLYINGS: Dict[Tuple[int, Address], Address] = {}
+
+
+def get_pool_infos(model, c_tokens: List[Token]) -> List[CompoundV2PoolInfo]:
+    """
+    Pool info of a list of cTokens, see CompoundV2GetPoolInfo, in the order of the input.
+    The comptroller's and cTokens' reads of all markets are sent in one multicall,
+    and the underlying tokens are priced together with token.price-batch.
+    """
+    # pylint:disable=locally-disabled,too-many-locals
+    chain_id = model.context.chain_id
+    pool_info_model = CompoundV2GetPoolInfo
+    comptroller = get_comptroller(model)
+
+    c_tokens = [Token(address=cToken.address) for cToken in c_tokens]
+
+    # self.logger.info(f'{cToken._meta.is_transparent_proxy}')
+    # self.logger.info(f'{cToken.is_transparent_proxy}')
+
+    read_names = []
+    calls = []
+    for cToken in c_tokens:
+        if (chain_id, cToken.address) in CTOKEN_UNDERLYINGS:
+            names = ['markets'] + CTOKEN_READS
+        else:
+            names = (['markets'] +
+                     (['underlying'] if cToken.symbol != 'cETH' else []) +
+                     CTOKEN_CHECKS +
+                     CTOKEN_READS)
+        read_names.append(names)
+        calls.append(comptroller.functions.markets(cToken.address))
+        calls.extend(getattr(cToken.functions, name)() for name in names[1:])
+
+    results = multicall(model.context, calls)
+
+    reads = []
+    n_call = 0
+    for names in read_names:
+        reads.append(dict(zip(names, results[n_call:n_call+len(names)])))
+        n_call += len(names)
+
+    tokens = []
+    for cToken, read in zip(c_tokens, reads):
+        underlying = CTOKEN_UNDERLYINGS.get((chain_id, cToken.address))
+        if underlying is not None:
+            tokens.append(Token(address=underlying))
+            continue
 
         # From cToken to Token
-        if input.symbol == 'cETH':
-            token = Token(address=self.COMPOUND_ASSETS[self.context.chain_id]['WETH'])
-        elif (input.address == self.COMPOUND_CTOKEN[self.context.chain_id]['cSAI'] and
-              input.symbol == 'cDAI'):
+        if cToken.symbol == 'cETH':
+            token = Token(address=pool_info_model.COMPOUND_ASSETS[chain_id]['WETH'])
+        elif (cToken.address == pool_info_model.COMPOUND_CTOKEN[chain_id]['cSAI'] and
+              cToken.symbol == 'cDAI'):
             # When input = cSAI, it has been renamed to cDAI in the contract.
             # We will still call up SAI
-            token = Token(address=self.COMPOUND_ASSETS[self.context.chain_id]['SAI'])
+            token = Token(address=pool_info_model.COMPOUND_ASSETS[chain_id]['SAI'])
         else:
-            token = Token(address=cToken.functions.underlying().call())
+            token = Token(address=read['underlying'])
 
-        self.logger.info(f'{cToken.address, cToken.symbol}')
+        model.logger.info(f'{cToken.address, cToken.symbol}')
 
         # Check for cToken to be matched with a Token
-        assert cToken.functions.isCToken().call()
+        assert read['isCToken']
         # TODO: disable this test as we did not have loading ABI by block_number
         # if cToken.proxy_for is not None:
         #    try:
@@ -345,56 +432,71 @@ class CompoundV2GetPoolInfo(Model):
         #    except AssertionError:
         #        self.logger.error(f'{cToken.functions.implementation().call()}, '
         #                          f'{cToken.proxy_for.address=}')
-        assert cToken.functions.admin().call() == \
-            Address(self.COMPOUND_TIMELOCK[self.context.chain_id])
-        assert cToken.functions.comptroller().call() == Address(comptroller.address)
-        assert cToken.functions.symbol().call()
+        assert Address(read['admin']) == \
+            Address(pool_info_model.COMPOUND_TIMELOCK[chain_id])
+        assert Address(read['comptroller']) == Address(comptroller.address)
+        assert read['symbol']
         if cToken.name != 'Compound Ether':
-            assert cToken.functions.underlying().call() == token.address
+            assert Address(read.get('underlying')) == token.address
 
-        # Get/calcualte info
+        CTOKEN_UNDERLYINGS[(chain_id, cToken.address)] = token.address
+        tokens.append(token)
 
-        # TODO: disable this test as we did not have loading ABI by block_number
-        # irModel = Contract(address=cToken.functions.interestRateModel().call())
-        # assert irModel.functions.isInterestRateModel().call()
-        # self.logger.info(f'{irModel.address=}, {irModel.functions.isInterestRateModel().call()=}')
+    # Get/calcualte info
+
+    # TODO: disable this test as we did not have loading ABI by block_number
+    # irModel = Contract(address=cToken.functions.interestRateModel().call())
+    # assert irModel.functions.isInterestRateModel().call()
+    # self.logger.info(f'{irModel.address=}, {irModel.functions.isInterestRateModel().call()=}')
 
-        getCash = token.scaled(cToken.functions.getCash().call())
-        totalBorrows = token.scaled(cToken.functions.totalBorrows().call())
-        totalReserves = token.scaled(cToken.functions.totalReserves().call())
-        totalSupply = cToken.scaled(cToken.functions.totalSupply().call())
+    tokenprices = model.context.run_model('token.price-batch',
+                                          input=Tokens(tokens=tokens),
+                                          return_type=Prices)
 
-        exchangeRate = token.scaled(cToken.functions.exchangeRateCurrent().call())
+    block_dt = model.context.block_number.timestamp_datetime.replace(tzinfo=None).isoformat()
+
+    pool_infos = []
+    for cToken, token, read, tokenprice, tokenprice_src in zip(
+            c_tokens, tokens, reads, tokenprices.prices, tokenprices.srcs):
+        (isListed, collateralFactorMantissa, isComped) = read['markets']
+        collateralFactorMantissa /= pow(10, 18)
+
+        getCash = token.scaled(read['getCash'])
+        totalBorrows = token.scaled(read['totalBorrows'])
+        totalReserves = token.scaled(read['totalReserves'])
+        totalSupply = cToken.scaled(read['totalSupply'])
+
+        exchangeRate = token.scaled(read['exchangeRateCurrent'])
         invExchangeRate = 1 / exchangeRate * pow(10, 10)
         totalLiability = totalSupply / invExchangeRate
 
-        reserveFactor = cToken.functions.reserveFactorMantissa().call() / self.ETH_MANTISSA
-        borrowRate = cToken.functions.borrowRatePerBlock().call() / self.ETH_MANTISSA
-        supplyRate = cToken.functions.supplyRatePerBlock().call() / self.ETH_MANTISSA
+        reserveFactor = read['reserveFactorMantissa'] / pool_info_model.ETH_MANTISSA
+        borrowRate = read['borrowRatePerBlock'] / pool_info_model.ETH_MANTISSA
+        supplyRate = read['supplyRatePerBlock'] / pool_info_model.ETH_MANTISSA
 
         if np.isclose(getCash + totalBorrows - totalReserves, 0):
             utilizationRate = 0
         else:
             utilizationRate = totalBorrows / (getCash + totalBorrows - totalReserves)
-        supplyAPY = ((supplyRate * self.BLOCKS_PER_DAY + 1) ** self.DAYS_PER_YEAR - 1)
-        borrowAPY = ((borrowRate * self.BLOCKS_PER_DAY + 1) ** self.DAYS_PER_YEAR - 1)
+
+        supplyAPY = ((supplyRate * pool_info_model.BLOCKS_PER_DAY + 1) **
+                     pool_info_model.DAYS_PER_YEAR - 1)
+        borrowAPY = ((borrowRate * pool_info_model.BLOCKS_PER_DAY + 1) **
+                     pool_info_model.DAYS_PER_YEAR - 1)
         # By definition, this is how supplyRate is derived.
         # supplyRate ~= borrowRate * utilizationRate * (1 - reserveFactor)
 
-        tokenprice = self.context.run_model(slug='token.price', input=token, return_type=Price)
-
-        if tokenprice.price is None or tokenprice.src is None:
+        if tokenprice is None or tokenprice_src is None:
             raise ModelRunError(f'Can not get price for token {token.symbol=}/{token.address=}')
 
-        block_dt = self.context.block_number.timestamp_datetime.replace(tzinfo=None).isoformat()
         pool_info = CompoundV2PoolInfo(
-            tokenSymbol=input.symbol,
+            tokenSymbol=cToken.symbol,
             cTokenSymbol=cToken.symbol,
             tokenDecimal=token.decimals,
             cTokenDecimal=cToken.decimals,
             token=token,
-            tokenPrice=tokenprice.price,
-            tokenPriceSrc=tokenprice.src,
+            tokenPrice=tokenprice,
+            tokenPriceSrc=tokenprice_src,
             cToken=cToken,
             cash=getCash,
             totalReserves=totalReserves,
@@ -412,11 +514,12 @@ class CompoundV2GetPoolInfo(Model):
             isListed=isListed,
             collateralFactor=collateralFactorMantissa,
             isComped=isComped,
-            block_number=int(self.context.block_number),
+            block_number=int(model.context.block_number),
             block_datetime=block_dt,
         )
+        pool_infos.append(pool_info)
 
-        return pool_info
+    return pool_infos
 
 
 @ Model.describe(slug="compound-v2.pool-value",
@@ -457,7 +560,7 @@ class CompoundV2PoolsValueHistoricalInput(DTO):
 
 
 @ Model.describe(slug="compound-v2.pool-value-historical",
-                 version="1.1",
+                 version="1.3",
                  display_name="Compound pools value history",
                  description="Compound pools value history",
                  input=CompoundV2PoolsValueHistoricalInput,
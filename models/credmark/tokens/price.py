@@ -1,11 +1,16 @@
 # pylint: disable=locally-disabled, unused-import
-import pandas as pd
-from typing import List
+import hashlib
+import inspect
+from functools import lru_cache
+import numpy as np
+from typing import List, Optional, Tuple
 
 from credmark.cmf.model import Model, ModelDataErrorDesc
-from credmark.cmf.model.errors import ModelDataError
+from credmark.cmf.model.errors import ModelDataError, ModelRunError
 from credmark.cmf.types import (
+    Address,
     Token,
+    Tokens,
     Price,
     Contract,
     Accounts,
@@ -14,7 +19,24 @@ from credmark.cmf.types import (
 
 from credmark.dto import DTO, IterableListGenericDTO
 
-from models.dtos.price import PoolPriceAggregatorInput, PoolPriceInfos
+from models.dtos.price import (
+    PoolPriceAggregatorInput,
+    PoolPriceInfo,
+    PoolPriceInfos,
+    Prices,
+)
+from models.tmp_abi_lookup import (
+    DAI_ADDRESS,
+    SUSHISWAP_FACTORY_ADDRESS,
+    UNISWAP_V2_FACTORY_ADDRESS,
+    UNISWAP_V3_FACTORY_ADDRESS,
+    USDC_ADDRESS,
+    USDT_ADDRESS,
+    WETH9_ADDRESS,
+)
+from models.utils.abi import get_contract_factory
+from models.utils.multicall import multicall
+from models.utils.token_metadata import get_token_metadata
 
 
 @Model.describe(slug='price',
@@ -38,25 +60,70 @@ PRICE_DATA_ERROR_DESC = ModelDataErrorDesc(
 
 
 @Model.describe(slug='price.pool-aggregator',
-                version='1.1',
+                version='1.2',
                 display_name='Token Price from DEX pools, weighted by liquidity',
                 description='Aggregate prices from pools weighted by liquidity',
                 input=PoolPriceAggregatorInput,
                 output=Price,
                 errors=PRICE_DATA_ERROR_DESC)
 class PoolPriceAggregator(Model):
+    @staticmethod
+    def pool_columns(pool_price_infos: List[PoolPriceInfo]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pools' prices and liquidity as float64 arrays
+        """
+        n_pools = len(pool_price_infos)
+        prices = np.fromiter((p.price for p in pool_price_infos),
+                             dtype=np.float64, count=n_pools)
+        liquidity = np.fromiter((p.liquidity for p in pool_price_infos),
+                                dtype=np.float64, count=n_pools)
+        return prices, liquidity
+
+    @staticmethod
+    def weighted_price(prices: np.ndarray,
+                       liquidity: np.ndarray,
+                       weight_power: float,
+                       weight_scheme: str = 'liquidity',
+                       trim_fraction: float = 0.1) -> float:
+        """
+        Aggregate pools' prices with weights of liquidity ** weight_power
+        - liquidity: weighted mean
+        - median: weighted median
+        - trimmed: weighted mean of the pools within the
+                   [trim_fraction, 1 - trim_fraction] range of cumulative weights
+        """
+        if prices.shape[0] == 1:
+            return float(prices[0])
+
+        weights = liquidity ** weight_power
+        if weight_scheme == 'liquidity':
+            return float((prices * weights).sum() / weights.sum())
+
+        order = np.argsort(prices, kind='stable')
+        sorted_prices = prices[order]
+        sorted_weights = weights[order]
+        cum_weights = np.cumsum(sorted_weights)
+        total_weight = cum_weights[-1]
+        upper = cum_weights / total_weight
+        lower = (cum_weights - sorted_weights) / total_weight
+
+        if weight_scheme == 'median':
+            return float(sorted_prices[min(np.searchsorted(upper, 0.5), len(upper) - 1)])
+
+        keep = (upper > trim_fraction) & (lower < 1 - trim_fraction)
+        return float((sorted_prices[keep] * sorted_weights[keep]).sum() /
+                     sorted_weights[keep].sum())
+
     def run(self, input: PoolPriceAggregatorInput) -> Price:
         if len(input.pool_price_infos) == 0:
             raise ModelDataError(f'No pool to aggregate for {input.token}')
 
-        df = pd.DataFrame(input.dict()['pool_price_infos'])
-
-        if len(input.pool_price_infos) == 1:
-            return Price(price=input.pool_price_infos[0].price, src=input.price_src)
-
-        product_of_price_liquidity = (df.price * df.liquidity ** input.weight_power).sum()
-        sum_of_liquidity = (df.liquidity ** input.weight_power).sum()
-        price = product_of_price_liquidity / sum_of_liquidity
+        prices, liquidity = self.pool_columns(input.pool_price_infos)
+        price = self.weighted_price(prices,
+                                    liquidity,
+                                    input.weight_power,
+                                    input.weight_scheme,
+                                    input.trim_fraction)
         return Price(price=price, src=input.price_src)
 
 
@@ -75,11 +142,13 @@ class PriceWeight:
 class UniswapV3GetAveragePrice(Model, PriceWeight):
     def run(self, input: Token) -> Price:
         pool_price_infos = self.context.run_model('uniswap-v3.get-pool-price-info',
-                                                  input=input)
-        pool_aggregator_input = PoolPriceAggregatorInput(token=input,
-                                                         **pool_price_infos,
-                                                         price_src=self.slug,
-                                                         weight_power=self.WEIGHT_POWER)
+                                                  input=input,
+                                                  return_type=PoolPriceInfos)
+        pool_aggregator_input = PoolPriceAggregatorInput(
+            token=input,
+            pool_price_infos=pool_price_infos.pool_price_infos,
+            price_src=self.slug,
+            weight_power=self.WEIGHT_POWER)
         return self.context.run_model('price.pool-aggregator',
                                       input=pool_aggregator_input,
                                       return_type=Price)
@@ -95,11 +164,13 @@ class UniswapV3GetAveragePrice(Model, PriceWeight):
 class UniswapV2GetAveragePrice(Model, PriceWeight):
     def run(self, input: Token) -> Price:
         pool_price_infos = self.context.run_model('uniswap-v2.get-pool-price-info',
-                                                  input=input)
-        pool_aggregator_input = PoolPriceAggregatorInput(token=input,
-                                                         **pool_price_infos,
-                                                         price_src=self.slug,
-                                                         weight_power=self.WEIGHT_POWER)
+                                                  input=input,
+                                                  return_type=PoolPriceInfos)
+        pool_aggregator_input = PoolPriceAggregatorInput(
+            token=input,
+            pool_price_infos=pool_price_infos.pool_price_infos,
+            price_src=self.slug,
+            weight_power=self.WEIGHT_POWER)
         return self.context.run_model('price.pool-aggregator',
                                       input=pool_aggregator_input,
                                       return_type=Price)
@@ -115,11 +186,13 @@ class UniswapV2GetAveragePrice(Model, PriceWeight):
 class SushiV2GetAveragePrice(Model, PriceWeight):
     def run(self, input: Token) -> Price:
         pool_price_infos = self.context.run_model('sushiswap.get-pool-price-info',
-                                                  input=input)
-        pool_aggregator_input = PoolPriceAggregatorInput(token=input,
-                                                         **pool_price_infos,
-                                                         price_src=self.slug,
-                                                         weight_power=self.WEIGHT_POWER)
+                                                  input=input,
+                                                  return_type=PoolPriceInfos)
+        pool_aggregator_input = PoolPriceAggregatorInput(
+            token=input,
+            pool_price_infos=pool_price_infos.pool_price_infos,
+            price_src=self.slug,
+            weight_power=self.WEIGHT_POWER)
         return self.context.run_model('price.pool-aggregator',
                                       input=pool_aggregator_input,
                                       return_type=Price)
@@ -148,7 +221,7 @@ class TokenPoolPriceInfo(Model):
 
 
 @ Model.describe(slug='token.price',
-                 version='1.1',
+                 version='1.2',
                  display_name='Token Price - weighted by liquidity',
                  description='The Current Credmark Supported Price Algorithm',
                  developer='Credmark',
@@ -164,7 +237,8 @@ class TokenPriceModel(Model, PriceWeight):
         all_pool_infos = self.context.run_model('token.pool-price-info',
                                                 input=input,
                                                 return_type=PoolPriceInfos)
-        non_zero_pools = {ii.src for ii in all_pool_infos.pool_price_infos if ii.liquidity > 0}
+        non_zero_pools = sorted({ii.src for ii in all_pool_infos.pool_price_infos
+                                 if ii.liquidity > 0})
         pool_aggregator_input = PoolPriceAggregatorInput(
             token=input,
             pool_price_infos=all_pool_infos.pool_price_infos,
@@ -173,3 +247,272 @@ class TokenPriceModel(Model, PriceWeight):
         return self.context.run_model('price.pool-aggregator',
                                       input=pool_aggregator_input,
                                       return_type=Price)
+
+
+@Model.describe(slug='token.price-batch',
+                version='1.1',
+                display_name='Token Price - weighted by liquidity, for a list of tokens',
+                description='The prices of token.price for a list of tokens, '
+                            'with the pools of all tokens read in aggregated calls',
+                developer='Credmark',
+                input=Tokens,
+                output=Prices)
+class TokenPriceBatchModel(Model, PriceWeight):
+    """
+    Return the price of token.price for each of the input tokens.
+
+    The Uniswap v2, SushiSwap and Uniswap v3 pools of all the tokens (and of WETH
+    for the WETH multiplier) are discovered in one multicall, their reserves/slot0
+    are read in a second one and the decimals of the pools' tokens in a third one.
+    The prices are then aggregated with the formula of price.pool-aggregator.
+    """
+
+    UNISWAP_V2_SRC = 'uniswap-v2.get-pool-price-info'
+    SUSHISWAP_SRC = 'sushiswap.get-pool-price-info'
+    UNISWAP_V3_SRC = 'uniswap-v3.get-pool-price-info'
+
+    V2_FACTORY_ADDRESS = {
+        UNISWAP_V2_SRC: {k: UNISWAP_V2_FACTORY_ADDRESS for k in [1, 3, 4, 5, 42]},
+        SUSHISWAP_SRC: {
+            1: SUSHISWAP_FACTORY_ADDRESS,
+        } | {
+            k: '0xc35DADB65012eC5796536bD9864eD8773aBc74C4' for k in [3, 4, 5, 42]
+        },
+    }
+    V3_FACTORY_ADDRESS = {1: UNISWAP_V3_FACTORY_ADDRESS}
+    V3_FEES = [100, 500, 3000, 10000]
+
+    # Primary tokens in the order used by uniswap-v2/sushiswap.get-pools and uniswap-v3.get-pools
+    V2_PRIMARY_TOKENS = [USDC_ADDRESS, USDT_ADDRESS, WETH9_ADDRESS, DAI_ADDRESS]
+    V3_PRIMARY_TOKENS = [DAI_ADDRESS, USDT_ADDRESS, WETH9_ADDRESS, USDC_ADDRESS]
+
+    def discover_pools(self, addresses):
+        """
+        Returns the list of (src, token address, pool address) for all tokens,
+        ordered by source, token and primary token like token.pool-price-info.
+        """
+        v2_factory = get_contract_factory(self.context.web3, 'UNISWAP_V2_FACTORY_ABI')
+        v3_factory = get_contract_factory(self.context.web3, 'UNISWAP_V3_FACTORY_ABI')
+
+        lookups = []
+        for src in [self.UNISWAP_V2_SRC, self.SUSHISWAP_SRC]:
+            factory_addr = self.V2_FACTORY_ADDRESS[src].get(self.context.chain_id)
+            if factory_addr is None:
+                continue
+            factory = v2_factory(address=Address(factory_addr).checksum)
+            for addr in addresses:
+                for primary in self.V2_PRIMARY_TOKENS:
+                    lookups.append((src, addr, factory.functions.getPair(
+                        addr.checksum, Address(primary).checksum)))
+
+        factory_addr = self.V3_FACTORY_ADDRESS.get(self.context.chain_id)
+        if factory_addr is not None:
+            factory = v3_factory(address=Address(factory_addr).checksum)
+            for addr in addresses:
+                for fee in self.V3_FEES:
+                    for primary in self.V3_PRIMARY_TOKENS:
+                        if Address(primary) != addr:
+                            lookups.append((self.UNISWAP_V3_SRC, addr, factory.functions.getPool(
+                                addr.checksum, Address(primary).checksum, fee)))
+
+        pool_addresses = multicall(self.context, [func for _, _, func in lookups])
+        return [(src, addr, Address(pool_addr))
+                for (src, addr, _), pool_addr in zip(lookups, pool_addresses)
+                if pool_addr is not None and Address(pool_addr) != Address.null()]
+
+    def read_pools(self, pools):
+        """
+        Returns {pool address: (state, token0, token1)} with state as
+        getReserves() for V2 pools and (slot0(), liquidity()) for V3 pools.
+        """
+        unique_pools = list(dict.fromkeys((src, pool_addr) for src, _, pool_addr in pools))
+        v2_pool = get_contract_factory(self.context.web3, 'UNISWAP_V2_POOL_ABI')
+        v3_pool = get_contract_factory(self.context.web3, 'UNISWAP_V3_POOL_ABI')
+
+        funcs = []
+        for src, pool_addr in unique_pools:
+            if src == self.UNISWAP_V3_SRC:
+                pool = v3_pool(address=pool_addr.checksum)
+                funcs.extend([pool.functions.slot0(), pool.functions.liquidity()])
+            else:
+                pool = v2_pool(address=pool_addr.checksum)
+                funcs.extend([pool.functions.getReserves(), pool.functions.getReserves()])
+            funcs.extend([pool.functions.token0(), pool.functions.token1()])
+
+        results = multicall(self.context, funcs)
+        pool_states = {}
+        for n, (src, pool_addr) in enumerate(unique_pools):
+            state0, state1, token0, token1 = results[4*n:4*n+4]
+            if token0 is None or token1 is None:
+                continue
+            state = (state0, state1) if src == self.UNISWAP_V3_SRC else state0
+            pool_states[pool_addr] = (state, Address(token0), Address(token1))
+        return pool_states
+
+    def read_decimals(self, token_addresses):
+        token_addresses = list(dict.fromkeys(token_addresses))
+        metadata = get_token_metadata(self.context, token_addresses, require_decimals=False)
+        return {addr: token_metadata['decimals']
+                for addr, token_metadata in zip(token_addresses, metadata)}
+
+    def run(self, input: Tokens) -> Prices:
+        weth_address = Address(WETH9_ADDRESS)
+        input_addresses = [Address(t.address) if t.address else None for t in input]
+        addresses = list(dict.fromkeys(addr for addr in input_addresses if addr is not None))
+        if weth_address not in addresses:
+            addresses.append(weth_address)
+
+        pools = self.discover_pools(addresses)
+        pool_states = self.read_pools(pools)
+        decimals = self.read_decimals([token_addr
+                                       for _, token0, token1 in pool_states.values()
+                                       for token_addr in (token0, token1)])
+
+        srcs = [self.UNISWAP_V2_SRC, self.SUSHISWAP_SRC, self.UNISWAP_V3_SRC]
+        token_idx, src_idx, raw_prices, liquidity, with_weth = [], [], [], [], []
+
+        for src, addr, pool_addr in pools:
+            if pool_addr not in pool_states:
+                continue
+            state, token0, token1 = pool_states[pool_addr]
+            decimals0, decimals1 = decimals[token0], decimals[token1]
+
+            if src == self.UNISWAP_V3_SRC:
+                # Same as uniswap-v3.get-pool-info/get-pool-price-info
+                if not decimals0 or not decimals1:
+                    continue
+                slot0, pool_liquidity = state
+                tick = slot0[1]
+                sp = (1.0001 ** tick) ** 0.5
+                scale_multiplier = (10 ** (decimals0 - decimals1))
+                price = 1.0001 ** tick * scale_multiplier
+                pool_liquidity_token = (pool_liquidity * sp) / (10 ** decimals1)
+                if addr == token1:
+                    price = 1 / price
+                    pool_liquidity_token = (pool_liquidity / sp) / (10 ** decimals0)
+            else:
+                # Same as UniswapPoolPriceInfoMeta.get_pool_price_infos, which skips
+                # the pools never minted and fails with ZeroDivisionError when the reserve
+                # of the token is 0. Those pools are skipped here instead.
+                if state is None or state == [0, 0, 0]:
+                    continue
+                if decimals0 is None or decimals1 is None:
+                    continue
+                if state[0 if addr == token0 else 1] == 0:
+                    continue
+                scaled_reserve0 = state[0] / (10 ** decimals0)
+                scaled_reserve1 = state[1] / (10 ** decimals1)
+                if addr == token0:
+                    price = scaled_reserve1 / scaled_reserve0
+                    pool_liquidity_token = scaled_reserve0
+                else:
+                    price = scaled_reserve0 / scaled_reserve1
+                    pool_liquidity_token = scaled_reserve1
+
+            token_idx.append(addresses.index(addr))
+            src_idx.append(srcs.index(src))
+            raw_prices.append(price)
+            liquidity.append(pool_liquidity_token)
+            with_weth.append(addr != weth_address and weth_address in (token0, token1))
+
+        token_idx = np.array(token_idx, dtype=int)
+        src_idx = np.array(src_idx, dtype=int)
+        raw_prices = np.array(raw_prices, dtype=float)
+        liquidity = np.array(liquidity, dtype=float)
+        with_weth = np.array(with_weth, dtype=bool)
+
+        # WETH price of each source, i.e. {uniswap-v2,sushiswap,uniswap-v3}.get-weighted-price
+        weth_rows = token_idx == addresses.index(weth_address)
+        weth_prices = np.full(len(srcs), np.nan)
+        for n_src in range(len(srcs)):
+            rows = weth_rows & (src_idx == n_src)
+            if rows.any():
+                weth_prices[n_src] = PoolPriceAggregator.weighted_price(
+                    raw_prices[rows], liquidity[rows], self.WEIGHT_POWER)
+
+        pool_prices = np.where(with_weth, raw_prices * weth_prices[src_idx], raw_prices)
+
+        token_prices = {}
+        for n_addr, addr in enumerate(addresses):
+            rows = token_idx == n_addr
+            if not rows.any():
+                continue
+            price = PoolPriceAggregator.weighted_price(
+                pool_prices[rows], liquidity[rows], self.WEIGHT_POWER)
+            if np.isnan(price):
+                continue
+            non_zero_pools = sorted({srcs[n_src] for n_src in src_idx[rows & (liquidity > 0)]})
+            # Same source as token.price
+            token_prices[addr] = (price, f'token.price:{"|".join(non_zero_pools)}')
+
+        prices = [token_prices.get(addr, (None, None)) for addr in input_addresses]
+        return Prices(tokenAddresses=[addr if addr is not None else Address.null()
+                                      for addr in input_addresses],
+                      prices=[p for p, _ in prices],
+                      srcs=[s for _, s in prices])
+
+
+@Model.describe(slug='token.price-batch-check',
+                version='1.0',
+                display_name='Token Price - check token.price-batch against token.price',
+                description='Run token.price-batch and token.price for each token '
+                            'and fail if a price or a source differs',
+                developer='Credmark',
+                input=Tokens,
+                output=Prices)
+class TokenPriceBatchCheck(Model):
+    def run(self, input: Tokens) -> Prices:
+        batch_prices = self.context.run_model('token.price-batch',
+                                              input=input,
+                                              return_type=Prices)
+        for token, batch_price, batch_src in zip(input, batch_prices.prices, batch_prices.srcs):
+            price = self.context.run_model('token.price', input=token, return_type=Price)
+            same_price = (batch_price == price.price if None in (batch_price, price.price)
+                          else np.isclose(batch_price, price.price))
+            if batch_src != price.src or not same_price:
+                raise ModelRunError(
+                    f'token.price-batch gives {(batch_price, batch_src)} for {token.address}, '
+                    f'token.price gives {(price.price, price.src)}')
+        return batch_prices
+
+
+# (slug, version) of the models run for the prices of a price model, and functions
+# whose modules' code the prices depend on, see price_model_version
+PRICE_MODEL_DEPENDENCIES = {
+    'token.price': [('token.price', '1.2'),
+                    ('token.price-batch', '1.1'),
+                    ('token.pool-price-info', '1.1'),
+                    ('price.pool-aggregator', '1.2'),
+                    ('uniswap-v2.get-weighted-price', '1.1'),
+                    ('sushiswap.get-weighted-price', '1.1'),
+                    ('uniswap-v3.get-weighted-price', '1.1'),
+                    ('uniswap-v2.get-pools', '1.1'),
+                    ('uniswap-v2.get-pool-price-info', '1.1'),
+                    ('sushiswap.get-pools', '1.1'),
+                    ('sushiswap.get-pool-price-info', '1.1'),
+                    ('uniswap-v3.get-pools', '1.2'),
+                    ('uniswap-v3.get-pool-info-batch', '1.1'),
+                    ('uniswap-v3.get-pool-price-info', '1.2')],
+}
+
+PRICE_MODEL_CODE = {
+    'token.price': [multicall, get_token_metadata],
+}
+
+
+@lru_cache(maxsize=None)
+def price_model_version(slug: str) -> Optional[str]:
+    """
+    Version of the prices of a price model, from the versions of the model and of the
+    models it runs, and a hash of the code of the utility modules they use, e.g.
+    'token.price@1.2|token.price-batch@1.1|...|code@3f2a9c1d0b7e'.
+    None for a price model not listed in PRICE_MODEL_DEPENDENCIES.
+    """
+    models = PRICE_MODEL_DEPENDENCIES.get(slug)
+    if models is None:
+        return None
+    code_hash = hashlib.sha256()
+    for func in PRICE_MODEL_CODE.get(slug, []):
+        code_hash.update(inspect.getsource(inspect.getmodule(func)).encode())
+    return '|'.join([f'{model_slug}@{version}' for model_slug, version in models] +
+                    [f'code@{code_hash.hexdigest()[:12]}'])
@@ -0,0 +1,66 @@
+from credmark.cmf.model import Model
+from credmark.cmf.model.errors import ModelDataError, ModelRunError
+from credmark.cmf.types import Price, Tokens
+
+from models.credmark.tokens.price import price_model_version
+from models.dtos.price import Prices, StoredPricesInput
+from models.utils.price_store import PRICE_STORE
+
+
+@Model.describe(slug='token.price-batch-stored',
+                version='1.0',
+                display_name='Token Price - for a list of tokens, from the local price store',
+                description='Prices of a list of tokens read from the local price store, '
+                            'with the missing ones computed by the price model',
+                developer='Credmark',
+                input=StoredPricesInput,
+                output=Prices)
+class TokenPriceBatchStored(Model):
+    """
+    Prices of the tokens at the block, read from the local price store. The prices
+    missing from the store are computed in one token.price-batch run for token.price,
+    or token by token by another price model. A token that cannot be priced has the
+    price None.
+
+    The computed prices are not added to the store by this model: the caller adds the
+    prices of a whole historical series at once, see finance.var-portfolio-historical.
+    """
+
+    def run(self, input: StoredPricesInput) -> Prices:
+        chain_id = self.context.chain_id
+        block_number = int(self.context.block_number)
+        version = price_model_version(input.price_model)
+
+        tokens = list(input)
+        found = {}
+        if version is not None:
+            for token in tokens:
+                stored = PRICE_STORE.get_prices(chain_id, input.price_model, version,
+                                                token.address, [block_number])
+                if block_number in stored:
+                    found[token.address] = stored[block_number]
+
+        missing = [token for token in tokens if token.address not in found]
+        if len(missing) > 0 and input.price_model == 'token.price':
+            batch_prices = self.context.run_model('token.price-batch',
+                                                  input=Tokens(tokens=missing),
+                                                  return_type=Prices)
+            for token, price, src in zip(missing, batch_prices.prices, batch_prices.srcs):
+                if price is not None:
+                    found[token.address] = (price, src)
+        else:
+            for token in missing:
+                try:
+                    price = self.context.run_model(input.price_model,
+                                                   input=token,
+                                                   return_type=Price)
+                except (ModelRunError, ModelDataError) as err:
+                    self.logger.error(f'Failed to price {token.address}: {err}')
+                    continue
+                if price.price is not None:
+                    found[token.address] = (price.price, price.src)
+
+        prices = [found.get(token.address, (None, None)) for token in tokens]
+        return Prices(tokenAddresses=[token.address for token in tokens],
+                      prices=[price for price, _src in prices],
+                      srcs=[src for _price, src in prices])
@@ -1,5 +1,5 @@
 # pylint: disable=locally-disabled, unused-import
-from typing import List
+from typing import List, Optional
 
 from credmark.cmf.model import Model
 from credmark.cmf.model.errors import ModelDataError
@@ -13,6 +13,9 @@ from credmark.cmf.types import (
 
 from credmark.dto import DTO, IterableListGenericDTO
 
+from models.dtos.price import PriceCacheStats
+from models.utils.price_cache import PRICE_CACHE
+
 
 @Model.describe(
     slug="token.info",
@@ -102,27 +105,28 @@ class CategorizedSupplyResponse(CategorizedSupplyRequest):
     _iterator: str = 'categories'
     circulatingSupplyScaled: float = 0.0
     circulatingSupplyUsd: float = 0.0
+    price_cache: Optional[PriceCacheStats] = None
 
 
 @Model.describe(slug='token.categorized-supply',
-                version='1.0',
+                version='1.1',
                 display_name='Token Categorized Supply',
                 description='The categorized supply for a token',
                 input=CategorizedSupplyRequest,
                 output=CategorizedSupplyResponse)
 class TokenCirculatingSupply(Model):
     def run(self, input: CategorizedSupplyRequest) -> CategorizedSupplyResponse:
+        cache_start = PRICE_CACHE.counters()
         response = CategorizedSupplyResponse(**input.dict())
         total_supply_scaled = input.token.scaled(input.token.total_supply)
-        token_price = Price(**self.context.models.token.price(input.token))
-        if token_price is None:
+        token_price = PRICE_CACHE.get_price(self.context, 'token.price', input.token)
+        if token_price.price is None:
             raise ModelDataError(f"No Price for {response.token}")
         for c in response.categories:
             for account in c.accounts:
                 bal = response.token.functions.balanceOf(account.address).call()
                 c.amountScaled += response.token.scaled(bal)
-            if token_price is not None and token_price.price is not None:
-                c.valueUsd = c.amountScaled * token_price.price
+            c.valueUsd = c.amountScaled * token_price.price
         response.categories.append(CategorizedSupplyResponse.CategorizedSupplyCategory(
             accounts=Accounts(accounts=[]),
             categoryName='uncategorized',
@@ -135,4 +139,5 @@ class TokenCirculatingSupply(Model):
         if isinstance(token_price.price, float):
             if isinstance(response.circulatingSupplyScaled, float):
                 response.circulatingSupplyUsd = response.circulatingSupplyScaled * token_price.price
+        response.price_cache = PRICE_CACHE.run_stats(cache_start)
         return response
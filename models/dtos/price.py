@@ -1,6 +1,6 @@
 
-from typing import List
-from credmark.cmf.types import Address, Token
+from typing import List, Literal, Optional
+from credmark.cmf.types import Address, Token, Tokens
 from credmark.dto import DTO, DTOField, IterableListGenericDTO, PrivateAttr
 
 
@@ -33,12 +33,52 @@ class PoolPriceInfo(DTO):
     pool_address: Address
 
 
+class PriceCacheStats(DTO):
+    """
+    Lookups of the price cache during a model run, including the models it runs
+    @hits: prices found in the cache
+    @misses: prices computed
+    """
+    hits: int
+    misses: int
+
+
 class PoolPriceInfos(IterableListGenericDTO[PoolPriceInfo]):
     pool_price_infos: List[PoolPriceInfo] = []
+    price_cache: Optional[PriceCacheStats] = None
     _iterator: str = PrivateAttr('pool_price_infos')
 
 
 class PoolPriceAggregatorInput(PoolPriceInfos):
+    """
+    @weight_power: pools are weighted by liquidity ** weight_power
+    @weight_scheme: liquidity - weighted mean of pools' prices,
+                    median - weighted median of pools' prices,
+                    trimmed - weighted mean of pools' prices without the pools
+                    in the lowest and highest trim_fraction of the weights
+    @trim_fraction: fraction of the weights trimmed on each side for the trimmed scheme
+    """
     token: Token
     weight_power: float = DTOField(1.0, ge=1.0)
+    weight_scheme: Literal['liquidity', 'median', 'trimmed'] = DTOField('liquidity')
+    trim_fraction: float = DTOField(0.1, ge=0.0, lt=0.5)
     price_src: str
+
+
+class Prices(DTO):
+    """
+    Prices of a list of tokens, stored column-wise
+    @tokenAddresses: tokens' addresses
+    @prices: token's price, None if there is no pool to price the token
+    @srcs: source of the price
+    """
+    tokenAddresses: List[Address] = []
+    prices: List[Optional[float]] = []
+    srcs: List[Optional[str]] = []
+
+
+class StoredPricesInput(Tokens):
+    """
+    @price_model: slug of the price model of the stored prices
+    """
+    price_model: str = DTOField('token.price', description='price model slug')
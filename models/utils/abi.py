@@ -0,0 +1,46 @@
+import gzip
+import json
+import os
+from functools import lru_cache
+from typing import List
+
+ABI_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'abis')
+ABI_SUFFIX = '.json.gz'
+
+
+@lru_cache(maxsize=1)
+def abi_names() -> List[str]:
+    """
+    Names of the ABIs in models/abis, e.g. 'ERC_20_ABI'
+    """
+    return sorted(f[:-len(ABI_SUFFIX)] for f in os.listdir(ABI_DIR) if f.endswith(ABI_SUFFIX))
+
+
+@lru_cache(maxsize=None)
+def get_abi_json(name: str) -> str:
+    """
+    ABI as JSON text, e.g. for Contract(address=..., abi=get_abi_json('ERC_20_ABI')).
+    Decompressed on first access and then shared.
+    """
+    with gzip.open(os.path.join(ABI_DIR, name + ABI_SUFFIX), 'rt', encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def get_abi(name: str) -> list:
+    """
+    Parsed ABI, parsed on first access and then shared. Do not modify it.
+    """
+    return json.loads(get_abi_json(name))
+
+
+@lru_cache(maxsize=64)
+def get_contract_factory(web3, name: str):
+    """
+    web3 contract class of the ABI for the web3 instance, created once and shared,
+    e.g. get_contract_factory(context.web3, 'ERC_20_ABI')(address=addr).functions.decimals()
+
+    This skips the ABI parsing and metadata lookup of Contract for plain contract
+    calls, e.g. with models.utils.multicall.
+    """
+    return web3.eth.contract(abi=get_abi(name))
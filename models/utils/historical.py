@@ -0,0 +1,175 @@
+import copy
+import json
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Optional, Tuple
+
+from credmark.cmf.types import BlockNumber
+from credmark.cmf.types.series import BlockSeries
+from credmark.dto import DTO
+
+from models.utils.local_store import local_store_root, read_json, write_json
+from models.utils.logs import confirmed_block_number
+
+
+class HistoricalCache:
+    """
+    Process-wide memo of historical series of models, see run_model_historical, and of
+    the block of a timestamp, keyed by (chain_id, timestamp). The blocks of timestamps
+    are also kept in one JSON file per chain in the local store, once the block is
+    confirmed.
+
+    Series are stored and returned as copies, so a caller changing a series does not
+    change the cached one. Series are evicted least-recently-used beyond `maxsize`.
+    """
+
+    def __init__(self, maxsize: int = 256, root: Optional[str] = None):
+        if root is None:
+            root = local_store_root()
+        self.root = root
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._outputs = OrderedDict()
+        self._blocks = {}
+        self._loaded_chains = set()
+        self._lock = Lock()
+
+    def _blocks_path(self, chain_id: int) -> str:
+        return os.path.join(self.root, 'blocks', f'{chain_id}.json')
+
+    def _load_blocks(self, chain_id: int):
+        # Called with the lock held
+        if chain_id in self._loaded_chains:
+            return
+        stored = read_json(self._blocks_path(chain_id)) or {}
+        for timestamp, block in stored.items():
+            self._blocks.setdefault((chain_id, int(timestamp)), tuple(block))
+        self._loaded_chains.add(chain_id)
+
+    def get_output(self, key):
+        with self._lock:
+            if key in self._outputs:
+                self._outputs.move_to_end(key)
+                self.hits += 1
+                return True, copy.deepcopy(self._outputs[key])
+            self.misses += 1
+            return False, None
+
+    def set_output(self, key, output):
+        with self._lock:
+            self._outputs[key] = copy.deepcopy(output)
+            self._outputs.move_to_end(key)
+            while len(self._outputs) > self.maxsize:
+                self._outputs.popitem(last=False)
+
+    def get_blocks(self, context, timestamps: List[int]) -> List[Tuple[int, int]]:
+        """
+        (block_number, block_timestamp) of the last block at or before each timestamp,
+        with the ones missing from the cache looked up with BlockNumber.from_timestamp.
+        """
+        chain_id = context.chain_id
+        keys = [(chain_id, int(timestamp)) for timestamp in timestamps]
+        with self._lock:
+            self._load_blocks(chain_id)
+            found = {key: self._blocks[key] for key in keys if key in self._blocks}
+
+        new_blocks = {}
+        for key in keys:
+            if key not in found and key not in new_blocks:
+                block_number = BlockNumber.from_timestamp(key[1])
+                new_blocks[key] = (int(block_number), int(block_number.timestamp))
+
+        found.update(new_blocks)
+
+        # A block near the chain head may still be reorganized, so it is not kept
+        if len(new_blocks) > 0:
+            confirmed = confirmed_block_number(context)
+            new_blocks = {key: block for key, block in new_blocks.items()
+                          if block[0] <= confirmed}
+        if len(new_blocks) > 0:
+            with self._lock:
+                self._blocks.update(new_blocks)
+                stored = read_json(self._blocks_path(chain_id)) or {}
+                stored.update({str(timestamp): list(block)
+                               for (_chain_id, timestamp), block in new_blocks.items()})
+                write_json(stored, self._blocks_path(chain_id))
+        return [found[key] for key in keys]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'size': len(self._outputs),
+                    'maxsize': self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._outputs.clear()
+            self._blocks.clear()
+            self._loaded_chains.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+HISTORICAL_CACHE = HistoricalCache()
+
+
+def _args_value(value):
+    if isinstance(value, DTO):
+        return value.dict()
+    if isinstance(value, type):
+        return f'{value.__module__}.{value.__qualname__}'
+    return str(value)
+
+
+def _args_key(historical_args: dict) -> str:
+    return json.dumps(historical_args, sort_keys=True, default=_args_value)
+
+
+def historical_sample_timestamps(context,
+                                 window: str,
+                                 interval: str = '1 day',
+                                 end_timestamp: Optional[int] = None) -> List[int]:
+    """
+    Sample timestamps of a window, in ascending order, ending at end_timestamp
+    (the context's block time by default) and going back every interval,
+    e.g. 31 timestamps for window='30 days' and interval='1 day'.
+    """
+    window_seconds = context.historical.range_timestamp(
+        *context.historical.parse_timerangestr(window))
+    interval_seconds = context.historical.range_timestamp(
+        *context.historical.parse_timerangestr(interval))
+    if end_timestamp is None:
+        end_timestamp = context.block_number.timestamp
+    end_timestamp = int(end_timestamp)
+
+    n_intervals = window_seconds // interval_seconds
+    return [end_timestamp - n * interval_seconds for n in range(n_intervals, -1, -1)]
+
+
+def run_model_historical(context,
+                         model_slug: str,
+                         cache: Optional[HistoricalCache] = None,
+                         **historical_args) -> BlockSeries:
+    """
+    context.historical.run_model_historical(model_slug, **historical_args), i.e. the
+    framework's historical run with its sample blocks, e.g. with the arguments window,
+    interval, end_timestamp, model_input, model_return_type and model_version.
+
+    With a cache, the series is memoized by (chain_id, the context's block number,
+    model slug, arguments), so the same historical run, e.g. of a model requested
+    again at the same block, is only evaluated once in a process. The arguments
+    include model_version; without it, the latest version loaded in the process runs.
+    """
+    if cache is None:
+        return context.historical.run_model_historical(model_slug, **historical_args)
+
+    key = (context.chain_id, int(context.block_number), model_slug,
+           _args_key(historical_args))
+    found, series = cache.get_output(key)
+    if not found:
+        series = context.historical.run_model_historical(model_slug, **historical_args)
+        cache.set_output(key, series)
+    return series
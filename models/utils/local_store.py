@@ -0,0 +1,107 @@
+import json
+import logging
+import os
+import uuid
+from threading import Lock
+from typing import Any, Callable, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Directory of the local store, e.g. CREDMARK_LOCAL_STORE=/data/credmark
+LOCAL_STORE_ENV = 'CREDMARK_LOCAL_STORE'
+DEFAULT_LOCAL_STORE = os.path.join(os.path.expanduser('~'), '.credmark', 'local_store')
+
+logger = logging.getLogger(__name__)
+
+# Writes to the store are best-effort: the store is disabled for the process after
+# the first failed write, e.g. in a container with a read-only home directory.
+_WRITE_STATE = {'enabled': True}
+_WRITE_LOCK = Lock()
+
+
+def local_store_root() -> str:
+    """
+    Directory of the local store of values at past blocks
+    """
+    return os.environ.get(LOCAL_STORE_ENV, DEFAULT_LOCAL_STORE)
+
+
+def read_parquet(path: str) -> Optional[pa.Table]:
+    """
+    Memory-mapped Parquet table, or None if the file is missing or cannot be read.
+    """
+    if not os.path.isfile(path):
+        return None
+    try:
+        return pq.read_table(path, memory_map=True)
+    except (OSError, pa.ArrowException):
+        # A damaged file is recomputed and replaced on the next write.
+        return None
+
+
+def local_store_writable() -> bool:
+    """
+    False once a write to the local store has failed in this process
+    """
+    return _WRITE_STATE['enabled']
+
+
+def _write_atomic(path: str, write: Callable[[str], None]) -> bool:
+    """
+    Call write(tmp_path) and move the temporary file to path, so readers in other
+    processes see either the old or the new file. Returns False, and disables later
+    writes, if the store cannot be written.
+    """
+    if not _WRITE_STATE['enabled']:
+        return False
+
+    tmp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write(tmp_path)
+        os.replace(tmp_path, path)
+        return True
+    except OSError as err:
+        with _WRITE_LOCK:
+            if _WRITE_STATE['enabled']:
+                logger.warning(f'Local store disabled, failed to write {path}: {err}')
+            _WRITE_STATE['enabled'] = False
+        return False
+    finally:
+        try:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def write_parquet(table: pa.Table, path: str) -> bool:
+    """
+    Write the table to path atomically, see _write_atomic.
+    """
+    return _write_atomic(path, lambda tmp_path: pq.write_table(table, tmp_path))
+
+
+def read_json(path: str) -> Optional[Any]:
+    """
+    Parsed JSON file, or None if the file is missing or cannot be read.
+    """
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(value: Any, path: str) -> bool:
+    """
+    Write the value as JSON to path atomically, see _write_atomic.
+    """
+    def _write(tmp_path):
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f)
+
+    return _write_atomic(path, _write)
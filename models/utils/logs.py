@@ -0,0 +1,345 @@
+import os
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+from hexbytes import HexBytes
+from web3._utils.events import get_event_data
+from web3._utils.filters import construct_event_filter_params
+
+from models.utils.local_store import (
+    local_store_root,
+    read_json,
+    read_parquet,
+    write_json,
+    write_parquet,
+)
+
+# Block range of the first eth_getLogs request, and the bounds of the adapted range
+GET_LOGS_CHUNK_SIZE = 2000
+GET_LOGS_MAX_CHUNK_SIZE = 100000
+
+# Blocks this close to the chain head may still be reorganized, so the logs of
+# later blocks are read again on each request instead of being stored
+CONFIRMATION_BLOCKS = 64
+
+# A uint256 word is split into 8 uint32 limbs, so sums of limbs fit in uint64
+LIMBS_PER_WORD = 8
+LIMB_BITS = 32
+
+
+def iter_logs_chunked(context,
+                      event_abi: dict,
+                      address: str,
+                      from_block: int,
+                      to_block: int,
+                      chunk_size: int = GET_LOGS_CHUNK_SIZE,
+                      max_chunk_size: int = GET_LOGS_MAX_CHUNK_SIZE
+                      ) -> Iterator[Tuple[int, int, List[dict]]]:
+    """
+    Raw logs of the event emitted by the address in [from_block, to_block],
+    as (chunk_from_block, chunk_to_block, logs) for consecutive block ranges.
+
+    The block range of a request is halved when the node rejects it, e.g. for
+    too many results or a timeout, and doubled after a success, up to max_chunk_size.
+    """
+    _data_filter_set, filter_params = construct_event_filter_params(
+        abi_codec=context.web3.codec,
+        event_abi=event_abi,
+        address=address)
+
+    start = from_block
+    while start <= to_block:
+        end = min(start + chunk_size - 1, to_block)
+        try:
+            logs = context.web3.eth.get_logs({**filter_params,
+                                              'fromBlock': start,
+                                              'toBlock': end})
+        except (ValueError, IOError):
+            if chunk_size == 1:
+                raise
+            chunk_size = max(1, chunk_size // 2)
+            continue
+
+        yield start, end, logs
+        start = end + 1
+        chunk_size = min(chunk_size * 2, max_chunk_size)
+
+
+def confirmed_block_number(context) -> int:
+    """
+    Last block of the chain considered final, CONFIRMATION_BLOCKS before the head
+    """
+    return int(context.web3.eth.block_number) - CONFIRMATION_BLOCKS
+
+
+def uint256_limbs(logs: List[dict], n_words: int) -> np.ndarray:
+    """
+    The first n_words uint256 words of the data of each log, as an array of
+    shape (logs, n_words, LIMBS_PER_WORD) of uint32 limbs, most significant first,
+    widened to uint64 so they can be summed without overflow.
+    """
+    n_bytes = 32 * n_words
+    data = b''.join(bytes(HexBytes(log['data']))[:n_bytes] for log in logs)
+    return (np.frombuffer(data, dtype='>u4')
+            .reshape(len(logs), n_words, LIMBS_PER_WORD)
+            .astype(np.uint64))
+
+
+def limbs_to_int(limbs) -> int:
+    """
+    Exact integer of a sequence of limb sums, most significant first
+    """
+    value = 0
+    for limb in limbs:
+        value = (value << LIMB_BITS) + int(limb)
+    return value
+
+
+def sum_uint256_by_block(logs: List[dict], n_words: int) -> Dict[int, List[int]]:
+    """
+    Exact sums of the first n_words uint256 words of the data of the logs, by block number
+    """
+    if len(logs) == 0:
+        return {}
+
+    block_numbers = np.array([log['blockNumber'] for log in logs], dtype=np.int64)
+    order = np.argsort(block_numbers, kind='stable')
+    block_numbers = block_numbers[order]
+    limbs = uint256_limbs(logs, n_words)[order]
+
+    blocks, starts = np.unique(block_numbers, return_index=True)
+    limb_sums = np.add.reduceat(limbs, starts, axis=0)
+    return {int(block): [limbs_to_int(word) for word in block_sums]
+            for block, block_sums in zip(blocks, limb_sums)}
+
+
+class BlockSumStore:
+    """
+    On-disk checkpoints of per-block sums of event values, e.g. swap amounts,
+    one Parquet file per (chain_id, name, address) with the block numbers of the
+    blocks with events, their sums as decimal strings, and the scanned block range
+    in the file metadata.
+
+    Sums of past blocks do not change, so later requests only read the logs of
+    the blocks outside the scanned range. Blocks older than `retention_blocks`
+    before the last scanned block are dropped.
+    """
+
+    def __init__(self, root: Optional[str] = None, retention_blocks: int = 200000):
+        if root is None:
+            root = local_store_root()
+        self.root = root
+        self.retention_blocks = retention_blocks
+        self._lock = Lock()
+
+    def _path(self, chain_id: int, name: str, address: str) -> str:
+        return os.path.join(self.root, 'block_sums', str(chain_id), name,
+                            f'{str(address).lower()}.parquet')
+
+    def get(self, chain_id: int, name: str, address: str
+            ) -> Tuple[Dict[int, List[int]], Optional[Tuple[int, int]]]:
+        """
+        Stored sums by block number, and the scanned (from_block, to_block), None if not stored.
+        """
+        table = read_parquet(self._path(chain_id, name, address))
+        if table is None or table.schema.metadata is None:
+            return {}, None
+
+        metadata = table.schema.metadata
+        scanned = (int(metadata[b'scanned_from']), int(metadata[b'scanned_to']))
+        sum_columns = [table.column(column).to_pylist()
+                       for column in table.column_names if column != 'block_number']
+        sums = {block_number: [int(column[n]) for column in sum_columns]
+                for n, block_number in enumerate(table.column('block_number').to_pylist())}
+        return sums, scanned
+
+    def put(self,
+            chain_id: int,
+            name: str,
+            address: str,
+            sums: Dict[int, List[int]],
+            scanned: Tuple[int, int],
+            n_words: int):
+        scanned_from = max(scanned[0], scanned[1] - self.retention_blocks)
+        block_numbers = sorted(b for b in sums if scanned_from <= b <= scanned[1])
+
+        columns = {'block_number': pa.array(block_numbers, type=pa.int64())}
+        for word in range(n_words):
+            columns[f'sum_{word}'] = pa.array([str(sums[b][word]) for b in block_numbers],
+                                              type=pa.string())
+        table = pa.table(columns).replace_schema_metadata(
+            {'scanned_from': str(scanned_from), 'scanned_to': str(scanned[1])})
+
+        with self._lock:
+            write_parquet(table, self._path(chain_id, name, address))
+
+
+BLOCK_SUM_STORE = BlockSumStore()
+
+
+def get_block_range_sums(context,
+                         name: str,
+                         event_abi: dict,
+                         address: str,
+                         n_words: int,
+                         block_range: Tuple[int, int],
+                         store: BlockSumStore = BLOCK_SUM_STORE) -> List[int]:
+    """
+    Exact sums over block_range=(from_block, to_block), inclusive, of the first n_words
+    uint256 words of the data of the event emitted by the address, e.g. the amounts of
+    Uniswap v2 Swap events.
+
+    The per-block sums are checkpointed in `store` under `name`, and only the logs of the
+    blocks outside the stored scanned range are read, with iter_logs_chunked. Blocks
+    after confirmed_block_number are not stored, so they are read again next time.
+    A range away from the stored one is scanned without replacing the stored one.
+    """
+    from_block, to_block = block_range
+    chain_id = context.chain_id
+    sums, scanned = store.get(chain_id, name, address)
+
+    persist = True
+    if scanned is None or from_block > scanned[1] + 1 or to_block < scanned[0] - 1:
+        # Nothing stored next to the range, scan it all
+        persist = scanned is None
+        sums = {}
+        ranges = [(from_block, to_block)]
+        scanned = (from_block, to_block)
+    else:
+        ranges = []
+        if from_block < scanned[0]:
+            ranges.append((from_block, scanned[0] - 1))
+        if to_block > scanned[1]:
+            ranges.append((scanned[1] + 1, to_block))
+        scanned = (min(from_block, scanned[0]), max(to_block, scanned[1]))
+
+    for range_from, range_to in ranges:
+        for _chunk_from, _chunk_to, logs in iter_logs_chunked(
+                context, event_abi, address, range_from, range_to):
+            sums.update(sum_uint256_by_block(logs, n_words))
+
+    if persist and len(ranges) > 0:
+        confirmed_to = min(scanned[1], confirmed_block_number(context))
+        if confirmed_to >= scanned[0]:
+            store.put(chain_id, name, address, sums, (scanned[0], confirmed_to), n_words)
+
+    totals = [0] * n_words
+    for block_number, block_sums in sums.items():
+        if from_block <= block_number <= to_block:
+            totals = [total + value for total, value in zip(totals, block_sums)]
+    return totals
+
+
+def _json_value(value):
+    if isinstance(value, (bytes, bytearray)):
+        return HexBytes(value).hex()
+    if isinstance(value, (list, tuple)):
+        return [_json_value(v) for v in value]
+    return value
+
+
+class EventIndex:
+    """
+    On-disk index of the decoded events of a contract, one JSON file per
+    (chain_id, contract address, event name) with the events in block order and
+    the last indexed block. The index is extended from the last indexed block on
+    each request for a later block, and the loaded indexes are kept in memory.
+    Only blocks up to confirmed_block_number are indexed, the events of later blocks
+    are read on each request.
+
+    An event is stored as {'blockNumber': ..., 'logIndex': ..., 'args': {...}}.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        if root is None:
+            root = local_store_root()
+        self.root = root
+        self._indexes = {}
+        self._lock = Lock()
+
+    def _path(self, chain_id: int, address: str, event_name: str) -> str:
+        return os.path.join(self.root, 'events', str(chain_id), str(address).lower(),
+                            f'{event_name}.json')
+
+    def _load(self, path: str) -> dict:
+        index = self._indexes.get(path)
+        if index is None:
+            index = read_json(path)
+            if index is None:
+                index = {'indexed_to': -1, 'events': []}
+            index['by_account'] = {}
+            self._indexes[path] = index
+        return index
+
+    @staticmethod
+    def _read_events(context, event_abi: dict, address: str,
+                     from_block: int, to_block: int) -> List[dict]:
+        n_blocks = to_block - from_block + 1
+        events = []
+        for _chunk_from, _chunk_to, logs in iter_logs_chunked(
+                context, event_abi, address, from_block, to_block,
+                chunk_size=n_blocks, max_chunk_size=n_blocks):
+            for log in logs:
+                event = get_event_data(context.web3.codec, event_abi, log)
+                events.append({
+                    'blockNumber': event['blockNumber'],
+                    'logIndex': event['logIndex'],
+                    'args': {k: _json_value(v) for k, v in event['args'].items()}})
+        return events
+
+    def get_events(self,
+                   context,
+                   event_abi: dict,
+                   address: str,
+                   account: Optional[str] = None,
+                   account_field: str = 'account') -> List[dict]:
+        """
+        Events of the contract up to the context's block, in block order, or only
+        those with args[account_field] == account.
+        """
+        block_number = int(context.block_number)
+        path = self._path(context.chain_id, address, event_abi['name'])
+        index_to = min(block_number, confirmed_block_number(context))
+
+        with self._lock:
+            index = self._load(path)
+            if index['indexed_to'] < index_to:
+                # Another process may have extended the file
+                stored = read_json(path)
+                if stored is not None and stored['indexed_to'] > index['indexed_to']:
+                    index = {**stored, 'by_account': {}}
+                    self._indexes[path] = index
+
+            if index['indexed_to'] < index_to:
+                index['events'].extend(self._read_events(
+                    context, event_abi, address, index['indexed_to'] + 1, index_to))
+                index['indexed_to'] = index_to
+                index['by_account'] = {}
+                write_json({'indexed_to': index['indexed_to'], 'events': index['events']}, path)
+            indexed_to = index['indexed_to']
+
+            if account is None:
+                events = index['events']
+            else:
+                if account_field not in index['by_account']:
+                    by_account = {}
+                    for event in index['events']:
+                        by_account.setdefault(str(event['args'][account_field]).lower(),
+                                              []).append(event)
+                    index['by_account'][account_field] = by_account
+                events = index['by_account'][account_field].get(str(account).lower(), [])
+
+        events = [event for event in events if event['blockNumber'] <= block_number]
+        if indexed_to < block_number:
+            # Blocks not confirmed yet
+            tail = self._read_events(context, event_abi, address, indexed_to + 1, block_number)
+            if account is not None:
+                tail = [event for event in tail
+                        if str(event['args'][account_field]).lower() == str(account).lower()]
+            events.extend(tail)
+        return events
+
+
+EVENT_INDEX = EventIndex()
@@ -0,0 +1,81 @@
+from typing import Any, List, Optional
+
+from eth_abi.exceptions import DecodingError, InsufficientDataBytes
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.exceptions import (
+    BadFunctionCallOutput,
+    ContractLogicError,
+)
+
+from credmark.cmf.types import Address, Contract
+
+from models.tmp_abi_lookup import MULTICALL2_ADDRESS
+from models.utils.abi import get_abi_json
+
+# Keep one aggregated eth_call well below the node's gas cap for eth_call.
+MULTICALL_BATCH_SIZE = 500
+
+
+def _decode_result(context, func, success: bool, data: bytes) -> Optional[Any]:
+    if not success or len(data) == 0:
+        return None
+
+    output_types = get_abi_output_types(func.abi)
+    try:
+        values = context.web3.codec.decode_abi(output_types, data)
+    except (DecodingError, InsufficientDataBytes):
+        return None
+    values = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, values)
+    if len(values) == 1:
+        return values[0]
+    return list(values)
+
+
+def _call_one_by_one(funcs) -> List[Optional[Any]]:
+    results = []
+    for func in funcs:
+        try:
+            results.append(func.call())
+        except (BadFunctionCallOutput, ContractLogicError, ValueError):
+            results.append(None)
+    return results
+
+
+def multicall(context, funcs, batch_size: int = MULTICALL_BATCH_SIZE) -> List[Optional[Any]]:
+    """
+    Run a list of bound contract functions, e.g. `contract.functions.getPool(a, b, fee)`,
+    as aggregated eth_call(s) to the Multicall2 contract at the context's block.
+
+    Returns the decoded values in the order of the input, same as calling `.call()`
+    on each function, with None for the calls that reverted or returned no data.
+
+    Falls back to calling the functions one by one when Multicall2 is not available
+    on the chain or not deployed yet at the block.
+    """
+    funcs = list(funcs)
+    if len(funcs) == 0:
+        return []
+
+    multicall_address = MULTICALL2_ADDRESS.get(context.chain_id)
+    if multicall_address is None:
+        return _call_one_by_one(funcs)
+
+    multicall_contract = Contract(address=Address(multicall_address).checksum,
+                                  abi=get_abi_json('MULTICALL2_ABI'))
+
+    results = []
+    for start in range(0, len(funcs), batch_size):
+        batch = funcs[start:start+batch_size]
+        calls = [(func.address, func._encode_transaction_data())  # pylint:disable=protected-access
+                 for func in batch]
+        try:
+            batch_results = multicall_contract.functions.tryAggregate(False, calls).call()
+        except (BadFunctionCallOutput, ContractLogicError, ValueError):
+            # Before Multicall2 deployment (block 12336033 on mainnet)
+            return _call_one_by_one(funcs)
+
+        results.extend(_decode_result(context, func, success, data)
+                       for func, (success, data) in zip(batch, batch_results))
+
+    return results
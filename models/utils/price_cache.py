@@ -0,0 +1,98 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Tuple, Union
+
+from credmark.cmf.types import Address, Price, Token
+
+from models.credmark.tokens.price import price_model_version
+from models.dtos.price import PriceCacheStats
+
+
+class PriceCache:
+    """
+    Process-wide memo of price models' outputs,
+    keyed by (chain_id, block_number, token address, price slug, price model version).
+
+    A price at a past block does not change, so one price is only computed
+    once per block in a process. A price without value, e.g. of a token without
+    pools at the block, is not kept. Entries are evicted least-recently-used
+    beyond `maxsize`.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = Lock()
+
+    def get_price(self,
+                  context,
+                  slug: str,
+                  token: Union[Token, dict],
+                  block_number: Union[int, None] = None,
+                  version: Optional[str] = None) -> Price:
+        """
+        Output of the price model at the block, the context's block by default.
+        version None runs the latest version of the model; its key is the version
+        of price_model_version when the model is listed there.
+        """
+        if isinstance(token, dict):
+            token = Token(**token)
+
+        block = context.block_number if block_number is None else block_number
+        key_version = version if version is not None else price_model_version(slug)
+        key = (context.chain_id, int(block), Address(token.address), slug, key_version)
+
+        with self._lock:
+            price = self._cache.get(key)
+            if price is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return price
+
+        price = context.run_model(slug,
+                                  input=token,
+                                  block_number=block_number,
+                                  return_type=Price,
+                                  version=version)
+
+        with self._lock:
+            self.misses += 1
+            if price.price is None:
+                return price
+            self._cache[key] = price
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return price
+
+    def counters(self) -> Tuple[int, int]:
+        """
+        (hits, misses) so far, to pass to run_stats at the end of a model run
+        """
+        with self._lock:
+            return self.hits, self.misses
+
+    def run_stats(self, start: Tuple[int, int]) -> PriceCacheStats:
+        """
+        Hits and misses since the counters were taken at the start of a model run
+        """
+        hits, misses = self.counters()
+        return PriceCacheStats(hits=hits - start[0], misses=misses - start[1])
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'size': len(self._cache),
+                    'maxsize': self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+PRICE_CACHE = PriceCache()
@@ -0,0 +1,156 @@
+import os
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from credmark.cmf.model.errors import ModelRunError
+from credmark.cmf.types import Price
+
+from models.credmark.tokens.price import price_model_version
+from models.utils.local_store import local_store_root, read_parquet, write_parquet
+
+PRICE_SCHEMA = pa.schema([('block_number', pa.int64()),
+                          ('price', pa.float64()),
+                          ('src', pa.string())])
+
+
+class PriceStore:
+    """
+    On-disk store of token prices at past blocks, one Parquet file per
+    (chain_id, price model slug, token address) with the columns
+    block_number, price and src, sorted by block_number, and the version of the
+    price model in the file metadata.
+
+    The price of a token at a past block does not change, so a price is computed
+    once and read back from the memory-mapped file afterwards. The prices stored by
+    another version of the price model are discarded. Files are replaced atomically,
+    so readers in other processes see either the old or the new file.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        if root is None:
+            root = local_store_root()
+        self.root = root
+        self._lock = Lock()
+
+    def _path(self, chain_id: int, price_model: str, token_address: str) -> str:
+        return os.path.join(self.root, 'prices', str(chain_id), price_model,
+                            f'{str(token_address).lower()}.parquet')
+
+    @staticmethod
+    def _read(path: str, version: str) -> Optional[pa.Table]:
+        table = read_parquet(path)
+        if table is None or table.schema.metadata is None:
+            return None
+        if table.schema.metadata.get(b'price_model_version') != version.encode():
+            return None
+        return table
+
+    def get_prices(self,
+                   chain_id: int,
+                   price_model: str,
+                   version: str,
+                   token_address: str,
+                   block_numbers: Iterable[int]) -> Dict[int, Tuple[float, str]]:
+        """
+        Stored (price, src) by block number, for the block numbers found in the store
+        and computed by the version of the price model.
+        """
+        table = self._read(self._path(chain_id, price_model, token_address), version)
+        if table is None:
+            return {}
+
+        wanted = pa.array(sorted(set(int(b) for b in block_numbers)), type=pa.int64())
+        rows = table.filter(pc.is_in(table.column('block_number'), value_set=wanted))
+        return {block_number: (price, src)
+                for block_number, price, src in zip(rows.column('block_number').to_pylist(),
+                                                    rows.column('price').to_pylist(),
+                                                    rows.column('src').to_pylist())}
+
+    def put_prices(self,
+                   chain_id: int,
+                   price_model: str,
+                   version: str,
+                   token_address: str,
+                   prices: Dict[int, Tuple[float, str]]):
+        """
+        Add (price, src) by block number to the store. Stored blocks of the same
+        version of the price model are kept. The file is not written again when all
+        the blocks are stored already.
+        """
+        if len(prices) == 0:
+            return
+
+        path = self._path(chain_id, price_model, token_address)
+        with self._lock:
+            table = self._read(path, version)
+            rows = {}
+            if table is not None:
+                rows = dict(zip(table.column('block_number').to_pylist(),
+                                zip(table.column('price').to_pylist(),
+                                    table.column('src').to_pylist())))
+            new_rows = {int(b): (float(price), src) for b, (price, src) in prices.items()
+                        if int(b) not in rows}
+            if len(new_rows) == 0:
+                return
+            rows.update(new_rows)
+
+            block_numbers = sorted(rows)
+            new_table = pa.table({'block_number': block_numbers,
+                                  'price': [rows[b][0] for b in block_numbers],
+                                  'src': [rows[b][1] for b in block_numbers]},
+                                 schema=PRICE_SCHEMA.with_metadata(
+                                     {'price_model_version': version}))
+            write_parquet(new_table, path)
+
+
+PRICE_STORE = PriceStore()
+
+
+def get_historical_prices(context,
+                          price_model: str,
+                          token,
+                          block_numbers: List[int],
+                          store: PriceStore = PRICE_STORE) -> Tuple[List[float], Optional[str]]:
+    """
+    Prices of the token at the blocks, and the price source at the last block.
+    Prices found in the local price store are read from it. The price model
+    only runs at the missing blocks, and those prices are added to the store.
+    The store is not used for price models without a known version.
+    """
+    if len(block_numbers) == 0:
+        return [], None
+
+    chain_id = context.chain_id
+    version = price_model_version(price_model)
+    stored = {}
+    if version is not None:
+        stored = store.get_prices(chain_id, price_model, version, token.address, block_numbers)
+
+    new_prices = {}
+    missing = []
+    for block_number in block_numbers:
+        if block_number in stored or block_number in new_prices:
+            continue
+        price = context.run_model(price_model,
+                                  input=token,
+                                  return_type=Price,
+                                  block_number=block_number)
+        if price.price is None:
+            missing.append(block_number)
+        else:
+            new_prices[block_number] = (price.price, price.src)
+
+    if version is not None:
+        store.put_prices(chain_id, price_model, version, token.address, new_prices)
+
+    if len(missing) > 0:
+        raise ModelRunError(
+            'Received None output for token price.'
+            'Check the series '
+            f'{[(None, block_number) for block_number in missing]}')
+
+    stored.update(new_prices)
+    return ([stored[block_number][0] for block_number in block_numbers],
+            stored[block_numbers[-1]][1])
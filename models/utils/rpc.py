@@ -0,0 +1,71 @@
+import json
+import logging
+from typing import List, Optional
+
+from hexbytes import HexBytes
+from requests.exceptions import RequestException
+from web3._utils.request import make_post_request
+
+# Keep one batched JSON-RPC request below the node's batch limit.
+RPC_BATCH_SIZE = 100
+
+logger = logging.getLogger(__name__)
+
+
+def _post_batch(provider, requests: List[dict]) -> Optional[List[dict]]:
+    """
+    Send a batch of JSON-RPC requests to a HTTP provider and return the responses
+    in the order of the requests, or None if the provider does not answer all of them.
+    """
+    endpoint_uri = getattr(provider, 'endpoint_uri', None)
+    if endpoint_uri is None:
+        return None
+
+    try:
+        response = make_post_request(str(endpoint_uri),
+                                     json.dumps(requests),
+                                     **provider.get_request_kwargs())
+        responses = json.loads(response)
+    except (RequestException, ValueError) as err:
+        logger.warning(f'Batched JSON-RPC request to {endpoint_uri} failed, '
+                       f'sending the requests one by one: {err}')
+        return None
+
+    if not isinstance(responses, list):
+        logger.warning(f'{endpoint_uri} does not take batched JSON-RPC requests, '
+                       'sending the requests one by one')
+        return None
+
+    by_id = {resp.get('id'): resp for resp in responses if isinstance(resp, dict)}
+    if any(req['id'] not in by_id or 'result' not in by_id[req['id']] for req in requests):
+        logger.warning(f'Incomplete batched JSON-RPC response from {endpoint_uri}, '
+                       'sending the requests one by one')
+        return None
+    return [by_id[req['id']] for req in requests]
+
+
+def batch_get_storage_at(context, addresses: List[str], slot: str) -> List[HexBytes]:
+    """
+    Storage value at the slot for each address at the context's block, same as
+    `context.web3.eth.get_storage_at(address, slot)`, fetched with batched
+    eth_getStorageAt requests.
+
+    Falls back to one request per address when the provider does not take batches.
+    """
+    block = hex(int(context.block_number))
+
+    results = []
+    for start in range(0, len(addresses), RPC_BATCH_SIZE):
+        batch = addresses[start:start+RPC_BATCH_SIZE]
+        requests = [{'jsonrpc': '2.0',
+                     'id': n,
+                     'method': 'eth_getStorageAt',
+                     'params': [address, slot, block]}
+                    for n, address in enumerate(batch)]
+
+        responses = _post_batch(context.web3.provider, requests)
+        if responses is None:
+            results.extend(context.web3.eth.get_storage_at(address, slot) for address in batch)
+        else:
+            results.extend(HexBytes(resp['result']) for resp in responses)
+    return results
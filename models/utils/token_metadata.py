@@ -0,0 +1,187 @@
+import os
+from threading import Lock
+from typing import Dict, List, Optional
+
+from credmark.cmf.model.errors import ModelDataError
+from credmark.cmf.types import Address, Token
+
+from models.utils.abi import get_contract_factory
+from models.utils.local_store import local_store_root, read_json, write_json
+from models.utils.multicall import multicall
+
+# Placeholder address of the native token, e.g. ETH in Curve pools
+NATIVE_TOKEN_ADDRESS = '0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee'
+
+# Tokens whose metadata is not read from the chain as ERC20 strings
+KNOWN_TOKEN_METADATA = {
+    NATIVE_TOKEN_ADDRESS: {'symbol': 'eeeETH', 'name': 'eeeETH', 'decimals': 18},
+    # MKR and SAI return bytes32 for symbol and name
+    '0x9f8f72aa9304c8b593d555f12ef6589cc3a579a2': {'symbol': 'MKR', 'name': 'Maker',
+                                                   'decimals': 18},
+    '0x89d24a6b4ccb1b6faa2625fe562bdd9a23260359': {'symbol': 'SAI', 'name': 'Dai Stablecoin v1.0',
+                                                   'decimals': 18},
+}
+
+TOKEN_METADATA_FIELDS = ('symbol', 'name', 'decimals')
+BYTES32_FIELDS = ('symbol', 'name')
+
+
+def _bytes32_to_str(value) -> Optional[str]:
+    if value is None:
+        return None
+    text = bytes(value).rstrip(b'\x00').decode('utf-8', errors='ignore')
+    return text if text else None
+
+
+class TokenMetadataCache:
+    """
+    Process-wide cache of ERC20 symbol, name and decimals by (chain_id, address),
+    backed by one JSON file per chain in the local store.
+
+    Token metadata does not change, so the tokens missing from the cache are read
+    once, in one multicall for a list of addresses, and kept. Symbols and names
+    returned as bytes32 are decoded, and the ETH placeholder address has fixed metadata.
+
+    Only complete metadata is kept. A token with a field not read, e.g. at a block
+    before its deployment or after a failed call, is read again on the next lookup.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        if root is None:
+            root = local_store_root()
+        self.root = root
+        self._metadata = {}
+        self._loaded_chains = set()
+        self._lock = Lock()
+
+    def _path(self, chain_id: int) -> str:
+        return os.path.join(self.root, 'token_metadata', f'{chain_id}.json')
+
+    def _load(self, chain_id: int):
+        # Called with the lock held
+        if chain_id in self._loaded_chains:
+            return
+        stored = read_json(self._path(chain_id)) or {}
+        for address, metadata in stored.items():
+            if all(metadata.get(field) is not None for field in TOKEN_METADATA_FIELDS):
+                self._metadata.setdefault((chain_id, address), metadata)
+        self._loaded_chains.add(chain_id)
+
+    def _fetch(self, context, addresses: List[str]) -> Dict[tuple, Dict[str, Optional[object]]]:
+        """
+        Metadata by key of the addresses, with the ones missing from the cache read in
+        one multicall. The complete ones are added to the cache.
+        """
+        chain_id = context.chain_id
+        keys = [(chain_id, str(Address(address))) for address in addresses]
+
+        with self._lock:
+            self._load(chain_id)
+            found = {key: self._metadata[key] for key in keys if key in self._metadata}
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+
+        if len(missing) == 0:
+            return found
+
+        read = dict(zip(missing,
+                        self._read(context, [Address(address) for _chain_id, address in missing])))
+        found.update(read)
+
+        complete = {key: metadata for key, metadata in read.items()
+                    if all(metadata[field] is not None for field in TOKEN_METADATA_FIELDS)}
+        if len(complete) > 0:
+            with self._lock:
+                self._metadata.update(complete)
+                stored = read_json(self._path(chain_id)) or {}
+                stored.update({address: metadata
+                               for (_chain_id, address), metadata in complete.items()})
+                write_json(stored, self._path(chain_id))
+        return found
+
+    def prefetch(self, context, addresses: List[str]):
+        """
+        Read the metadata of the addresses missing from the cache, in one multicall
+        """
+        self._fetch(context, addresses)
+
+    def get(self,
+            context,
+            addresses: List[str],
+            require_decimals: bool = True) -> List[Dict[str, Optional[object]]]:
+        """
+        {'symbol': ..., 'name': ..., 'decimals': ...} of each address, in order.
+        A field is None when the token does not have it. Raises ModelDataError for a token
+        without decimals, unless require_decimals is False.
+        """
+        found = self._fetch(context, addresses)
+
+        chain_id = context.chain_id
+        metadata = [dict(found[(chain_id, str(Address(address)))]) for address in addresses]
+        if require_decimals:
+            for address, token_metadata in zip(addresses, metadata):
+                if token_metadata['decimals'] is None:
+                    raise ModelDataError(f'No decimals for token {address}')
+        return metadata
+
+    @staticmethod
+    def _read(context, addresses: List[Address]) -> List[Dict[str, Optional[object]]]:
+        metadata = [dict(KNOWN_TOKEN_METADATA[str(address)])
+                    if str(address) in KNOWN_TOKEN_METADATA else None
+                    for address in addresses]
+        unknown = [n for n, token_metadata in enumerate(metadata) if token_metadata is None]
+
+        erc20 = get_contract_factory(context.web3, 'ERC_20_ABI')
+        values = multicall(context,
+                           [getattr(erc20(address=addresses[n].checksum).functions, field)()
+                            for n in unknown
+                            for field in TOKEN_METADATA_FIELDS])
+
+        n_fields = len(TOKEN_METADATA_FIELDS)
+        for m, n in enumerate(unknown):
+            metadata[n] = dict(zip(TOKEN_METADATA_FIELDS, values[m * n_fields:(m + 1) * n_fields]))
+
+        # Symbols and names which are not strings, e.g. bytes32
+        erc20_bytes32 = get_contract_factory(context.web3, 'ERC_20_BYTES32_ABI')
+        retries = [(n, field) for n in unknown
+                   for field in BYTES32_FIELDS if metadata[n][field] is None]
+        retry_values = multicall(context,
+                                 [getattr(erc20_bytes32(address=addresses[n].checksum).functions,
+                                          field)()
+                                  for n, field in retries])
+        for (n, field), value in zip(retries, retry_values):
+            metadata[n][field] = _bytes32_to_str(value)
+
+        for n in unknown:
+            for field in TOKEN_METADATA_FIELDS:
+                if metadata[n][field] is None:
+                    # Otherwise from the token metadata of the framework
+                    try:
+                        metadata[n][field] = getattr(Token(address=addresses[n].checksum), field)
+                    except ModelDataError:
+                        pass
+        return metadata
+
+    def clear(self):
+        with self._lock:
+            self._metadata.clear()
+            self._loaded_chains.clear()
+
+
+TOKEN_METADATA = TokenMetadataCache()
+
+
+def get_token_metadata(context,
+                       addresses: List[str],
+                       require_decimals: bool = True) -> List[Dict[str, Optional[object]]]:
+    return TOKEN_METADATA.get(context, addresses, require_decimals)
+
+
+def prefetch_token_metadata(context, addresses: List[str]):
+    TOKEN_METADATA.prefetch(context, addresses)
+
+
+def scale_amount(metadata: Dict[str, Optional[object]], amount) -> float:
+    """
+    Amount in the token's unit, e.g. scale_amount(get_token_metadata(context, [addr])[0], raw)
+    """
+    return amount / (10 ** metadata['decimals'])
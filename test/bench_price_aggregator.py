@@ -0,0 +1,73 @@
+"""
+Micro-benchmark of price.pool-aggregator's per-call overhead,
+DataFrame construction (before) vs. float64 columns (after).
+
+Run from the repository root:
+    python test/bench_price_aggregator.py
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# pylint: disable=wrong-import-position
+from models.credmark.tokens.price import PoolPriceAggregator
+from models.dtos.price import PoolPriceAggregatorInput
+from models.tmp_abi_lookup import USDC_ADDRESS, WETH9_ADDRESS
+
+
+def make_input(n_pools: int) -> PoolPriceAggregatorInput:
+    rng = np.random.default_rng(n_pools)
+    infos = [{'src': 'uniswap-v3.get-pool-price-info',
+              'price': float(price),
+              'liquidity': float(liquidity),
+              'weth_multiplier': 1.0,
+              'inverse': False,
+              'token0_address': USDC_ADDRESS,
+              'token1_address': WETH9_ADDRESS,
+              'token0_symbol': 'USDC',
+              'token1_symbol': 'WETH',
+              'token0_decimals': 6,
+              'token1_decimals': 18,
+              'pool_address': WETH9_ADDRESS}
+             for price, liquidity in zip(rng.normal(3000, 10, n_pools),
+                                         rng.uniform(1e3, 1e7, n_pools))]
+    return PoolPriceAggregatorInput(token={'address': WETH9_ADDRESS},
+                                    pool_price_infos=infos,
+                                    price_src='bench')
+
+
+def aggregate_with_dataframe(input: PoolPriceAggregatorInput) -> float:
+    df = pd.DataFrame(input.dict()['pool_price_infos'])
+    if len(input.pool_price_infos) == 1:
+        return input.pool_price_infos[0].price
+    product_of_price_liquidity = (df.price * df.liquidity ** input.weight_power).sum()
+    sum_of_liquidity = (df.liquidity ** input.weight_power).sum()
+    return product_of_price_liquidity / sum_of_liquidity
+
+
+def aggregate_with_columns(input: PoolPriceAggregatorInput) -> float:
+    prices, liquidity = PoolPriceAggregator.pool_columns(input.pool_price_infos)
+    return PoolPriceAggregator.weighted_price(prices, liquidity, input.weight_power)
+
+
+def main(number: int = 1000):
+    print(f'{"pools":>6} {"before (us)":>12} {"after (us)":>12} {"speedup":>8}')
+    for n_pools in [1, 10, 100]:
+        agg_input = make_input(n_pools)
+        assert np.isclose(aggregate_with_dataframe(agg_input), aggregate_with_columns(agg_input))
+
+        before = min(timeit.repeat(lambda: aggregate_with_dataframe(agg_input),
+                                   number=number, repeat=5)) / number * 1e6
+        after = min(timeit.repeat(lambda: aggregate_with_columns(agg_input),
+                                  number=number, repeat=5)) / number * 1e6
+        print(f'{n_pools:>6} {before:>12.1f} {after:>12.1f} {before / after:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Startup benchmark of the model package: import time and memory allocated (tracemalloc)
+by importing models.tmp_abi_lookup and, when the framework is installed, all model modules.
+Each measurement runs in a fresh interpreter.
+
+Run from the repository root:
+    python test/bench_startup.py [--ref <git revision to compare tmp_abi_lookup with>]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+MEASURE = '''
+import json, sys, time, tracemalloc
+sys.path.insert(0, {path!r})
+tracemalloc.start()
+t0 = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - t0
+current, peak = tracemalloc.get_traced_memory()
+print(json.dumps({{'seconds': elapsed, 'current': current, 'peak': peak}}))
+'''
+
+LAZY_IMPORT = 'import models.tmp_abi_lookup'
+
+EAGER_IMPORT = '''
+import models.tmp_abi_lookup as lookup
+from models.utils.abi import abi_names
+for name in abi_names():
+    getattr(lookup, name)
+'''
+
+ALL_MODELS_IMPORT = '''
+import importlib, os
+for root, _dirs, files in os.walk('models'):
+    for f in sorted(files):
+        if f.endswith('.py') and not f.startswith('test_'):
+            module = os.path.join(root, f)[:-3].replace(os.sep, '.')
+            importlib.import_module(module)
+'''
+
+
+def measure(code: str, path: str = REPO_ROOT) -> dict:
+    result = subprocess.run([sys.executable, '-c', MEASURE.format(path=path, code=code)],
+                            cwd=path, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        return {'error': result.stderr.strip().splitlines()[-1]}
+    return json.loads(result.stdout)
+
+
+def measure_ref(ref: str) -> dict:
+    source = subprocess.run(['git', 'show', f'{ref}:models/tmp_abi_lookup.py'],
+                            cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.makedirs(os.path.join(tmp_dir, 'models'))
+        with open(os.path.join(tmp_dir, 'models', 'tmp_abi_lookup.py'), 'w') as f:
+            f.write(source)
+        return measure(LAZY_IMPORT, tmp_dir)
+
+
+def report(name: str, result: dict):
+    if 'error' in result:
+        print(f'{name:<40} skipped: {result["error"]}')
+    else:
+        print(f'{name:<40} {result["seconds"] * 1e3:>10.2f} ms '
+              f'{result["current"] / 1024:>10.1f} KiB {result["peak"] / 1024:>10.1f} KiB')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--ref', help='git revision of tmp_abi_lookup.py to compare with')
+    args = parser.parse_args()
+
+    print(f'{"":<40} {"time":>13} {"allocated":>14} {"peak":>14}')
+    if args.ref:
+        report(f'import tmp_abi_lookup @ {args.ref}', measure_ref(args.ref))
+    report('import tmp_abi_lookup', measure(LAZY_IMPORT))
+    report('import tmp_abi_lookup + load all ABIs', measure(EAGER_IMPORT))
+    report('import all model modules', measure(ALL_MODELS_IMPORT))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,7 @@ test_model 0 aave-v2.token-asset '{"address":"0xA0b86991c6218b36c1d19D4a2e9Eb0cE
 test_model 0 aave-v2.token-asset '{"symbol":"USDC"}'
 test_model 0 aave-v2.token-asset '{"symbol":"DAI"}'
 test_model 0 aave-v2.lending-pool-assets '{}' aave-v2.token-asset
+test_model 0 aave-v2.reserves-snapshot '{}' aave-v2.get-lending-pool,aave-v2.get-lending-pool-provider
 # 0xE41d2489571d322189246DaFA5ebDe1F4699F498: ZRX
 test_model 0 aave-v2.token-liability '{"address":"0xE41d2489571d322189246DaFA5ebDe1F4699F498"}'
 test_model 0 aave-v2.token-liability '{"symbol":"USDC"}'
@@ -23,6 +23,9 @@ test_model 0 token.price '{"symbol": "MKR"}' ${token_price_deps}
 test_model 0 token.price '{"address": "0xd46ba6d942050d489dbd938a2c909a5d5039a161"}' ${token_price_deps}
 # RenFil token: 0xD5147bc8e386d91Cc5DBE72099DAC6C9b99276F5
 test_model 0 token.price '{"address": "0xD5147bc8e386d91Cc5DBE72099DAC6C9b99276F5"}' ${token_price_deps}
+test_model 0 token.price-batch '{"tokens": [{"symbol": "WETH"}, {"symbol": "AAVE"}, {"symbol": "USDC"}, {"symbol": "MKR"}]}'
+test_model 0 token.price-batch-check '{"tokens": [{"symbol": "WETH"}, {"symbol": "AAVE"}, {"symbol": "USDC"}, {"symbol": "MKR"}]}' token.price-batch-check,token.price-batch,${token_price_deps}
+test_model 0 token.price-batch-stored '{"tokens": [{"symbol": "WETH"}, {"symbol": "AAVE"}], "price_model": "token.price"}' token.price-batch-stored,${token_price_deps}
 
 test_model 0 token.holders '{"symbol": "CMK"}'
 test_model 0 token.swap-pools '{"symbol":"CMK"}'
@@ -199,5 +199,5 @@ echo_cmd () {
     fi
 }
 
-token_price_deps='token.price,token.price,uniswap-v2.get-weighted-price,uniswap-v3.get-weighted-price,sushiswap.get-weighted-price,uniswap-v3.get-pool-info'
+token_price_deps='token.price,token.price,uniswap-v2.get-weighted-price,uniswap-v3.get-weighted-price,sushiswap.get-weighted-price,uniswap-v3.get-pool-info,token.price-batch'
 var_deps=finance.var-engine,finance.var-reference,token.price,finance.get-one,${token_price_deps}
@@ -5,6 +5,7 @@ echo_cmd ""
 test_model 0 curve-fi.all-pools '{}' curve-fi.get-registry,curve-fi.get-provider
 
 test_model 0 curve-fi.all-pools-info '{}' __all__
+test_model 0 curve-fi.all-pools-info-fast '{}' curve-fi.get-registry,curve-fi.get-provider,curve-fi.pool-info
 
 # Curve.fi Factory USD Metapool: Alchemix USD: 0x43b4FdFD4Ff969587185cDB6f0BD875c5Fc83f8c
 test_model 0 curve-fi.pool-info '{"address":"0x43b4fdfd4ff969587185cdb6f0bd875c5fc83f8c"}'
@@ -14,11 +14,30 @@ test_model 0 finance.var-portfolio-historical \
   ]}}'
 
 test_model 0 finance.var-portfolio-historical '{"window": "20 days", "interval": 1, "confidences": [0,0.01,0.05,1], "portfolio": {"positions": [{"amount": "0.5", "asset": {"symbol": "WBTC"}}, {"amount": "0.5", "asset": {"symbol": "WETH"}}]}}'
-test_model 0 finance.var-aave '{"window": "30 days", "interval": 3, "confidences": [0.01,0.05]}' finance.var-portfolio-historical
-test_model 0 finance.var-compound '{"window": "30 days", "interval": 3, "confidences": [0.01,0.05]}' finance.var-portfolio-historical
+test_model 0 finance.var-aave '{"window": "30 days", "interval": 3, "confidences": [0.01,0.05]}' finance.var-portfolio-historical,token.price-batch-stored,aave-v2.reserves-snapshot
+test_model 0 finance.var-compound '{"window": "30 days", "interval": 3, "confidences": [0.01,0.05]}' finance.var-portfolio-historical,token.price-batch-stored
+test_model 0 finance.var-rolling '{"date_range": ["2022-02-01", "2022-02-10"], "window": "20 days", "interval": 1, "confidences": [0.01,0.05], "portfolio": {"positions": [{"amount": "0.5", "asset": {"symbol": "WBTC"}}, {"amount": "0.5", "asset": {"symbol": "WETH"}}]}}'
+
+test_model 0 finance.var-engine-montecarlo \
+'{"interval": 1, "confidences": [0.01,0.05], "num_scenarios": 20000, "chunk_size": 5000, "seed": 1,
+  "portfolio": {"positions":
+  [{"amount": "0.5", "asset": {"address": "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599"}},
+   {"amount": "10", "asset": {"address": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"}}]},
+  "priceLists": [
+   {"prices": [19500, 19300, 19800, 20100, 19900, 20500, 20300, 20800],
+    "tokenAddress": "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599", "src": "test"},
+   {"prices": [1310, 1295, 1340, 1360, 1330, 1390, 1370, 1400],
+    "tokenAddress": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", "src": "test"}]}'
+test_model 0 finance.var-engine-montecarlo \
+'{"interval": 1, "confidences": [0.01,0.05], "method": "filtered-historical", "ewma_lambda": 0.94,
+  "portfolio": {"positions":
+  [{"amount": "10", "asset": {"address": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"}}]},
+  "priceLists": [
+   {"prices": [1310, 1295, 1340, 1360, 1330, 1390, 1370, 1400],
+    "tokenAddress": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", "src": "test"}]}'
 
 test_model 0 finance.example-var-contract '{"window": "30 days", "interval": 3, "confidences": [0.01,0.05]}' finance.example-var-contract,finance.example-historical-price,finance.var-engine-historical
 test_model 0 finance.lcr '{"address": "0xe78388b4ce79068e89bf8aa7f218ef6b9ab0e9d0", "cashflow_shock": 1e10}'
-test_model 0 finance.min-risk-rate '{}' compound-v2.get-pool-info,compound-v2.all-pools-info
+test_model 0 finance.min-risk-rate '{}' compound-v2.get-pool-info,compound-v2.all-pools-info,aave-v2.reserves-snapshot
 test_model 0 finance.sharpe-ratio-token '{"token": {"address": "0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9"}, "window": "10 minute", "risk_free_rate": 0.02}'
 test_model 0 finance.sharpe-ratio-token '{"token": {"address": "0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9"}, "window": "360 days", "risk_free_rate": 0.02}'
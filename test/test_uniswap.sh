@@ -18,6 +18,11 @@ test_model 0 uniswap-v2.get-weighted-price '{"symbol": "MKR"}'
 test_model 0 uniswap-v2.get-pools '{"address": "0xD533a949740bb3306d119CC777fa900bA034cd52"}'
 # Uniswap ETH/CRV LP (UNI-V2)
 test_model 0 uniswap-v2.pool-volume '{"address": "0x3da1313ae46132a397d90d95b1424a9a7e3e0fce"}'
+# Same pool 100 blocks earlier, reusing the per-block sums stored by the run above
+saved_block_number=${block_number}
+block_number='-b 14234804'
+test_model 0 uniswap-v2.pool-volume '{"address": "0x3da1313ae46132a397d90d95b1424a9a7e3e0fce"}'
+block_number=${saved_block_number}
 
 
 echo_cmd ""
@@ -31,5 +36,7 @@ test_model 0 uniswap-v3.get-weighted-price '{"symbol": "WETH"}' uniswap-v3.get-p
 test_model 0 uniswap-v3.get-weighted-price '{"symbol": "MKR"}' uniswap-v3.get-pool-info
 test_model 0 uniswap-v3.get-weighted-price '{"symbol": "CMK"}' uniswap-v3.get-pool-info
 test_model 0 uniswap-v3.get-pools '{"symbol": "MKR"}'
+test_model 0 uniswap-v3.get-pools '{"symbol": "USDC"}'
 # WETH/CMK pool: 0x59e1f901b5c33ff6fae15b61684ebf17cca7b9b3
 test_model 0 uniswap-v3.get-pool-info '{"address": "0x59e1f901b5c33ff6fae15b61684ebf17cca7b9b3"}'
+test_model 0 uniswap-v3.get-pool-info-batch '{"contracts": [{"address": "0x59e1f901b5c33ff6fae15b61684ebf17cca7b9b3"}, {"address": "0x8ad599c3a0ff1de082011efddc58f1908eb6e6d8"}]}'